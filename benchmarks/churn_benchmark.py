@@ -0,0 +1,87 @@
+"""
+Churn Benchmark of Node removal and compaction on a Node Graph.
+
+Run from the repository root:
+    python benchmarks/churn_benchmark.py [document_count]
+"""
+
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+sys.path.append('./src')
+
+# pylint: disable=wrong-import-position
+from graphs import NodeGraph
+from nodes import DocumentContext, BaseNode, CodeNode
+
+
+def build_graph(document_count: int) -> tuple[NodeGraph, list[list[BaseNode]]]:
+    """
+    Creates a Graph of Documents, each an Encounter like Node related to its own Nodes and to
+    shared Code Nodes.
+    :param document_count: Number of Documents
+    :return: Node Graph and the Nodes of every Document
+    """
+
+    context = DocumentContext(doc_id=1, doc_source_id='bench', etl_dg_code=0,
+                              etl_load_datetime=datetime.now(),
+                              etl_src_inc_datetime=datetime.now(), etl_src_sys_id=1)
+    codes = [CodeNode(context=context, canonical_id=f"1.2.3:{x}", code=str(x), code_system='1.2.3',
+                      code_system_name='', code_system_version='', display_name='')
+             for x in range(1000)]
+    generator = random.Random(42)
+    graph = NodeGraph()
+    documents = []
+    for index in range(document_count):
+        root = BaseNode(context=context, canonical_id=f"urn:document:{index}")
+        children = [BaseNode(context=context, canonical_id=f"urn:document:{index}:{x}")
+                    for x in range(10)]
+        for child in children:
+            graph.add_vertex(root, child, 'component')
+            graph.add_vertex(child, generator.choice(codes), 'code')
+        documents.append([root, *children])
+    return graph, documents
+
+
+def measure(label: str, action) -> None:
+    """
+    Reports the time and traced memory after an action.
+    :param label: Action name
+    :param action: Function to run
+    :return: None
+    """
+
+    started = time.perf_counter()
+    action()
+    seconds = time.perf_counter() - started
+    print(f"{label}: {seconds:.2f} s, {tracemalloc.get_traced_memory()[0] / 1024 / 1024:.1f} MiB")
+
+
+def main() -> None:
+    """
+    Removes half of the Documents one Node at a time and in bulk, then compacts.
+    """
+
+    document_count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    tracemalloc.start()
+
+    for mode in ('remove_node', 'remove_nodes'):
+        graph, documents = build_graph(document_count)
+        retracted = documents[::2]
+        print(f"{mode} nodes: {len(graph.nodes)} retracted documents: {len(retracted)}")
+        measure('  built', lambda: None)
+        if mode == 'remove_node':
+            measure('  removed', lambda: [graph.remove_node(y) for x in retracted for y in x])
+        else:
+            measure('  removed', lambda: [graph.remove_nodes(x) for x in retracted])
+        measure('  compacted', graph.compact)
+        del graph, documents, retracted
+
+    tracemalloc.stop()
+
+
+if __name__ == '__main__':
+    main()
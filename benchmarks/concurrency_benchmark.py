@@ -0,0 +1,89 @@
+"""
+Scaling Benchmark of threads adding the sections of Documents to one Concurrent Node Graph.
+
+Run from the repository root:
+    python benchmarks/concurrency_benchmark.py [section_count]
+
+With the GIL the threads take turns, so throughput measures the locking overhead. Free threaded
+builds of CPython 3.13+ run the threads in parallel.
+"""
+
+import sys
+import threading
+import time
+from datetime import datetime
+
+sys.path.append('./src')
+
+# pylint: disable=wrong-import-position
+from graphs import NodeGraph, ConcurrentNodeGraph
+from nodes import DocumentContext, BaseNode, CodeNode
+
+CONTEXT = DocumentContext(doc_id=1, doc_source_id='bench', etl_dg_code=0,
+                          etl_load_datetime=datetime.now(),
+                          etl_src_inc_datetime=datetime.now(), etl_src_sys_id=1)
+
+ENTRIES_PER_SECTION = 50
+
+
+def add_section(graph: NodeGraph, section: int) -> None:
+    """
+    Adds a section like Node related to its entries, which share Code Nodes with other sections.
+    :param graph: Node Graph
+    :param section: Section number
+    :return: None
+    """
+
+    root = BaseNode(context=CONTEXT, canonical_id=f"urn:section:{section}")
+    for index in range(ENTRIES_PER_SECTION):
+        entry = BaseNode(context=CONTEXT, canonical_id=f"urn:section:{section}:{index}")
+        code = CodeNode(context=CONTEXT, canonical_id=f"1.2.3:{index}", code=str(index),
+                        code_system='1.2.3', code_system_name='', code_system_version='',
+                        display_name='')
+        graph.add_vertex(root, entry, 'component')
+        graph.add_vertex(entry, code, 'code')
+
+
+def run(graph: NodeGraph, section_count: int, thread_count: int) -> float:
+    """
+    Adds the sections with a number of threads, each taking every n-th section.
+    :param graph: Node Graph
+    :param section_count: Number of sections
+    :param thread_count: Number of threads
+    :return: Elapsed seconds
+    """
+
+    def work(offset: int) -> None:
+        for section in range(offset, section_count, thread_count):
+            add_section(graph, section)
+
+    threads = [threading.Thread(target=work, args=(x,)) for x in range(thread_count)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    """
+    Compares a single threaded Node Graph with a Concurrent Node Graph by thread count.
+    """
+
+    section_count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    edges = section_count * ENTRIES_PER_SECTION * 2
+    gil_enabled = getattr(sys, '_is_gil_enabled', lambda: True)()
+    print(f"sections: {section_count} edges: {edges} GIL enabled: {gil_enabled}")
+
+    seconds = run(NodeGraph(), section_count, 1)
+    print(f"NodeGraph 1 thread: {seconds:.2f} s, {edges / seconds:,.0f} edges/s")
+    for thread_count in (1, 2, 4, 8, 16):
+        graph = ConcurrentNodeGraph()
+        seconds = run(graph, section_count, thread_count)
+        print(f"ConcurrentNodeGraph {thread_count} threads: {seconds:.2f} s, "
+              f"{edges / seconds:,.0f} edges/s, {len(graph.nodes)} nodes")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+"""
+Traversal Benchmark comparing the Node Graph with its Frozen CSR snapshot.
+
+Run from the repository root:
+    python benchmarks/frozen_graph_benchmark.py [node_count]
+"""
+
+import random
+import sys
+import time
+import tracemalloc
+from collections import deque
+from datetime import datetime
+
+sys.path.append('./src')
+
+# pylint: disable=wrong-import-position
+from graphs import NodeGraph
+from nodes import DocumentContext, BaseNode
+
+
+def build_graph(node_count: int) -> NodeGraph:
+    """
+    Creates a random Graph with roughly four relationships per Node.
+    :param node_count: Number of Nodes
+    :return: Node Graph
+    """
+
+    context = DocumentContext(doc_id=1, doc_source_id='bench', etl_dg_code=0,
+                              etl_load_datetime=datetime.now(),
+                              etl_src_inc_datetime=datetime.now(), etl_src_sys_id=1)
+    nodes = [BaseNode(context=context, canonical_id=f"urn:bench:{x}") for x in range(node_count)]
+    generator = random.Random(42)
+    graph = NodeGraph()
+    for index, node in enumerate(nodes):
+        graph.add_node(node)
+        if index:
+            graph.add_vertex(nodes[generator.randrange(index)], node, 'component')
+        graph.add_vertex(node, nodes[generator.randrange(node_count)], 'code')
+    return graph
+
+
+def traverse_graph(graph: NodeGraph, canonical_id: str) -> int:
+    """
+    Breadth first traversal over the dictionary of sets.
+    :param graph: Node Graph
+    :param canonical_id: Starting Canonical ID
+    :return: Number of Nodes visited
+    """
+
+    visited = {canonical_id}
+    queue = deque([canonical_id])
+    while queue:
+        for related in graph.vertices.get(queue.popleft(), ()):
+            if related not in visited:
+                visited.add(related)
+                queue.append(related)
+    return len(visited) - 1
+
+
+def main() -> None:
+    """
+    Reports the traversal time and adjacency memory for both representations.
+    """
+
+    node_count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    graph = build_graph(node_count)
+
+    tracemalloc.start()
+    frozen = graph.freeze()
+    frozen_bytes = (frozen.offsets.buffer_info()[1] * frozen.offsets.itemsize
+                    + frozen.neighbors.buffer_info()[1] * frozen.neighbors.itemsize)
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    copied = {key: set(value) for key, value in graph.vertices.items()}
+    dict_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del copied
+
+    start = time.perf_counter()
+    dict_visited = traverse_graph(graph, 'urn:bench:0')
+    dict_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    frozen_visited = sum(1 for _ in frozen.traverse('urn:bench:0'))
+    frozen_seconds = time.perf_counter() - start
+
+    print(f"nodes: {node_count} visited: {dict_visited}/{frozen_visited}")
+    print(f"dict traversal: {dict_seconds:.3f}s adjacency bytes: {dict_bytes}")
+    print(f"csr traversal: {frozen_seconds:.3f}s adjacency bytes: {frozen_bytes}")
+
+
+if __name__ == '__main__':
+    main()
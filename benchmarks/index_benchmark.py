@@ -0,0 +1,99 @@
+"""
+Lookup Benchmark comparing linear scans of a Node Graph with its Secondary Indexes.
+
+Run from the repository root:
+    python benchmarks/index_benchmark.py [node_count]
+"""
+
+import dataclasses
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.append('./src')
+
+# pylint: disable=wrong-import-position
+from graphs import NodeGraph
+from nodes import DocumentContext, CodeNode, EncounterNode
+
+CODE_SYSTEMS = ['2.16.840.1.113883.6.96', '2.16.840.1.113883.6.1', '2.16.840.1.113883.6.90']
+
+
+def build_graph(node_count: int) -> NodeGraph:
+    """
+    Creates a Graph of Code and Encounter Nodes with the Indexes declared up front.
+    :param node_count: Number of Nodes
+    :return: Node Graph
+    """
+
+    context = DocumentContext(doc_id=1, doc_source_id='bench', etl_dg_code=0,
+                              etl_load_datetime=datetime.now(),
+                              etl_src_inc_datetime=datetime.now(), etl_src_sys_id=1)
+    generator = random.Random(42)
+    graph = NodeGraph()
+    graph.add_index('CodeNode', 'code_system', 'code')
+    graph.add_index('EncounterNode', 'encounter_start', ordered=True)
+    start = datetime(2000, 1, 1)
+    for index in range(node_count):
+        if index % 2:
+            code_system = CODE_SYSTEMS[index % 3]
+            graph.add_node(CodeNode(context=context, canonical_id=f"{code_system}:{index}",
+                                    code=str(index), code_system=code_system,
+                                    code_system_name='', code_system_version='',
+                                    display_name=''))
+        else:
+            encounter_start = start + timedelta(minutes=generator.randrange(10000000))
+            graph.add_node(EncounterNode(context=context, canonical_id=f"urn:bench:{index}",
+                                         status_code='completed', encounter_start=encounter_start,
+                                         encounter_end=encounter_start + timedelta(hours=1)))
+    return graph
+
+
+def main() -> None:
+    """
+    Reports the time of code and date range lookups with scans and Indexes, and of updating
+    and removing Nodes between lookups.
+    """
+
+    node_count = int(sys.argv[1]) if len(sys.argv) > 1 else 500000
+    started = time.perf_counter()
+    graph = build_graph(node_count)
+    build_seconds = time.perf_counter() - started
+
+    low, high = datetime(2010, 1, 1), datetime(2010, 2, 1)
+    lookups = {
+        'code scan': lambda: [x for x in graph.nodes.values() if isinstance(x, CodeNode)
+                              and x.code_system == CODE_SYSTEMS[1] and x.code == '7'],
+        'code index': lambda: graph.find_nodes('CodeNode', code_system=CODE_SYSTEMS[1], code='7'),
+        'range scan': lambda: [x for x in graph.nodes.values() if isinstance(x, EncounterNode)
+                               and low <= x.encounter_start < high],
+        'range index': lambda: graph.find_nodes_in_range('EncounterNode', 'encounter_start',
+                                                          low, high)
+    }
+
+    print(f"nodes: {node_count} build: {build_seconds:.2f} s")
+    graph.find_nodes_in_range('EncounterNode', 'encounter_start')
+    for name, lookup in lookups.items():
+        started = time.perf_counter()
+        result = lookup()
+        print(f"{name}: {(time.perf_counter() - started) * 1000:.3f} ms ({len(result)} nodes)")
+
+    encounters = graph.get_nodes_by_type('EncounterNode')[:1000]
+    started = time.perf_counter()
+    for encounter in encounters:
+        graph.add_node(dataclasses.replace(encounter, status_code='cancelled'))
+        graph.find_nodes_in_range('EncounterNode', 'encounter_start', low, high)
+    print(f"update: {(time.perf_counter() - started) * 1000 / len(encounters):.3f} ms "
+          f"per unchanged start")
+
+    started = time.perf_counter()
+    for encounter in encounters:
+        graph.remove_node(encounter)
+        graph.find_nodes_in_range('EncounterNode', 'encounter_start', low, high)
+    print(f"remove: {(time.perf_counter() - started) * 1000 / len(encounters):.3f} ms "
+          f"per node and lookup")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""
+Memory Benchmark of Graphs built with and without a shared String Pool.
+
+Run from the repository root:
+    python benchmarks/interning_benchmark.py
+"""
+
+import sys
+import tracemalloc
+
+from lxml import etree
+
+sys.path.append('./src')
+
+# pylint: disable=wrong-import-position
+from factories import NodeFactory
+from graphs import NodeGraph
+from interning import StringPool
+
+TEST_FILE = './tests/test_files/test-ccda.xml'
+NAMESPACES = {'v3': 'urn:hl7-org:v3'}
+DOCUMENTS = 50
+
+
+def build_graph(document: etree.ElementBase, string_pool: StringPool | None) -> NodeGraph:
+    """
+    Creates a Graph linking every coded element of repeated copies of the Document to its Code.
+    :param document: ClinicalDocument Element
+    :param string_pool: Optional String Pool shared by the Graph and the Factories
+    :return: Node Graph
+    """
+
+    graph = NodeGraph(string_pool=string_pool)
+    codes = [x for x in document.iter(etree.Element) if x.get('code') and x.get('codeSystem')]
+    for doc_id in range(DOCUMENTS):
+        factory = NodeFactory(NAMESPACES, doc_id=doc_id, terminology_cache=None,
+                              string_pool=string_pool)
+        previous = None
+        for element in codes:
+            node = factory.build_code_node(element)
+            graph.add_node(node)
+            if previous is not None:
+                graph.add_vertex(previous, node, 'next')
+            previous = node
+    return graph
+
+
+def measure(document: etree.ElementBase, string_pool: StringPool | None) -> int:
+    """
+    Measures the memory held by a Graph.
+    :param document: ClinicalDocument Element
+    :param string_pool: Optional String Pool
+    :return: Allocated Bytes
+    """
+
+    tracemalloc.start()
+    graph = build_graph(document, string_pool)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del graph
+    return size
+
+
+def main() -> None:
+    """
+    Reports the memory of the Graphs and the String Pool report.
+    """
+
+    document = etree.parse(TEST_FILE).getroot()
+    string_pool = StringPool()
+
+    unpooled = measure(document, None)
+    pooled = measure(document, string_pool)
+
+    print(f"documents: {DOCUMENTS}")
+    print(f"without pool: {unpooled / 1024:.0f} KiB")
+    print(f"with pool: {pooled / 1024:.0f} KiB ({1 - pooled / unpooled:.0%} less)")
+    print(f"pool: {string_pool.memory_report()}")
+
+
+if __name__ == '__main__':
+    main()
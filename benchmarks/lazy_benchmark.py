@@ -0,0 +1,71 @@
+"""
+Micro Benchmark of mapping the sample Document with regular and Lazy Nodes when only the
+Canonical IDs and types are read downstream.
+
+Run from the repository root:
+    python benchmarks/lazy_benchmark.py
+"""
+
+import sys
+import timeit
+
+from lxml import etree
+
+sys.path.append('./src')
+
+# pylint: disable=wrong-import-position
+from factories import NodeFactory
+
+TEST_FILE = './tests/test_files/test-ccda.xml'
+NAMESPACES = {'v3': 'urn:hl7-org:v3'}
+V3 = '{urn:hl7-org:v3}'
+
+
+def map_document(document: etree.ElementBase, factory: NodeFactory) -> list[tuple]:
+    """
+    Builds a Node for every id, coded, addr, name and telecom element and reads its
+    Canonical ID and type.
+    :param document: ClinicalDocument Element
+    :param factory: Node Factory
+    :return: List of Canonical ID and type
+    """
+
+    builders = {
+        f"{V3}id": factory.build_identifier_node,
+        f"{V3}addr": factory.build_address_node,
+        f"{V3}name": factory.build_name_node,
+        f"{V3}telecom": factory.build_contact_node
+    }
+    keys = []
+    for element in document.iter(etree.Element):
+        build = builders.get(element.tag)
+        if build is None and element.get('codeSystem'):
+            build = factory.build_code_node
+        node = build(element) if build is not None else None
+        if node is not None:
+            keys.append((node.canonical_id, type(node).__name__))
+    return keys
+
+
+def main() -> None:
+    """
+    Reports the mapping time per Document of regular and Lazy Nodes.
+    """
+
+    document = etree.parse(TEST_FILE).getroot()
+    repeat = 50
+
+    eager = NodeFactory(NAMESPACES, terminology_cache=None)
+    lazy = NodeFactory(NAMESPACES, terminology_cache=None, lazy=True)
+    assert map_document(document, eager) == map_document(document, lazy)
+
+    eager_seconds = timeit.timeit(lambda: map_document(document, eager), number=repeat)
+    lazy_seconds = timeit.timeit(lambda: map_document(document, lazy), number=repeat)
+
+    print(f"nodes: {len(map_document(document, eager))}")
+    print(f"regular: {eager_seconds / repeat * 1000:.2f} ms per document")
+    print(f"lazy: {lazy_seconds / repeat * 1000:.2f} ms per document")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+"""
+Memory Benchmark for Nodes and Vertices built from the sample C-CDA Document.
+
+Run from the repository root:
+    python benchmarks/memory_benchmark.py
+"""
+
+import sys
+import tracemalloc
+from datetime import datetime
+
+from lxml import etree
+
+sys.path.append('./src')
+
+# pylint: disable=wrong-import-position
+from graphs import NodeGraph
+from nodes import DocumentContext, IdentifierNode, CodeNode, AddressNode, ContactNode, BaseNode
+
+TEST_FILE = './tests/test_files/test-ccda.xml'
+V3 = '{urn:hl7-org:v3}'
+
+
+def build_nodes(document: etree.ElementBase, context: DocumentContext) -> list[BaseNode]:
+    """
+    Creates a Node for every id, coded, addr and telecom element in the Document.
+    :param document: ClinicalDocument Element
+    :param context: Document Context
+    :return: List of Nodes
+    """
+
+    nodes = []
+    for index, element in enumerate(document.iter(etree.Element)):
+        canonical_id = f"urn:bench:{index}"
+        if element.tag == f"{V3}id":
+            nodes.append(IdentifierNode(context=context, canonical_id=canonical_id,
+                                        root=element.get('root', ''),
+                                        extension=element.get('extension', ''),
+                                        assign_authority=element.get('assigningAuthorityName', '')))
+        elif element.get('codeSystem') is not None:
+            nodes.append(CodeNode(context=context, canonical_id=canonical_id,
+                                  code=element.get('code', ''),
+                                  code_system=element.get('codeSystem', ''),
+                                  code_system_name=element.get('codeSystemName', ''),
+                                  code_system_version=element.get('codeSystemVersion', ''),
+                                  display_name=element.get('displayName', '')))
+        elif element.tag == f"{V3}addr":
+            nodes.append(AddressNode(context=context, canonical_id=canonical_id,
+                                     use=element.get('use', ''), type='',
+                                     street_address_line=element.findtext(
+                                         f"{V3}streetAddressLine", ''),
+                                     city=element.findtext(f"{V3}city", ''),
+                                     state=element.findtext(f"{V3}state", ''),
+                                     county='', country='',
+                                     postal_code=element.findtext(f"{V3}postalCode", '')))
+        elif element.tag == f"{V3}telecom":
+            nodes.append(ContactNode(context=context, canonical_id=canonical_id,
+                                     use=element.get('use', ''), value=element.get('value', '')))
+    return nodes
+
+
+def main() -> None:
+    """
+    Reports the bytes per Node and bytes per Edge for the sample Document.
+    """
+
+    document = etree.parse(TEST_FILE).getroot()
+    context = DocumentContext(doc_id=1, doc_source_id='bench', etl_dg_code=0,
+                              etl_load_datetime=datetime.now(),
+                              etl_src_inc_datetime=datetime.now(), etl_src_sys_id=1)
+    root = BaseNode(context=context, canonical_id='urn:bench:root')
+
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    nodes = build_nodes(document, context)
+    node_bytes = tracemalloc.get_traced_memory()[0] - start
+
+    graph = NodeGraph()
+    start = tracemalloc.get_traced_memory()[0]
+    for node in nodes:
+        graph.add_vertex(root, node, 'component')
+    edge_bytes = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+
+    print(f"nodes: {len(nodes)}")
+    print(f"bytes per node: {node_bytes / len(nodes):.1f}")
+    print(f"edges: {len(graph.vertex_info)}")
+    print(f"bytes per edge: {edge_bytes / len(graph.vertex_info):.1f}")
+
+
+if __name__ == '__main__':
+    main()
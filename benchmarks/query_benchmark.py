@@ -0,0 +1,104 @@
+"""
+Query Benchmark comparing hand written traversals with the Graph Query engine.
+
+Run from the repository root:
+    python benchmarks/query_benchmark.py [encounter_count]
+"""
+
+import random
+import sys
+import time
+from datetime import datetime
+
+sys.path.append('./src')
+
+# pylint: disable=wrong-import-position
+from graphs import NodeGraph
+from nodes import DocumentContext, EncounterNode, GeneralEntityNode, AddressNode
+from queries import GraphQuery
+
+
+def build_graph(encounter_count: int) -> NodeGraph:
+    """
+    Creates a merged Graph of Encounters sharing Performers with Addresses.
+    :param encounter_count: Number of Encounters
+    :return: Node Graph
+    """
+
+    context = DocumentContext(doc_id=1, doc_source_id='bench', etl_dg_code=0,
+                              etl_load_datetime=datetime.now(),
+                              etl_src_inc_datetime=datetime.now(), etl_src_sys_id=1)
+    generator = random.Random(42)
+    graph = NodeGraph()
+    performers = []
+    for index in range(max(encounter_count // 100, 1)):
+        performer = GeneralEntityNode(context=context, canonical_id=f"urn:performer:{index}",
+                                      class_code='ASSIGNED')
+        address = AddressNode(context=context, canonical_id=f"urn:address:{index}", use='WP',
+                              type='', street_address_line=f"{index} Main St", city='Anywhere',
+                              state='PA', county='', country='US', postal_code='15123')
+        graph.add_vertex(performer, address, 'addr')
+        performers.append(performer)
+
+    for index in range(encounter_count):
+        encounter = EncounterNode(context=context, canonical_id=f"urn:encounter:{index}",
+                                  status_code='completed', encounter_start=None,
+                                  encounter_end=None)
+        graph.add_vertex(encounter, generator.choice(performers), 'performer')
+    return graph
+
+
+def find_addresses(graph: NodeGraph, encounter: EncounterNode) -> list[AddressNode]:
+    """
+    Hand written lookup of the Performer Addresses of an Encounter.
+    :param graph: Node Graph
+    :param encounter: Encounter Node
+    :return: Address Nodes
+    """
+
+    addresses = []
+    for performer_id in set(graph.get_vertices(encounter)):
+        performer = graph.nodes[performer_id]
+        if graph.find_vertex_info(encounter, performer, 'performer') is None:
+            continue
+        for address_id in set(graph.get_vertices(performer)):
+            address = graph.nodes[address_id]
+            if graph.find_vertex_info(performer, address, 'addr') is not None:
+                addresses.append(address)
+    return addresses
+
+
+def main() -> None:
+    """
+    Reports the time of Performer Address lookups for a sample of Encounters.
+    """
+
+    encounter_count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    graph = build_graph(encounter_count)
+    query = GraphQuery(graph)
+    encounters = random.Random(7).sample(graph.get_nodes_by_type('EncounterNode'), 1000)
+    pattern = 'EncounterNode -performer-> GeneralEntityNode -addr-> AddressNode'
+
+    started = time.perf_counter()
+    manual = [find_addresses(graph, x) for x in encounters]
+    manual_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    matched = [[x[-1] for x in query.match(pattern, start=y)] for y in encounters]
+    match_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for encounter in encounters:
+        next(query.neighborhood(encounter.canonical_id, 2, node_types=['AddressNode'],
+                                direction='out'))
+    first_seconds = time.perf_counter() - started
+
+    assert manual == matched
+    print(f"nodes: {len(graph.nodes)} queries: {len(encounters)}")
+    print(f"hand written: {manual_seconds * 1000:.2f} ms")
+    print(f"path pattern: {match_seconds * 1000:.2f} ms")
+    print(f"first address in 2 hops: {first_seconds * 1000:.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
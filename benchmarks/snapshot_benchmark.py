@@ -0,0 +1,82 @@
+"""
+Snapshot Benchmark comparing Copy on Write Snapshots with copying the Node Graph.
+
+Run from the repository root:
+    python benchmarks/snapshot_benchmark.py [document_count] [ingested_count]
+"""
+
+import random
+import sys
+import time
+from datetime import datetime
+
+sys.path.append('./src')
+
+# pylint: disable=wrong-import-position
+from graphs import NodeGraph
+from nodes import DocumentContext, BaseNode
+from snapshots import VersionedNodeGraph
+
+CONTEXT = DocumentContext(doc_id=1, doc_source_id='bench', etl_dg_code=0,
+                          etl_load_datetime=datetime.now(),
+                          etl_src_inc_datetime=datetime.now(), etl_src_sys_id=1)
+
+
+def add_document(graph: NodeGraph, index: int, generator: random.Random) -> None:
+    """
+    Adds a Document like Node related to its entries and to shared Nodes.
+    :param graph: Node Graph
+    :param index: Document number
+    :param generator: Random generator choosing the shared Nodes
+    :return: None
+    """
+
+    root = BaseNode(context=CONTEXT, canonical_id=f"urn:document:{index}")
+    for entry in range(20):
+        child = BaseNode(context=CONTEXT, canonical_id=f"urn:document:{index}:{entry}")
+        shared = BaseNode(context=CONTEXT, canonical_id=f"urn:shared:{generator.randrange(1000)}")
+        graph.add_vertex(root, child, 'component')
+        graph.add_vertex(child, shared, 'code')
+
+
+def copy_graph(graph: NodeGraph) -> NodeGraph:
+    """
+    Copies the dictionaries and sets of a Graph, the alternative to Snapshots.
+    :param graph: Node Graph
+    :return: Copied Graph
+    """
+
+    copy = NodeGraph()
+    copy.merge(graph)
+    return copy
+
+
+def main() -> None:
+    """
+    Loads a Graph of Documents, then ingests more Documents taking a Snapshot after each one for
+    the readers.
+    """
+
+    document_count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    ingested_count = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    for label, graph_class, take in (('NodeGraph + copy', NodeGraph, copy_graph),
+                                     ('VersionedNodeGraph', VersionedNodeGraph,
+                                      lambda x: x.snapshot())):
+        generator = random.Random(42)
+        graph = graph_class()
+        started = time.perf_counter()
+        for index in range(document_count):
+            add_document(graph, index, generator)
+        loading = time.perf_counter() - started
+
+        started = time.perf_counter()
+        for index in range(document_count, document_count + ingested_count):
+            add_document(graph, index, generator)
+            take(graph)
+        ingesting = time.perf_counter() - started
+        print(f"{label}: nodes {len(graph.nodes)} loading {loading:.2f} s, ingesting with "
+              f"snapshots {ingesting / ingested_count * 1000:.2f} ms per document")
+
+
+if __name__ == '__main__':
+    main()
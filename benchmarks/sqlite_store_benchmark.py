@@ -0,0 +1,84 @@
+"""
+Benchmark comparing the SQLite Graph Store with the in-memory Node Graph.
+
+Run from the repository root:
+    python benchmarks/sqlite_store_benchmark.py [node_count]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+sys.path.append('./src')
+
+# pylint: disable=wrong-import-position
+from graphs import NodeGraph
+from nodes import DocumentContext, CodeNode
+from stores import SqliteNodeGraph
+
+
+def build_nodes(node_count: int) -> list[CodeNode]:
+    """
+    Creates Code Nodes for the Benchmark.
+    :param node_count: Number of Nodes
+    :return: List of Code Nodes
+    """
+
+    context = DocumentContext(doc_id=1, doc_source_id='bench', etl_dg_code=0,
+                              etl_load_datetime=datetime.now(),
+                              etl_src_inc_datetime=datetime.now(), etl_src_sys_id=1)
+    return [CodeNode(context=context, canonical_id=f"2.16.840.1.113883.6.96:{x}", code=str(x),
+                     code_system='2.16.840.1.113883.6.96', code_system_name='SNOMED CT',
+                     code_system_version='', display_name=f"Code {x}")
+            for x in range(node_count)]
+
+
+def run(graph: NodeGraph | SqliteNodeGraph, nodes: list[CodeNode]) -> tuple[float, float]:
+    """
+    Inserts a chain of labeled Vertices and times random lookups.
+    :param graph: Graph implementation
+    :param nodes: Nodes to insert
+    :return: Inserts per second and microseconds per lookup
+    """
+
+    start = time.perf_counter()
+    for previous, node in zip(nodes, nodes[1:]):
+        graph.add_vertex(previous, node, 'translation')
+    if isinstance(graph, SqliteNodeGraph):
+        graph.commit()
+    insert_seconds = time.perf_counter() - start
+
+    generator = random.Random(42)
+    samples = [generator.randrange(len(nodes) - 1) for _ in range(10000)]
+    start = time.perf_counter()
+    for sample in samples:
+        graph.get_vertices(nodes[sample])
+        graph.find_vertex_info(nodes[sample], nodes[sample + 1], 'translation')
+    lookup_seconds = time.perf_counter() - start
+
+    return (len(nodes) - 1) / insert_seconds, lookup_seconds / len(samples) * 1000000
+
+
+def main() -> None:
+    """
+    Reports the insert rate and lookup latency of both implementations.
+    """
+
+    node_count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    nodes = build_nodes(node_count)
+
+    memory_rate, memory_latency = run(NodeGraph(), nodes)
+    with tempfile.TemporaryDirectory() as directory:
+        with SqliteNodeGraph(os.path.join(directory, 'graph.db')) as graph:
+            sqlite_rate, sqlite_latency = run(graph, nodes)
+
+    print(f"vertices: {node_count - 1}")
+    print(f"memory: {memory_rate:,.0f} inserts/s {memory_latency:.1f} us/lookup")
+    print(f"sqlite: {sqlite_rate:,.0f} inserts/s {sqlite_latency:.1f} us/lookup")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""
+Micro Benchmark of Code Node building with and without the Terminology Cache.
+
+Run from the repository root:
+    python benchmarks/terminology_benchmark.py
+"""
+
+import sys
+import timeit
+
+from lxml import etree
+
+sys.path.append('./src')
+
+# pylint: disable=wrong-import-position
+from factories import NodeFactory, TerminologyCache
+
+TEST_FILE = './tests/test_files/test-ccda.xml'
+
+NAMESPACES = {
+    'v3': 'urn:hl7-org:v3',
+    'sdtc': 'urn:hl7-org:sdtc'
+}
+
+
+def build_codes(factory: NodeFactory, codes: list) -> list:
+    """
+    Builds the Code Nodes and Translations of a Document with a new Factory.
+    :param factory: Node Factory of the Document
+    :param codes: Coded Elements
+    :return: Code Nodes and Translations
+    """
+
+    return [(factory.build_code_node(x), factory.build_code_translations(x)) for x in codes]
+
+
+def main() -> None:
+    """
+    Reports the time to build the Code Nodes of the sample Document repeatedly.
+    """
+
+    document = etree.parse(TEST_FILE).getroot()
+    codes = [x for x in document.iter(etree.Element)
+             if x.get('codeSystem') or x.find('{urn:hl7-org:v3}translation') is not None]
+    repeat = 200
+
+    cache = TerminologyCache()
+
+    uncached_seconds = timeit.timeit(
+        lambda: build_codes(NodeFactory(NAMESPACES, terminology_cache=None), codes),
+        number=repeat)
+    cached_seconds = timeit.timeit(
+        lambda: build_codes(NodeFactory(NAMESPACES, terminology_cache=cache), codes),
+        number=repeat)
+
+    print(f"coded elements: {len(codes)} cached codes: {len(cache)}")
+    print(f"uncached: {uncached_seconds / repeat * 1000:.3f} ms per document")
+    print(f"cached: {cached_seconds / repeat * 1000:.3f} ms per document")
+    print(f"hit rate: {cache.hit_rate:.3f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+"""
+Micro Benchmark comparing the memoized HL7 TS parser with datetime.strptime.
+
+Run from the repository root:
+    python benchmarks/timestamp_benchmark.py
+"""
+
+import sys
+import timeit
+from datetime import datetime
+
+from lxml import etree
+
+sys.path.append('./src')
+
+# pylint: disable=wrong-import-position
+from timestamps import parse_timestamp
+
+TEST_FILE = './tests/test_files/test-ccda.xml'
+
+
+def main() -> None:
+    """
+    Reports the time to parse every timestamp value of the sample Document.
+    """
+
+    document = etree.parse(TEST_FILE).getroot()
+    values = [x.get('value') for x in document.iter(etree.Element)
+              if x.get('value', '').isdigit() and len(x.get('value')) >= 8]
+    repeat = 20
+
+    strptime_seconds = timeit.timeit(
+        lambda: [datetime.strptime(x[:8], '%Y%m%d') for x in values], number=repeat)
+    parse_timestamp.cache_clear()
+    parser_seconds = timeit.timeit(lambda: [parse_timestamp(x) for x in values], number=repeat)
+
+    print(f"timestamps: {len(values)} distinct: {len(set(values))}")
+    print(f"strptime (date only): {strptime_seconds / repeat * 1000:.2f} ms per document")
+    print(f"parse_timestamp (full precision): {parser_seconds / repeat * 1000:.2f} ms per document")
+    print(f"cache: {parse_timestamp.cache_info()}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,186 @@
+"""
+Batch Ingestion of C-CDA Documents across a Process Pool.
+"""
+
+import glob
+import logging
+import os
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+
+from lxml import etree
+from lxml.etree import ElementBase
+
+from factories import NodeFactory
+from graphs import NodeGraph, MergeStatistics
+
+
+@dataclass(kw_only=True, slots=True)
+class WorkerReport:
+    """
+    Throughput of a single Worker Process.
+    """
+
+    pid: int
+    documents: int = 0
+    chunks: int = 0
+    seconds: float = 0.0
+
+    @property
+    def documents_per_second(self) -> float:
+        """
+        Documents mapped per second of Worker time.
+        """
+        return self.documents / self.seconds if self.seconds else 0.0
+
+
+@dataclass(kw_only=True)
+class BatchResult:
+    """
+    Result of a Batch Ingestion.
+    """
+
+    graph: NodeGraph | None = None
+    graphs: dict = field(default_factory=dict)
+    statistics: MergeStatistics = field(default_factory=MergeStatistics)
+    workers: dict = field(default_factory=dict)
+    errors: dict = field(default_factory=dict)
+
+
+def ingest_chunk(namespaces: dict, mapper: Callable[[ElementBase, NodeFactory], NodeGraph],
+                 chunk: list[tuple[int, str]], merge: bool, conflict_policy: str,
+                 factory_kwargs: dict) -> tuple[int, float, int, dict, MergeStatistics, dict]:
+    """
+    Parses and maps a Chunk of Documents within a Worker Process.
+
+    A Document which cannot be parsed or mapped is recorded in the errors and the other Documents
+    of the Chunk are still mapped.
+    :param namespaces: Document Namespaces
+    :param mapper: Callable mapping a ClinicalDocument Element with a Node Factory to a Graph
+    :param chunk: List of Document Id and File Path pairs
+    :param merge: Merge the Graphs of the Chunk before returning them
+    :param conflict_policy: Merge conflict policy
+    :param factory_kwargs: Additional Node Factory keywords
+    :return: Worker Pid, Seconds, Document Count, Graphs, Merge Statistics and Errors
+    """
+
+    start = time.perf_counter()
+    graphs = {}
+    errors = {}
+    for doc_id, path in chunk:
+        keywords = {'doc_source_id': os.path.basename(path), **factory_kwargs}
+        try:
+            document = etree.parse(path).getroot()
+        except (etree.XMLSyntaxError, OSError) as error:
+            errors[path] = str(error)
+            continue
+
+        try:
+            factory = NodeFactory(namespaces, doc_id=doc_id, **keywords)
+            graphs[path] = mapper(document, factory)
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            errors[path] = f"{type(error).__name__}: {error}"
+
+    statistics = MergeStatistics()
+    if merge and graphs:
+        merged, statistics = NodeGraph.merge_graphs(graphs.values(), conflict_policy)
+        graphs = {'': merged}
+
+    return os.getpid(), time.perf_counter() - start, len(chunk), graphs, statistics, errors
+
+
+class BatchIngestor:
+    """
+    Maps a Directory or Glob of C-CDA Documents to Graphs across a Process Pool.
+
+    Documents are sent to the workers in chunks and, when merging, each worker merges its chunk
+    so a single Graph per chunk is pickled back to the parent process.
+    """
+
+    namespaces: dict
+    mapper: Callable[[ElementBase, NodeFactory], NodeGraph]
+    max_workers: int | None
+    chunk_size: int
+    merge: bool
+    conflict_policy: str
+    first_doc_id: int
+    factory_kwargs: dict
+    logger: logging.Logger
+
+    def __init__(self, namespaces: dict, mapper: Callable[[ElementBase, NodeFactory], NodeGraph],
+                 **kwargs) -> None:
+        """
+        Constructor.
+        :param namespaces: Document Namespaces
+        :param mapper: Picklable Callable mapping a ClinicalDocument Element and Node Factory to a
+        Graph
+        :keyword max_workers: Number of Worker Processes, defaults to the CPU count
+        :keyword chunk_size: Number of Documents per Worker task
+        :keyword merge: Merge the Document Graphs into a single Graph
+        :keyword conflict_policy: Merge conflict policy
+        :keyword first_doc_id: Document Id assigned to the first Document
+        :keyword factory_kwargs: Additional Node Factory keywords like etl_dg_code
+        """
+
+        self.namespaces = namespaces
+        self.mapper = mapper
+        self.max_workers = kwargs.get('max_workers')
+        self.chunk_size = kwargs.get('chunk_size', 32)
+        self.merge = kwargs.get('merge', True)
+        self.conflict_policy = kwargs.get('conflict_policy', 'keep')
+        self.first_doc_id = kwargs.get('first_doc_id', 1)
+        self.factory_kwargs = kwargs.get('factory_kwargs', {})
+        self.logger = logging.getLogger(__name__)
+
+    @staticmethod
+    def find_documents(source: str | Iterable[str]) -> list[str]:
+        """
+        Resolves the Document Paths of a Directory, Glob or Iterable of Paths.
+        :param source: Directory, Glob Pattern or Paths
+        :return: Sorted List of File Paths
+        """
+
+        if not isinstance(source, str):
+            return list(source)
+        if os.path.isdir(source):
+            return sorted(glob.glob(os.path.join(source, '*.xml')))
+        return sorted(glob.glob(source))
+
+    def ingest(self, source: str | Iterable[str]) -> BatchResult:
+        """
+        Parses and maps the Documents across the Process Pool.
+        :param source: Directory, Glob Pattern or Paths
+        :return: Batch Result
+        """
+
+        paths = self.find_documents(source)
+        documents = list(enumerate(paths, start=self.first_doc_id))
+        chunks = [documents[x:x + self.chunk_size]
+                  for x in range(0, len(documents), self.chunk_size)]
+
+        result = BatchResult(graph=NodeGraph() if self.merge else None)
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [executor.submit(ingest_chunk, self.namespaces, self.mapper, chunk,
+                                       self.merge, self.conflict_policy, self.factory_kwargs)
+                       for chunk in chunks]
+            for future in futures:
+                pid, seconds, count, graphs, statistics, errors = future.result()
+                report = result.workers.setdefault(pid, WorkerReport(pid=pid))
+                report.documents += count - len(errors)
+                report.chunks += 1
+                report.seconds += seconds
+                result.statistics.nodes_shared += statistics.nodes_shared
+                result.statistics.nodes_conflicted += statistics.nodes_conflicted
+                result.errors.update(errors)
+                if result.graph is None:
+                    result.graphs.update(graphs)
+                    continue
+                for graph in graphs.values():
+                    result.statistics.add(result.graph.merge(graph, self.conflict_policy))
+
+        for path, error in result.errors.items():
+            self.logger.warning('Unable to ingest %s: %s', path, error)
+
+        return result
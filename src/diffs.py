@@ -0,0 +1,113 @@
+"""
+Changesets between two versions of a Node Graph.
+"""
+
+from dataclasses import dataclass, field
+
+from graphs import NodeGraph, same_content
+from nodes import BaseNode
+from vertices import VertexInfo
+
+
+@dataclass(kw_only=True, slots=True)
+class ChangeSet:
+    """
+    Minimal set of changes turning a previous Graph into a current one.
+
+    Nodes are compared by Canonical ID and field values, ignoring the Document Context, and
+    relationships by source, destination and field, with their meta. Vertices without Vertex Info
+    are compared as unordered pairs of Canonical IDs.
+    """
+
+    added_nodes: list[BaseNode] = field(default_factory=list)
+    changed_nodes: list[BaseNode] = field(default_factory=list)
+    removed_nodes: list[str] = field(default_factory=list)
+    added_edges: list[VertexInfo] = field(default_factory=list)
+    changed_edges: list[VertexInfo] = field(default_factory=list)
+    removed_edges: list[tuple[str, str, str]] = field(default_factory=list)
+    added_vertices: list[tuple[str, str]] = field(default_factory=list)
+    removed_vertices: list[tuple[str, str]] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return (len(self.added_nodes) + len(self.changed_nodes) + len(self.removed_nodes)
+                + len(self.added_edges) + len(self.changed_edges) + len(self.removed_edges)
+                + len(self.added_vertices) + len(self.removed_vertices))
+
+    def apply(self, graph: NodeGraph) -> None:
+        """
+        Applies the changes to a Graph holding the previous version.
+        :param graph: Node Graph
+        :return: None
+        """
+
+        nodes = graph.nodes
+        for source, destination, field_name in self.removed_edges:
+            if source in nodes and destination in nodes:
+                graph.remove_vertex(nodes[source], nodes[destination], field_name)
+        for source, destination in self.removed_vertices:
+            if source in nodes and destination in nodes:
+                graph.remove_vertex(nodes[source], nodes[destination])
+        for canonical_id in self.removed_nodes:
+            node = nodes.get(canonical_id)
+            if node is not None:
+                graph.remove_node(node)
+
+        for node in self.added_nodes:
+            graph.add_node(node)
+        for node in self.changed_nodes:
+            graph.add_node(node)
+
+        for vertex_info in self.added_edges + self.changed_edges:
+            graph.add_vertex_with_info(nodes[vertex_info.source_node],
+                                       nodes[vertex_info.destination_node], vertex_info)
+        for source, destination in self.added_vertices:
+            graph.add_vertex(nodes[source], nodes[destination], None)
+
+
+def diff_graphs(previous: NodeGraph, current: NodeGraph) -> ChangeSet:
+    """
+    Compares two versions of a Graph, like the Graphs of two versions of a Document.
+    :param previous: Previous Graph
+    :param current: Current Graph
+    :return: Changes from the previous to the current Graph
+    """
+
+    changes = ChangeSet()
+
+    for canonical_id, node in current.nodes.items():
+        existing = previous.nodes.get(canonical_id)
+        if existing is None:
+            changes.added_nodes.append(node)
+        elif not same_content(existing, node):
+            changes.changed_nodes.append(node)
+    changes.removed_nodes = [x for x in previous.nodes if x not in current.nodes]
+
+    for key, vertex_info in current.edge_index.items():
+        existing = previous.edge_index.get(key)
+        if existing is None:
+            changes.added_edges.append(vertex_info)
+        elif existing.meta != vertex_info.meta:
+            changes.changed_edges.append(vertex_info)
+    changes.removed_edges = [x for x in previous.edge_index if x not in current.edge_index]
+
+    previous_pairs = get_unlabeled_pairs(previous)
+    current_pairs = get_unlabeled_pairs(current)
+    changes.added_vertices = sorted(current_pairs - previous_pairs)
+    changes.removed_vertices = sorted(previous_pairs - current_pairs)
+    return changes
+
+
+def get_unlabeled_pairs(graph: NodeGraph) -> set[tuple[str, str]]:
+    """
+    Collects the Vertices of a Graph which are not backed by Vertex Info.
+    :param graph: Node Graph
+    :return: Set of ordered Canonical ID pairs
+    """
+
+    labeled = set()
+    for source, destination, _ in graph.edge_index:
+        labeled.add((source, destination) if source <= destination else (destination, source))
+
+    return {(source, destination) for source, related in graph.vertices.items()
+            for destination in related
+            if source <= destination and (source, destination) not in labeled}
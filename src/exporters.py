@@ -0,0 +1,249 @@
+"""
+Streaming Exporters of Node Graphs to Graph Database bulk import formats.
+"""
+
+import csv
+import gzip
+import json
+import logging
+import os
+from dataclasses import fields
+from datetime import datetime
+from typing import TextIO
+
+from graphs import NodeGraph
+from nodes import BaseNode, DocumentContext
+
+CONTEXT_FIELDS = [x.name for x in fields(DocumentContext)]
+
+
+class ChunkedCsvWriter:
+    """
+    CSV Writer rotating to a new numbered File every chunk of rows.
+    """
+
+    directory: str
+    name: str
+    header: list
+    chunk_size: int
+    compress: bool
+    rows: int
+    files: list
+
+    def __init__(self, directory: str, name: str, header: list, **kwargs) -> None:
+        """
+        Constructor.
+        :param directory: Output Directory
+        :param name: File Name prefix
+        :param header: Header Row written to every File
+        :keyword chunk_size: Maximum number of rows per File
+        :keyword compress: Gzip compress the Files
+        """
+
+        self.directory = directory
+        self.name = name
+        self.header = header
+        self.chunk_size = kwargs.get('chunk_size', 1000000)
+        self.compress = kwargs.get('compress', False)
+        self.rows = 0
+        self.files = []
+        self._file: TextIO | None = None
+        self._writer = None
+
+    def write(self, row: list) -> None:
+        """
+        Writes a Row, starting a new File when the current one is full.
+        :param row: Row Values
+        :return: None
+        """
+
+        if self._file is None or self.rows % self.chunk_size == 0:
+            self._open()
+        self._writer.writerow(row)
+        self.rows += 1
+
+    def close(self) -> None:
+        """
+        Closes the current File.
+        :return: None
+        """
+
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _open(self) -> None:
+        """
+        Opens the next numbered File and writes the Header.
+        :return: None
+        """
+
+        self.close()
+        path = os.path.join(self.directory, f"{self.name}-{len(self.files):05d}.csv")
+        if self.compress:
+            path += '.gz'
+            self._file = gzip.open(path, 'wt', newline='', encoding='utf-8')
+        else:
+            self._file = open(path, 'w', newline='', encoding='utf-8')
+        self.files.append(path)
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(self.header)
+
+
+class CsvExporter:
+    """
+    Exports Node Graphs as Node CSV Files per Node Class and Relationship CSV Files.
+
+    Files use the ``:ID``, ``:LABEL``, ``:START_ID``, ``:END_ID`` and ``:TYPE`` header
+    conventions of offline graph database import tools. Rows are streamed to the open Files so
+    many Graphs can be appended in one run with constant memory. Nodes and Relationships shared
+    between Graphs are written once per Graph unless ``skip_duplicates`` is set, which keeps the
+    exported Canonical IDs and Relationship keys in memory.
+    """
+
+    directory: str
+    chunk_size: int
+    compress: bool
+    skip_duplicates: bool
+    default_type: str
+    writers: dict
+    logger: logging.Logger
+
+    def __init__(self, directory: str, **kwargs) -> None:
+        """
+        Constructor.
+        :param directory: Output Directory
+        :keyword chunk_size: Maximum number of rows per File
+        :keyword compress: Gzip compress the Files
+        :keyword skip_duplicates: Write each Canonical ID and each Relationship, by source,
+        destination and type, once across all exported Graphs
+        :keyword default_type: Relationship Type of Vertices without Vertex Info
+        """
+
+        self.directory = directory
+        self.chunk_size = kwargs.get('chunk_size', 1000000)
+        self.compress = kwargs.get('compress', False)
+        self.skip_duplicates = kwargs.get('skip_duplicates', False)
+        self.default_type = kwargs.get('default_type', 'RELATED')
+        self.writers = {}
+        self.logger = logging.getLogger(__name__)
+        self._exported = set()
+        self._exported_relationships = set()
+        self._node_fields = {}
+        os.makedirs(directory, exist_ok=True)
+
+    def __enter__(self) -> 'CsvExporter':
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def export(self, graph: NodeGraph) -> None:
+        """
+        Appends the Nodes and Relationships of a Graph to the export Files.
+        :param graph: Node Graph
+        :return: None
+        """
+
+        for canonical_id, node in graph.nodes.items():
+            if self.skip_duplicates:
+                if canonical_id in self._exported:
+                    continue
+                self._exported.add(canonical_id)
+            self._write_node(node)
+
+        relationships = self._get_writer('relationships',
+                                         [':START_ID', ':END_ID', ':TYPE', 'meta'])
+        labeled = set()
+        for vertex_info in graph.vertex_info.values():
+            labeled.add((vertex_info.source_node, vertex_info.destination_node))
+            if self._is_exported((vertex_info.source_node, vertex_info.destination_node,
+                                  vertex_info.field_name)):
+                continue
+            meta = vertex_info.meta
+            relationships.write([vertex_info.source_node, vertex_info.destination_node,
+                                 vertex_info.field_name,
+                                 '' if meta is None else json.dumps(meta)])
+
+        for source, related in graph.vertices.items():
+            for destination in related:
+                if (source < destination and (source, destination) not in labeled
+                        and (destination, source) not in labeled
+                        and not self._is_exported((source, destination, self.default_type))):
+                    relationships.write([source, destination, self.default_type, ''])
+
+    def close(self) -> None:
+        """
+        Closes every open File.
+        :return: None
+        """
+
+        for writer in self.writers.values():
+            writer.close()
+        self.logger.info('Exported %s', {x: y.rows for x, y in self.writers.items()})
+
+    def _is_exported(self, key: tuple[str, str, str]) -> bool:
+        """
+        Determines if a Relationship was written by a previous Graph when skipping duplicates.
+        :param key: Source, Destination and Type
+        :return: True if the Relationship should be skipped
+        """
+
+        if not self.skip_duplicates:
+            return False
+        if key in self._exported_relationships:
+            return True
+        self._exported_relationships.add(key)
+        return False
+
+    def _write_node(self, node: BaseNode) -> None:
+        """
+        Writes a Node to the File of its Class.
+        :param node: Node
+        :return: None
+        """
+
+        label = type(node).__name__
+        field_names = self._node_fields.get(label)
+        if field_names is None:
+            field_names = self._node_fields[label] = [
+                x.name for x in fields(node) if x.name not in ('context', 'canonical_id')]
+            self._get_writer(label, ['canonical_id:ID', *CONTEXT_FIELDS, *field_names, ':LABEL'])
+        writer = self.writers[label]
+
+        values = [node.canonical_id]
+        values.extend(self._format(getattr(node.context, x)) for x in CONTEXT_FIELDS)
+        values.extend(self._format(getattr(node, x)) for x in field_names)
+        values.append(label)
+        writer.write(values)
+
+    def _get_writer(self, name: str, header: list) -> ChunkedCsvWriter:
+        """
+        Retrieves or creates the Writer for a File Name prefix.
+        :param name: File Name prefix
+        :param header: Header Row
+        :return: Chunked CSV Writer
+        """
+
+        writer = self.writers.get(name)
+        if writer is None:
+            writer = self.writers[name] = ChunkedCsvWriter(self.directory, name, header,
+                                                           chunk_size=self.chunk_size,
+                                                           compress=self.compress)
+        return writer
+
+    @staticmethod
+    def _format(value: object) -> object:
+        """
+        Formats a field value for CSV.
+        :param value: Field Value
+        :return: CSV Value
+        """
+
+        if value is None:
+            return ''
+        if isinstance(value, datetime):
+            return value.isoformat()
+        if isinstance(value, bool):
+            return str(value).lower()
+        return value
@@ -2,19 +2,38 @@
 Factories for Creating Items from a C-CDA Document.
 """
 
+from lxml import etree
 from lxml.etree import ElementBase
-from nodes import CodeNode, NameNode, IdentifierNode, ContactNode, AddressNode
+from nodes import CodeNode, NameNode, IdentifierNode, ContactNode, AddressNode, DocumentContext
+from interning import StringPool
+from lazy import LazyIdentifierNode, LazyCodeNode, LazyContactNode, LazyAddressNode, LazyNameNode
+from timestamps import parse_timestamp, parse_duration
+import hashlib
 import logging
+import re
+import threading
+import uuid
+from collections import OrderedDict
 from datetime import datetime
 
+OID_PATTERN = re.compile(r'[0-2](\.\d+)+')
+
+XPATH_CACHE = {}
+
 
 class BaseFactory:
     """
     Base Factory Implementation
+
+    Compiled XPath expressions are shared by every Factory of the Process, so Factories created
+    per Document reuse them. Hits and misses are counted per Factory.
     """
 
     namespaces: dict
     logger: logging.Logger
+    xpath_cache: dict = XPATH_CACHE
+    xpath_hits: int
+    xpath_misses: int
 
     def __init__(self, namespaces: dict) -> None:
         """
@@ -24,6 +43,140 @@ class BaseFactory:
 
         self.namespaces = namespaces
         self.logger = logging.getLogger(__name__)
+        self.xpath_hits = 0
+        self.xpath_misses = 0
+
+    def get_xpath(self, path: str, namespaces: dict | None = None) -> etree.XPath:
+        """
+        Retrieves a compiled XPath for a Path, compiling it on first use.
+        :param path: XPath or Clark Notation ({namespace}tag) Path
+        :param namespaces: Optional Namespaces, defaults to the Document Namespaces
+        :return: Compiled XPath
+        """
+
+        namespaces = self.namespaces if namespaces is None else namespaces
+        key = (path, tuple(sorted(namespaces.items())))
+
+        expression = self.xpath_cache.get(key)
+        if expression is not None:
+            self.xpath_hits += 1
+            return expression
+
+        self.xpath_misses += 1
+        if '{' in path:
+            expression = etree.ETXPath(path)
+        else:
+            expression = etree.XPath(path, namespaces=namespaces)
+        self.xpath_cache[key] = expression
+        return expression
+
+    def find(self, element: ElementBase | None, path: str) -> ElementBase | None:
+        """
+        Finds the first Element matching a Path using the compiled XPath cache.
+        :param element: Context Element
+        :param path: Path to the Element
+        :return: Optional Element
+        """
+
+        if element is None:
+            return None
+
+        results = self.get_xpath(path)(element)
+        return results[0] if results else None
+
+    def findall(self, element: ElementBase | None, path: str) -> list[ElementBase]:
+        """
+        Finds all Elements matching a Path using the compiled XPath cache.
+        :param element: Context Element
+        :param path: Path to the Elements
+        :return: List of Elements
+        """
+
+        if element is None:
+            return []
+
+        return self.get_xpath(path)(element)
+
+
+class TerminologyCache:
+    """
+    Size bounded LRU Cache of Code Node attributes shared by every Factory in the Process.
+
+    Entries are keyed on code system and code and hold the attributes read from the first Element
+    with the code. Factories build their Code Nodes from them with their own Document Context, so
+    no provenance is shared between Documents.
+    """
+
+    maxsize: int
+    hits: int
+    misses: int
+
+    def __init__(self, maxsize: int = 16384) -> None:
+        """
+        Constructor.
+        :param maxsize: Maximum number of cached codes
+        """
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Ratio of lookups answered from the Cache.
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def get(self, key: tuple) -> dict | None:
+        """
+        Retrieves a cached entry, marking it as recently used.
+        :param key: Cache Key
+        :return: Optional Code Node attributes
+        """
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key: tuple, entry: dict) -> None:
+        """
+        Stores an entry, evicting the least recently used one when full.
+        :param key: Cache Key
+        :param entry: Code Node attributes
+        :return: None
+        """
+
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Removes every entry and resets the metrics.
+        :return: None
+        """
+
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+TERMINOLOGY_CACHE = TerminologyCache()
 
 
 class NodeFactory(BaseFactory):
@@ -31,17 +184,20 @@ class NodeFactory(BaseFactory):
     Factory for creating Basic Nodes from C-CDA Elements.
     """
 
-    doc_id: int
-    doc_source_id: str
-    etl_dg_code: int
-    etl_load_datetime: datetime
-    etl_src_inc_datetime: datetime
-    etl_src_sys_id: int
+    context: DocumentContext
+    terminology_cache: TerminologyCache | None
+    string_pool: StringPool
+    lazy: bool
 
     def __init__(self, namespaces: dict, **kwargs) -> None:
         """
         Constructor
         :param namespaces:
+        :keyword: context: Document Context shared by the created Nodes
+        :keyword: terminology_cache: Code Node attribute Cache, the process wide one by default,
+        None to disable
+        :keyword: string_pool: Pool interning the Node Strings, like the one of the target Graph
+        :keyword: lazy: Build Lazy Nodes reading the fields outside their identity on first access
         :keyword: doc_id: Document Id
         :keyword: doc_source_id: Document Source Id
         :keyword: etl_dg_code: ETL Code
@@ -50,21 +206,124 @@ class NodeFactory(BaseFactory):
         :keyword: etl_src_sys_id: Etl Source Id
         """
         super().__init__(namespaces)
-        self.doc_id = kwargs.get('doc_id', 0)
-        self.doc_source_id = kwargs.get('doc_source_id', '')
-        self.etl_dg_code = kwargs.get('etl_dg_code', 0)
-        self.etl_load_datetime = kwargs.get('etl_load_datetime', datetime.now())
-        self.etl_src_inc_datetime = kwargs.get('etl_src_inc_datetime', datetime.now())
-        self.etl_src_sys_id = kwargs.get('etl_src_sys_id', 0)
+        self.context = kwargs.get('context') or DocumentContext(
+            doc_id=kwargs.get('doc_id', 0),
+            doc_source_id=kwargs.get('doc_source_id', ''),
+            etl_dg_code=kwargs.get('etl_dg_code', 0),
+            etl_load_datetime=kwargs.get('etl_load_datetime', datetime.now()),
+            etl_src_inc_datetime=kwargs.get('etl_src_inc_datetime', datetime.now()),
+            etl_src_sys_id=kwargs.get('etl_src_sys_id', 0))
+        self.terminology_cache = kwargs.get('terminology_cache', TERMINOLOGY_CACHE)
+        self.string_pool = kwargs.get('string_pool')
+        if self.string_pool is None:
+            self.string_pool = StringPool()
+        self.lazy = kwargs.get('lazy', False)
+        self._code_nodes = {}
+
+    @property
+    def doc_id(self) -> int:
+        """
+        Document Id of the Document Context.
+        """
+        return self.context.doc_id
+
+    @property
+    def doc_source_id(self) -> str:
+        """
+        Document Source Id of the Document Context.
+        """
+        return self.context.doc_source_id
+
+    @property
+    def etl_dg_code(self) -> int:
+        """
+        ETL Code of the Document Context.
+        """
+        return self.context.etl_dg_code
+
+    @property
+    def etl_load_datetime(self) -> datetime:
+        """
+        ETL Load Datetime of the Document Context.
+        """
+        return self.context.etl_load_datetime
+
+    @property
+    def etl_src_inc_datetime(self) -> datetime:
+        """
+        Source included Datetime of the Document Context.
+        """
+        return self.context.etl_src_inc_datetime
+
+    @property
+    def etl_src_sys_id(self) -> int:
+        """
+        ETL Source Id of the Document Context.
+        """
+        return self.context.etl_src_sys_id
+
+    @staticmethod
+    def build_canonical_id(node_type: str, *values: object) -> str:
+        """
+        Creates a deterministic Canonical ID from the identifying values of a Node.
+
+        Values are normalized (whitespace collapsed, case folded, datetimes as ISO 8601) and
+        hashed with blake2b together with the Node type, so the same entity found in any Document
+        maps to the same ``urn:uuid`` (version 8) Canonical ID. At least one value must be
+        non-empty, otherwise unrelated Nodes would share a Canonical ID.
+        :param node_type: Node type, like AddressNode or EncounterNode
+        :param values: Identifying values, like identifier Canonical IDs or address parts
+        :return: Canonical ID
+        """
+
+        normalized = [node_type]
+        for value in values:
+            if value is None:
+                value = ''
+            elif isinstance(value, datetime):
+                value = value.isoformat()
+            normalized.append(' '.join(str(value).split()).casefold())
+        if not any(normalized[1:]):
+            raise ValueError(f"No identifying values for {node_type}")
+
+        digest = bytearray(hashlib.blake2b('\x1f'.join(normalized).encode('utf-8'),
+                                           digest_size=16).digest())
+        digest[6] = (digest[6] & 0x0F) | 0x80
+        digest[8] = (digest[8] & 0x3F) | 0x80
+        return f"urn:uuid:{uuid.UUID(bytes=bytes(digest))}"
 
     def build_code_node(self, code_element: ElementBase) -> CodeNode | None:
         """
         Creates a Code node from a Coded Element or Value.
+
+        Repeated codes of a Document return the same instance, built from the attributes in the
+        Terminology Cache when another Document already read them.
         :param code_element: Code Element of Value
-        :return: Code Node
+        :return: Code Node, None when the element has no code
+        """
+
+        if code_element is None:
+            return None
+
+        code = code_element.get('code')
+        code_system = code_element.get('codeSystem')
+        if not code or not code_system:
+            return None
+        return self._get_code_node(code_element, code, code_system)
+
+    def build_code_translations(self, code_element: ElementBase) -> tuple[CodeNode, ...]:
         """
+        Creates the Code Nodes of the Translations of a Coded Element.
 
-        return None
+        Translations are read from every Element, since the same code may carry different
+        Translations in different Documents.
+        :param code_element: Code Element of Value
+        :return: Translation Code Nodes
+        """
+
+        return tuple(x for x in (self.build_translation_code_node(y) for y in
+                                 self.findall(code_element, './v3:translation'))
+                     if x is not None)
 
     def build_translation_code_node(self, translation_element: ElementBase) -> CodeNode | None:
         """
@@ -72,7 +331,8 @@ class NodeFactory(BaseFactory):
         :param translation_element: Translation
         :return: Code Node
         """
-        return None
+
+        return self.build_code_node(translation_element)
 
     def build_contact_node(self, telecom_element: ElementBase) -> ContactNode | None:
         """
@@ -80,31 +340,254 @@ class NodeFactory(BaseFactory):
         :param telecom_element: Telecom Element
         :return: Optional Contact Node
         """
-        return None
+
+        if telecom_element is None:
+            return None
+
+        value = telecom_element.get('value')
+        if not value:
+            return None
+
+        intern = self.string_pool.intern
+        canonical_id = intern(self.build_canonical_id('ContactNode', value))
+        if self.lazy:
+            return LazyContactNode.from_element(telecom_element, context=self.context,
+                                                canonical_id=canonical_id, value=value)
+
+        return ContactNode(context=self.context,
+                           canonical_id=canonical_id,
+                           use=intern(telecom_element.get('use', '')),
+                           value=intern(value))
 
     def build_name_node(self, name_element: ElementBase) -> NameNode | None:
         """
         Creates a Name Node representing a Name Element.
+
+        Names without parts, like organization names, keep their text as the family name.
         :param name_element: Name Element
         :return: Optional Name Node
         """
-        return None
+
+        if name_element is None:
+            return None
+
+        parts = self._get_child_elements(name_element)
+        given_name = self._join_texts(parts.get('given'), ' ')
+        family_name = self._join_texts(parts.get('family'), ' ')
+        prefix = self._join_texts(parts.get('prefix'), ' ')
+        suffix = self._join_texts(parts.get('suffix'), ' ')
+        if not parts:
+            family_name = ' '.join((name_element.text or '').split())
+        if not (given_name or family_name):
+            return None
+
+        use = name_element.get('use', '')
+        intern = self.string_pool.intern
+        canonical_id = intern(self.build_canonical_id(
+            'NameNode', use, given_name, family_name, prefix, suffix))
+        if self.lazy:
+            return LazyNameNode.from_element(name_element, context=self.context,
+                                             canonical_id=canonical_id, type_code=use,
+                                             family_name=family_name, given_name=given_name,
+                                             prefix=prefix, suffix=suffix)
+
+        valid_time = parts.get('validTime', [None])[0]
+        valid_start = self.find(valid_time, './v3:low')
+        valid_end = self.find(valid_time, './v3:high')
+        return NameNode(context=self.context,
+                        canonical_id=canonical_id,
+                        type_code=intern(use),
+                        family_name=intern(family_name),
+                        given_name=intern(given_name),
+                        prefix=intern(prefix),
+                        suffix=intern(suffix),
+                        valid_start_date=None if valid_start is None else parse_timestamp(
+                            valid_start.get('value')),
+                        valid_end_date=None if valid_end is None else parse_timestamp(
+                            valid_end.get('value')))
 
     def build_address_node(self, addr_element: ElementBase) -> AddressNode | None:
         """
         Creates an Address Node an Addr Element.
+
+        Street address lines are joined with new lines. Addresses without a street, city, state,
+        postal code or country are not identifiable and return None.
         :param addr_element: Addr Element
         :return: Optional Address Node
         """
-        return None
+
+        if addr_element is None:
+            return None
+
+        parts = self._get_child_elements(addr_element)
+        if not parts:
+            return None
+
+        use = addr_element.get('use', '')
+        street_address_line = self._join_texts(parts.get('streetAddressLine'), '\n')
+        city = self._join_texts(parts.get('city'), ' ')
+        state = self._join_texts(parts.get('state'), ' ')
+        country = self._join_texts(parts.get('country'), ' ')
+        postal_code = self._join_texts(parts.get('postalCode'), ' ')
+        if not (street_address_line or city or state or postal_code or country):
+            return None
+
+        intern = self.string_pool.intern
+        canonical_id = intern(self.build_canonical_id(
+            'AddressNode', use, street_address_line, city, state, postal_code, country))
+        if self.lazy:
+            return LazyAddressNode.from_element(addr_element, context=self.context,
+                                                canonical_id=canonical_id, use=use,
+                                                street_address_line=street_address_line,
+                                                city=city, state=state, country=country,
+                                                postal_code=postal_code)
+
+        return AddressNode(context=self.context,
+                           canonical_id=canonical_id,
+                           use=intern(use),
+                           type=intern(addr_element.get('type', '')),
+                           street_address_line=intern(street_address_line),
+                           city=intern(city),
+                           state=intern(state),
+                           county=intern(self._join_texts(parts.get('county'), ' ')),
+                           country=intern(country),
+                           postal_code=intern(postal_code))
 
     def build_identifier_node(self, id_element: ElementBase) -> IdentifierNode | None:
         """
         Creates an Identifier Node from an id element.
         :param id_element: id element
-        :return: Optional Identifier Node
+        :return: Optional Identifier Node, None when the element has no root
+        """
+
+        if id_element is None:
+            return None
+
+        root = id_element.get('root')
+        if not root:
+            return None
+
+        extension = id_element.get('extension', '')
+        intern = self.string_pool.intern
+        canonical_id = intern(self.build_identifier_id(root, extension))
+        if self.lazy:
+            return LazyIdentifierNode.from_element(id_element, context=self.context,
+                                                   canonical_id=canonical_id, root=root,
+                                                   extension=extension)
+
+        return IdentifierNode(context=self.context,
+                              canonical_id=canonical_id,
+                              root=intern(root),
+                              extension=intern(extension),
+                              assign_authority=intern(id_element.get('assigningAuthorityName', '')))
+
+    @staticmethod
+    def build_identifier_id(root: str, extension: str | None = None) -> str:
         """
-        return None
+        Creates the Canonical ID of an Instance Identifier.
+
+        OID roots become ``urn:oid:{root}:{extension}``, URL roots ``{root}/{extension}`` and any
+        other root, like a UUID, ``urn:uuid:{root}:{extension}``.
+        :param root: Identifier Root
+        :param extension: Optional Identifier Extension
+        :return: Canonical ID
+        """
+
+        if '://' in root:
+            return f"{root.rstrip('/')}/{extension}" if extension else root
+
+        prefix = 'urn:oid' if OID_PATTERN.fullmatch(root) else 'urn:uuid'
+        return f"{prefix}:{root}:{extension}" if extension else f"{prefix}:{root}"
+
+    def _get_code_node(self, element: ElementBase, code: str, code_system: str) -> CodeNode:
+        """
+        Retrieves the Code Node of a code in this Document, building it from the Terminology Cache
+        attributes or from the Element on a miss.
+        :param element: Code or Translation Element
+        :param code: Code
+        :param code_system: Code System
+        :return: Code Node
+        """
+
+        canonical_id = f"{code_system}:{code}"
+        node = self._code_nodes.get(canonical_id)
+        if node is not None:
+            return node
+
+        if self.terminology_cache is None:
+            node = self._create_code_node(element, code, code_system)
+        else:
+            key = ('code', code_system, code)
+            attributes = self.terminology_cache.get(key)
+            if attributes is None:
+                attributes = self._read_code_attributes(element, code, code_system)
+                self.terminology_cache.put(key, attributes)
+            node = CodeNode(context=self.context,
+                            canonical_id=self.string_pool.intern(canonical_id), **attributes)
+
+        self._code_nodes[canonical_id] = node
+        return node
+
+    def _create_code_node(self, element: ElementBase, code: str, code_system: str) -> CodeNode:
+        """
+        Creates a Code Node from the attributes of a Coded Element, a Lazy one when not cached.
+        :param element: Code or Translation Element
+        :param code: Code
+        :param code_system: Code System
+        :return: Code Node
+        """
+
+        canonical_id = self.string_pool.intern(f"{code_system}:{code}")
+        if self.lazy:
+            return LazyCodeNode.from_element(element, context=self.context,
+                                             canonical_id=canonical_id, code=code,
+                                             code_system=code_system)
+
+        return CodeNode(context=self.context, canonical_id=canonical_id,
+                        **self._read_code_attributes(element, code, code_system))
+
+    def _read_code_attributes(self, element: ElementBase, code: str, code_system: str) -> dict:
+        """
+        Reads the attributes of a Code Node, without its Canonical ID and Document Context.
+        :param element: Code or Translation Element
+        :param code: Code
+        :param code_system: Code System
+        :return: Code Node attributes
+        """
+
+        intern = self.string_pool.intern
+        return {'code': intern(code),
+                'code_system': intern(code_system),
+                'code_system_name': intern(element.get('codeSystemName', '')),
+                'code_system_version': intern(element.get('codeSystemVersion', '')),
+                'display_name': intern(element.get('displayName', ''))}
+
+    @staticmethod
+    def _get_child_elements(element: ElementBase) -> dict[str, list[ElementBase]]:
+        """
+        Groups the child Elements by local name in a single pass.
+        :param element: Parent Element
+        :return: Dictionary of local name to Elements
+        """
+
+        children = {}
+        for child in element.iterchildren(etree.Element):
+            children.setdefault(child.tag.rpartition('}')[2], []).append(child)
+        return children
+
+    @staticmethod
+    def _join_texts(elements: list[ElementBase] | None, separator: str) -> str:
+        """
+        Joins the normalized texts of Elements.
+        :param elements: Optional Elements
+        :param separator: Separator
+        :return: Joined Text
+        """
+
+        if not elements:
+            return ''
+        return separator.join(text for text in (' '.join((x.text or '').split())
+                                                for x in elements) if text)
 
 
 class ValueFactory(BaseFactory):
@@ -115,8 +598,35 @@ class ValueFactory(BaseFactory):
     def build_effective_time(self, element: ElementBase) -> dict | None:
         """
         Creates an object representing the Effective Date Time.
+
+        Handles both TS elements with a value and IVL_TS elements with low, high, center and
+        width children. Values carrying a nullFlavor are returned as None.
         :param element: Effective Date Time
-        :return: Optional Dictionary
+        :return: Optional Dictionary with value, low, high, center, width and null_flavor keys
+        """
+
+        if element is None:
+            return None
+
+        width_element = self.find(element, './v3:width')
+        return {
+            'value': parse_timestamp(element.get('value')),
+            'low': self._build_time_value(self.find(element, './v3:low')),
+            'high': self._build_time_value(self.find(element, './v3:high')),
+            'center': self._build_time_value(self.find(element, './v3:center')),
+            'width': None if width_element is None else parse_duration(
+                width_element.get('value'), width_element.get('unit')),
+            'null_flavor': element.get('nullFlavor')
+        }
+
+    @staticmethod
+    def _build_time_value(element: ElementBase | None) -> datetime | None:
+        """
+        Parses the value of a low, high or center element.
+        :param element: TS Element
+        :return: Optional Datetime
         """
 
-        return None
+        if element is None or element.get('nullFlavor'):
+            return None
+        return parse_timestamp(element.get('value'))
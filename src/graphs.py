@@ -2,24 +2,90 @@
 Module for creating Graphs from Nodes.
 """
 
+import threading
+from array import array
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, fields
+
+from indexes import AttributeIndex, RangeIndex
+from interning import StringPool
 from nodes import BaseNode
 from vertices import VertexInfo
 
 
+CONFLICT_POLICIES = ('keep', 'replace', 'error')
+
+
+@dataclass(kw_only=True, slots=True)
+class MergeStatistics:
+    """
+    Counts of the items added while merging Graphs.
+    """
+
+    nodes_added: int = 0
+    nodes_shared: int = 0
+    nodes_conflicted: int = 0
+    vertices_added: int = 0
+    vertex_info_added: int = 0
+
+    def add(self, other: 'MergeStatistics') -> None:
+        """
+        Adds the counts of another merge to these Statistics.
+        :param other: Merge Statistics
+        :return: None
+        """
+
+        self.nodes_added += other.nodes_added
+        self.nodes_shared += other.nodes_shared
+        self.nodes_conflicted += other.nodes_conflicted
+        self.vertices_added += other.vertices_added
+        self.vertex_info_added += other.vertex_info_added
+
+
+def same_content(node: BaseNode, other: BaseNode) -> bool:
+    """
+    Determines if two Nodes hold the same values, ignoring the Document Context.
+
+    Node types are compared by class name so Lazy Nodes match their regular counterparts.
+    :param node: Node
+    :param other: Other Node
+    :return: True if the Nodes hold the same values
+    """
+
+    if node is other:
+        return True
+    if type(node).__name__ != type(other).__name__:
+        return False
+    return all(getattr(node, x.name) == getattr(other, x.name)
+               for x in fields(node) if x.name != 'context')
+
+
 class NodeGraph:
     nodes: dict
     vertices: dict
     vertex_info: dict
+    node_vertex_info: dict
+    edge_index: dict
+    pair_index: dict
+    type_index: dict
+    attribute_indexes: dict
+    string_pool: StringPool | None
 
-    def __init__(self) -> None:
+    def __init__(self, **kwargs) -> None:
         """
         Constructor.
+        :keyword string_pool: Pool interning the Canonical IDs and field names, None to disable
         """
 
         self.nodes = {}
         self.vertex_info = {}
         self.vertices = {}
         self.node_vertex_info = {}
+        self.edge_index = {}
+        self.pair_index = {}
+        self.type_index = {}
+        self.attribute_indexes = {}
+        self.string_pool = kwargs.get('string_pool', StringPool())
 
     def add_node(self, node: BaseNode) -> None:
         """
@@ -28,7 +94,84 @@ class NodeGraph:
         :return: None
         """
 
-        self.nodes[node.canonical_id] = node
+        if self.string_pool is not None:
+            node.canonical_id = self.string_pool.intern(node.canonical_id)
+        previous = self.nodes.get(node.canonical_id)
+        if previous is not node:
+            self.nodes[node.canonical_id] = node
+            self._index_node(node, previous)
+
+    def add_index(self, node_type: str, *attributes: str,
+                  ordered: bool = False) -> AttributeIndex | RangeIndex:
+        """
+        Declares a Secondary Index of a Node type, maintained as Nodes are added.
+
+        Indexed attributes should not change once a Node is in the Graph.
+        :param node_type: Node class name, like CodeNode
+        :param attributes: Indexed attributes, like code_system and code
+        :param ordered: Create an ordered Index of a single attribute for range lookups
+        :return: Index
+        """
+
+        for index in self.attribute_indexes.get(node_type, []):
+            if isinstance(index, RangeIndex) == ordered and (
+                    (index.attribute,) if ordered else index.attributes) == attributes:
+                return index
+
+        if ordered:
+            if len(attributes) != 1:
+                raise ValueError('Ordered indexes cover a single attribute')
+            index = RangeIndex(node_type, attributes[0])
+        else:
+            index = AttributeIndex(node_type, attributes)
+
+        for canonical_id in self.type_index.get(node_type, ()):
+            index.add(self.nodes[canonical_id])
+        self.attribute_indexes.setdefault(node_type, []).append(index)
+        return index
+
+    def get_nodes_by_type(self, node_type: str) -> list[BaseNode]:
+        """
+        Retrieves every Node of a type.
+        :param node_type: Node class name, like EncounterNode
+        :return: List of Nodes
+        """
+
+        return [self.nodes[x] for x in self.type_index.get(node_type, ())]
+
+    def find_nodes(self, node_type: str, **values) -> list[BaseNode]:
+        """
+        Finds the Nodes of a type with the given attribute values.
+
+        Uses the Index declared on exactly these attributes, otherwise scans the Nodes of the type.
+        :param node_type: Node class name, like CodeNode
+        :param values: Attribute values, like code_system='2.16.840.1.113883.6.96'
+        :return: List of Nodes
+        """
+
+        for index in self.attribute_indexes.get(node_type, []):
+            if isinstance(index, AttributeIndex) and set(index.attributes) == set(values):
+                return [self.nodes[x] for x in index.find(values)]
+
+        return [x for x in self.get_nodes_by_type(node_type)
+                if all(getattr(x, y) == z for y, z in values.items())]
+
+    def find_nodes_in_range(self, node_type: str, attribute: str, low: object = None,
+                            high: object = None) -> list[BaseNode]:
+        """
+        Finds the Nodes of a type with an attribute from low, inclusive, to high, exclusive.
+        :param node_type: Node class name, like EncounterNode
+        :param attribute: Attribute with an ordered Index, like encounter_start
+        :param low: Optional lower bound
+        :param high: Optional upper bound
+        :return: List of Nodes ordered by the attribute
+        """
+
+        for index in self.attribute_indexes.get(node_type, []):
+            if isinstance(index, RangeIndex) and index.attribute == attribute:
+                return [self.nodes[x] for x in index.find(low, high)]
+
+        raise ValueError(f"No ordered index on {node_type}.{attribute}")
 
     def add_vertex(self, source_node: BaseNode, destination_node: BaseNode,
                    field: str | None) -> None:
@@ -44,8 +187,8 @@ class NodeGraph:
             vertex_info = VertexInfo(source_node, destination_node, field)
             self.add_vertex_with_info(source_node, destination_node, vertex_info)
         else:
-            self.nodes[source_node.canonical_id] = source_node
-            self.nodes[destination_node.canonical_id] = destination_node
+            self.add_node(source_node)
+            self.add_node(destination_node)
 
             if source_node.canonical_id not in self.vertices:
                 self.vertices[source_node.canonical_id] = set()
@@ -70,6 +213,12 @@ class NodeGraph:
 
         if vertex_info:
 
+            if self.string_pool is not None:
+                vertex_info.source_node = self.string_pool.intern(vertex_info.source_node)
+                vertex_info.destination_node = self.string_pool.intern(
+                    vertex_info.destination_node)
+                vertex_info.field_name = self.string_pool.intern(vertex_info.field_name)
+
             if source_node.canonical_id not in self.node_vertex_info:
                 self.node_vertex_info[source_node.canonical_id] = set()
 
@@ -81,6 +230,8 @@ class NodeGraph:
             self.node_vertex_info[destination_node.canonical_id].add(
                 vertex_info.vertx_id)
 
+            self._index_edge(vertex_info)
+
     def get_vertices(self, node: BaseNode) -> set:
         """
         Returns the Canonical IDs related to the provided Node.
@@ -108,19 +259,696 @@ class NodeGraph:
 
         return self.vertex_info.get(vertex_id)
 
-    def find_vertex_info(self, source_node: BaseNode,
-                         destination_node: BaseNode) -> VertexInfo | None:
+    def find_vertex_info(self, source_node: BaseNode, destination_node: BaseNode,
+                         field: str | None = None) -> VertexInfo | None:
         """
         Retrieves the Vertex Info for a relationship.
         :param source_node: Source Node
         :param destination_node: Destination Node
+        :param field: Optional Field Name, any relationship is returned when omitted.
         :return: Vertex Info
         """
 
-        source_node_vertices = self.node_vertex_info.get(source_node.canonical_id, set())
-        for source_node_vertex in source_node_vertices:
-            vertex_info = self.get_vertex_info(source_node_vertex)
-            if vertex_info and vertex_info.destination_node == destination_node.canonical_id:
-                return vertex_info
+        if field is not None:
+            return self.edge_index.get(
+                (source_node.canonical_id, destination_node.canonical_id, field))
+
+        edges = self.find_all_vertex_info(source_node, destination_node)
+        return edges[0] if edges else None
+
+    def remove_node(self, node: BaseNode) -> bool:
+        """
+        Removes a Node and every Vertex of the Node from the Graph in O(degree).
+        :param node: Node to Remove
+        :return: True if the Node was in the Graph
+        """
+
+        canonical_id = node.canonical_id
+        existing = self.nodes.get(canonical_id)
+        if existing is None:
+            return False
+
+        for vertex_id in list(self.node_vertex_info.get(canonical_id, ())):
+            self._remove_vertex_info(self.vertex_info[vertex_id])
+        for related in self.vertices.pop(canonical_id, ()):
+            if related != canonical_id:
+                self.vertices[related].discard(canonical_id)
+        self.node_vertex_info.pop(canonical_id, None)
+
+        del self.nodes[canonical_id]
+        self._unindex_node(existing)
+        return True
+
+    def remove_nodes(self, nodes: Iterable[BaseNode]) -> int:
+        """
+        Removes many Nodes and their Vertices, like every Node of a retracted Document.
+
+        The removed Canonical IDs are tombstoned first, so the reverse indexes are only updated
+        for the surviving Nodes related to them. Call ``compact`` after heavy deletes to reclaim
+        the memory of the emptied dictionaries.
+        :param nodes: Nodes to Remove
+        :return: Number of Nodes removed
+        """
+
+        tombstones = {x.canonical_id for x in nodes if x.canonical_id in self.nodes}
+        for canonical_id in tombstones:
+            for vertex_id in self.node_vertex_info.pop(canonical_id, ()):
+                vertex_info = self.vertex_info.pop(vertex_id, None)
+                if vertex_info is None:
+                    continue
+                self._unindex_edge(vertex_info)
+                other = vertex_info.destination_node \
+                    if vertex_info.source_node == canonical_id else vertex_info.source_node
+                if other not in tombstones:
+                    self.node_vertex_info[other].discard(vertex_id)
+
+            for related in self.vertices.pop(canonical_id, ()):
+                if related not in tombstones:
+                    self.vertices[related].discard(canonical_id)
+
+            self._unindex_node(self.nodes.pop(canonical_id))
+        return len(tombstones)
+
+    def remove_vertex(self, source_node: BaseNode, destination_node: BaseNode,
+                      field: str | None = None) -> bool:
+        """
+        Removes a Vertex between two Nodes.
+
+        With a field only that relationship is removed, and the Nodes stay related while other
+        relationships connect them. Without a field every relationship between the Nodes, in both
+        directions, is removed.
+        :param source_node: Source Node
+        :param destination_node: Destination Node
+        :param field: Optional Field Name of the relationship
+        :return: True if a Vertex was removed
+        """
+
+        source = source_node.canonical_id
+        destination = destination_node.canonical_id
+        if field is not None:
+            vertex_info = self.edge_index.get((source, destination, field))
+            if vertex_info is None:
+                return False
+            self._remove_vertex_info(vertex_info)
+            if not (self.find_all_vertex_info(source_node, destination_node)
+                    or self.find_all_vertex_info(destination_node, source_node)):
+                self._remove_adjacency(source, destination)
+            return True
+
+        for vertex_info in (self.find_all_vertex_info(source_node, destination_node)
+                            + self.find_all_vertex_info(destination_node, source_node)):
+            self._remove_vertex_info(vertex_info)
+        return self._remove_adjacency(source, destination)
+
+    def compact(self) -> None:
+        """
+        Reclaims the memory left by removed Nodes and Vertices.
+
+        Dictionaries and sets keep their capacity when items are removed, so they are rebuilt at
+        their current size, empty Vertex sets are dropped and the String Pool only keeps the
+        Canonical IDs and field names still in use.
+        :return: None
+        """
+
+        self.nodes = dict(self.nodes)
+        self.vertices = {x: set(y) for x, y in self.vertices.items() if y}
+        self.node_vertex_info = {x: set(y) for x, y in self.node_vertex_info.items() if y}
+        self.vertex_info = dict(self.vertex_info)
+        self.edge_index = dict(self.edge_index)
+        self.pair_index = {x: dict(y) for x, y in self.pair_index.items() if y}
+        self.type_index = {x: set(y) for x, y in self.type_index.items() if y}
+        for indexes in self.attribute_indexes.values():
+            for index in indexes:
+                index.compact()
+
+        if self.string_pool is not None:
+            self.string_pool.retain(
+                [*self.nodes, *{x.field_name for x in self.vertex_info.values()}])
+
+    def merge(self, other: 'NodeGraph', conflict_policy: str = 'keep') -> MergeStatistics:
+        """
+        Merges the Nodes and Vertices of another Graph into this Graph.
+
+        Nodes sharing a Canonical ID are stored once. When their values differ the conflict
+        policy decides the outcome: ``keep`` the existing Node, ``replace`` it with the incoming
+        Node, or raise a ValueError with ``error`` before anything is merged.
+        :param other: Graph to merge
+        :param conflict_policy: keep, replace or error
+        :return: Merge Statistics
+        """
+
+        if conflict_policy not in CONFLICT_POLICIES:
+            raise ValueError(f"Unknown conflict policy: {conflict_policy}")
+
+        nodes = self.nodes
+        if conflict_policy == 'error':
+            for canonical_id, node in other.nodes.items():
+                existing = nodes.get(canonical_id)
+                if existing is not None and not same_content(existing, node):
+                    raise ValueError(f"Conflicting node for {canonical_id}")
+
+        statistics = MergeStatistics()
+        for canonical_id, node in other.nodes.items():
+            existing = nodes.get(canonical_id)
+            if existing is None:
+                nodes[canonical_id] = node
+                self._index_node(node, None)
+                statistics.nodes_added += 1
+            elif same_content(existing, node):
+                statistics.nodes_shared += 1
+            else:
+                statistics.nodes_conflicted += 1
+                if conflict_policy == 'replace':
+                    nodes[canonical_id] = node
+                    self._index_node(node, existing)
+
+        statistics.vertices_added = self._merge_sets(self.vertices, other.vertices)
+        self._merge_sets(self.node_vertex_info, other.node_vertex_info)
+
+        vertex_info = self.vertex_info
+        for vertex_id, info in other.vertex_info.items():
+            if vertex_id not in vertex_info:
+                vertex_info[vertex_id] = info
+                self._index_edge(info)
+                statistics.vertex_info_added += 1
+
+        return statistics
+
+    @staticmethod
+    def _merge_sets(target: dict, source: dict) -> int:
+        """
+        Unions a dictionary of sets into another.
+        :param target: Dictionary of Sets to update
+        :param source: Dictionary of Sets to merge
+        :return: Number of items added
+        """
+
+        added = 0
+        for key, values in source.items():
+            existing = target.get(key)
+            if existing is None:
+                target[key] = set(values)
+                added += len(values)
+            else:
+                size = len(existing)
+                existing |= values
+                added += len(existing) - size
+        return added
+
+    def _remove_vertex_info(self, vertex_info: VertexInfo) -> None:
+        """
+        Removes Vertex Info from the Graph and its indexes.
+        :param vertex_info: Vertex Info
+        :return: None
+        """
+
+        self.vertex_info.pop(vertex_info.vertx_id, None)
+        self._unindex_edge(vertex_info)
+        for canonical_id in (vertex_info.source_node, vertex_info.destination_node):
+            vertex_ids = self.node_vertex_info.get(canonical_id)
+            if vertex_ids is not None:
+                vertex_ids.discard(vertex_info.vertx_id)
+
+    def _index_edge(self, vertex_info: VertexInfo) -> None:
+        """
+        Adds Vertex Info to the indexes by relationship and by pair of Nodes.
+        :param vertex_info: Vertex Info
+        :return: None
+        """
+
+        source = vertex_info.source_node
+        destination = vertex_info.destination_node
+        self.edge_index[(source, destination, vertex_info.field_name)] = vertex_info
+        edges = self.pair_index.get((source, destination))
+        if edges is None:
+            edges = self.pair_index[(source, destination)] = {}
+        edges[vertex_info.field_name] = vertex_info
+
+    def _unindex_edge(self, vertex_info: VertexInfo) -> None:
+        """
+        Removes Vertex Info from the indexes by relationship and by pair of Nodes.
+        :param vertex_info: Vertex Info
+        :return: None
+        """
+
+        source = vertex_info.source_node
+        destination = vertex_info.destination_node
+        self.edge_index.pop((source, destination, vertex_info.field_name), None)
+        edges = self.pair_index.get((source, destination))
+        if edges is not None:
+            edges.pop(vertex_info.field_name, None)
+            if not edges:
+                del self.pair_index[(source, destination)]
+
+    def _remove_adjacency(self, source: str, destination: str) -> bool:
+        """
+        Removes the undirected adjacency between two Canonical IDs.
+        :param source: Source Canonical ID
+        :param destination: Destination Canonical ID
+        :return: True if the Canonical IDs were adjacent
+        """
+
+        related = self.vertices.get(source)
+        if related is None or destination not in related:
+            return False
+        related.discard(destination)
+        self.vertices.get(destination, set()).discard(source)
+        return True
+
+    def _index_node(self, node: BaseNode, previous: BaseNode | None) -> None:
+        """
+        Updates the Secondary Indexes for an added Node.
+
+        A replacement of the same type keeps its type entry, and each Index is only updated when
+        the indexed values changed.
+        :param node: Added Node
+        :param previous: Optional Node replaced by the added Node
+        :return: None
+        """
+
+        node_type = type(node).__name__
+        if previous is not None:
+            if type(previous).__name__ == node_type:
+                for index in self.attribute_indexes.get(node_type, ()):
+                    index.replace(previous, node)
+                return
+            self._unindex_node(previous)
+
+        ids = self.type_index.get(node_type)
+        if ids is None:
+            ids = self.type_index[node_type] = set()
+        ids.add(node.canonical_id)
+        for index in self.attribute_indexes.get(node_type, ()):
+            index.add(node)
+
+    def _unindex_node(self, node: BaseNode) -> None:
+        """
+        Removes a Node from the Secondary Indexes.
+        :param node: Removed or replaced Node
+        :return: None
+        """
+
+        node_type = type(node).__name__
+        self.type_index[node_type].discard(node.canonical_id)
+        for index in self.attribute_indexes.get(node_type, ()):
+            index.remove(node)
+
+    @classmethod
+    def merge_graphs(cls, graphs: Iterable['NodeGraph'],
+                     conflict_policy: str = 'keep') -> tuple['NodeGraph', MergeStatistics]:
+        """
+        Merges many Graphs into a new Graph.
+        :param graphs: Graphs to merge
+        :param conflict_policy: keep, replace or error
+        :return: Merged Graph and the combined Merge Statistics
+        """
+
+        merged = cls()
+        statistics = MergeStatistics()
+        for graph in graphs:
+            statistics.add(merged.merge(graph, conflict_policy))
+        return merged, statistics
+
+    def freeze(self) -> 'FrozenGraph':
+        """
+        Creates a read only Compressed Sparse Row snapshot of the Graph for traversal.
+        :return: Frozen Graph
+        """
+
+        return FrozenGraph(self)
+
+    def find_all_vertex_info(self, source_node: BaseNode,
+                             destination_node: BaseNode) -> list[VertexInfo]:
+        """
+        Retrieves the Vertex Info for every relationship from the Source to the Destination Node.
+        :param source_node: Source Node
+        :param destination_node: Destination Node
+        :return: List of Vertex Info in the order the relationships were added
+        """
+
+        edges = self.pair_index.get((source_node.canonical_id, destination_node.canonical_id))
+        return list(edges.values()) if edges else []
+
+
+class LockStripes:
+    """
+    Fixed set of Locks where every key is guarded by the Lock of its hash, so threads working on
+    different keys rarely wait for each other.
+    """
+
+    locks: tuple
+
+    def __init__(self, count: int = 64) -> None:
+        """
+        Constructor.
+        :param count: Number of Locks
+        """
+
+        if count < 1:
+            raise ValueError('Lock stripes need at least one lock')
+        self.locks = tuple(threading.Lock() for _ in range(count))
+
+    def hold(self, *keys: str) -> 'HeldLocks':
+        """
+        Guards the keys, every Lock is acquired once even when keys share it.
+        :param keys: Keys, like Canonical IDs
+        :return: Context Manager holding the Locks of the keys
+        """
+
+        count = len(self.locks)
+        return HeldLocks([self.locks[x] for x in sorted({hash(y) % count for y in keys})])
+
+    def hold_all(self) -> 'HeldLocks':
+        """
+        Guards every key.
+        :return: Context Manager holding every Lock
+        """
+
+        return HeldLocks(list(self.locks))
+
+
+class HeldLocks:
+    """
+    Context Manager acquiring Locks in stripe order, so threads cannot deadlock, and releasing
+    them in reverse order.
+    """
+
+    __slots__ = ('locks',)
+
+    def __init__(self, locks: list) -> None:
+        """
+        Constructor.
+        :param locks: Locks ordered by stripe
+        """
+
+        self.locks = locks
+
+    def __enter__(self) -> 'HeldLocks':
+        for lock in self.locks:
+            lock.acquire()
+        return self
+
+    def __exit__(self, *args) -> None:
+        for lock in reversed(self.locks):
+            lock.release()
+
+
+class ConcurrentNodeGraph(NodeGraph):
+    """
+    Node Graph which many threads can add Nodes and Vertices to, like threads mapping different
+    sections of a Document.
+
+    Writes to a Node and its relationships are guarded by the Lock stripe of its Canonical ID, so
+    adding a Vertex only waits for threads working on the same stripes. Removal, compaction,
+    merging and declaring Indexes hold every stripe. Reads are not guarded, read the Graph once
+    the writing threads are done or copy the returned sets.
+    """
+
+    stripes: LockStripes
+
+    def __init__(self, **kwargs) -> None:
+        """
+        Constructor.
+        :keyword string_pool: Pool interning the Canonical IDs and field names, None to disable
+        :keyword stripes: Number of Lock stripes, defaults to 64
+        """
+
+        super().__init__(**kwargs)
+        self.stripes = LockStripes(kwargs.get('stripes', 64))
+        self._index_lock = threading.RLock()
+        self._pool_lock = threading.Lock()
+
+    def add_node(self, node: BaseNode) -> None:
+        """
+        Adds or Updates a Node to the Graph.
+        :param node: Node to Add
+        :return: None
+        """
+
+        if self.string_pool is not None:
+            with self._pool_lock:
+                node.canonical_id = self.string_pool.intern(node.canonical_id)
+
+        with self.stripes.hold(node.canonical_id):
+            self._put_node(node)
+
+    def add_index(self, node_type: str, *attributes: str,
+                  ordered: bool = False) -> AttributeIndex | RangeIndex:
+        with self.stripes.hold_all():
+            return super().add_index(node_type, *attributes, ordered=ordered)
+
+    def add_vertex(self, source_node: BaseNode, destination_node: BaseNode,
+                   field: str | None) -> None:
+        """
+        Adds a Vertex for two Nodes.
+        :param source_node: Source Node
+        :param destination_node: Destination Node
+        :param field: Field Name associated to the Vertex.
+        :return: None
+        """
+
+        vertex_info = VertexInfo(source_node, destination_node, field) if field else None
+        self.add_vertex_with_info(source_node, destination_node, vertex_info)
+
+    def add_vertex_with_info(self, source_node: BaseNode, destination_node: BaseNode,
+                             vertex_info: VertexInfo | None) -> None:
+        """
+        Adds a Vertex to the Graph for two Nodes with Additional Information.
+
+        The Nodes, their adjacency and the Vertex Info are added while holding the stripes of
+        both Canonical IDs once.
+        :param source_node: Source Node
+        :param destination_node: Destination Node
+        :param vertex_info: Info about the relationship
+        :return: None
+        """
+
+        if self.string_pool is not None:
+            with self._pool_lock:
+                intern = self.string_pool.intern
+                source_node.canonical_id = intern(source_node.canonical_id)
+                destination_node.canonical_id = intern(destination_node.canonical_id)
+                if vertex_info:
+                    vertex_info.source_node = intern(vertex_info.source_node)
+                    vertex_info.destination_node = intern(vertex_info.destination_node)
+                    vertex_info.field_name = intern(vertex_info.field_name)
+
+        source = source_node.canonical_id
+        destination = destination_node.canonical_id
+        with self.stripes.hold(source, destination):
+            self._put_node(source_node)
+            self._put_node(destination_node)
+            vertices = self.vertices
+            vertices.setdefault(source, set()).add(destination)
+            vertices.setdefault(destination, set()).add(source)
+
+            if vertex_info:
+                self.vertex_info[vertex_info.vertx_id] = vertex_info
+                self.node_vertex_info.setdefault(source, set()).add(vertex_info.vertx_id)
+                self.node_vertex_info.setdefault(destination, set()).add(vertex_info.vertx_id)
+                self._index_edge(vertex_info)
+
+    def remove_node(self, node: BaseNode) -> bool:
+        with self.stripes.hold_all():
+            return super().remove_node(node)
+
+    def remove_nodes(self, nodes: Iterable[BaseNode]) -> int:
+        with self.stripes.hold_all():
+            return super().remove_nodes(nodes)
+
+    def remove_vertex(self, source_node: BaseNode, destination_node: BaseNode,
+                      field: str | None = None) -> bool:
+        with self.stripes.hold(source_node.canonical_id, destination_node.canonical_id):
+            return super().remove_vertex(source_node, destination_node, field)
+
+    def compact(self) -> None:
+        with self.stripes.hold_all(), self._pool_lock:
+            super().compact()
+
+    def merge(self, other: 'NodeGraph', conflict_policy: str = 'keep') -> MergeStatistics:
+        with self.stripes.hold_all():
+            return super().merge(other, conflict_policy)
+
+    def _put_node(self, node: BaseNode) -> None:
+        """
+        Stores a Node while holding the stripe of its Canonical ID.
+        :param node: Node to Add
+        :return: None
+        """
+
+        previous = self.nodes.get(node.canonical_id)
+        if previous is not node:
+            self.nodes[node.canonical_id] = node
+            self._index_node(node, previous)
+
+    def _index_node(self, node: BaseNode, previous: BaseNode | None) -> None:
+        with self._index_lock:
+            super()._index_node(node, previous)
+
+    def _unindex_node(self, node: BaseNode) -> None:
+        with self._index_lock:
+            super()._unindex_node(node)
+
+
+class FrozenGraph:
+    """
+    Read only Compressed Sparse Row (CSR) snapshot of a Node Graph.
+
+    Canonical IDs are mapped to dense integer ids. The undirected adjacency of the Graph is stored
+    in ``offsets``/``neighbors`` and the directed, labeled relationships in
+    ``edge_offsets``/``edge_targets``/``edge_fields`` where the field is an index into ``fields``.
+    """
+
+    ids: list
+    id_index: dict
+    nodes: list
+    fields: list
+    offsets: array
+    neighbors: array
+    edge_offsets: array
+    edge_targets: array
+    edge_fields: array
+
+    def __init__(self, graph: NodeGraph) -> None:
+        """
+        Constructor.
+        :param graph: Node Graph to snapshot
+        """
+
+        self.ids = list(graph.nodes)
+        self.id_index = {canonical_id: index for index, canonical_id in enumerate(self.ids)}
+        self.nodes = list(graph.nodes.values())
+        self.fields = []
+        field_index = {}
+
+        out_edges = {}
+        for vertex_info in graph.vertex_info.values():
+            field = field_index.get(vertex_info.field_name)
+            if field is None:
+                field = field_index[vertex_info.field_name] = len(self.fields)
+                self.fields.append(vertex_info.field_name)
+            out_edges.setdefault(vertex_info.source_node, []).append(
+                (self.id_index[vertex_info.destination_node], field))
+
+        self.offsets = array('q', [0])
+        self.neighbors = array('i')
+        self.edge_offsets = array('q', [0])
+        self.edge_targets = array('i')
+        self.edge_fields = array('i')
+
+        for canonical_id in self.ids:
+            self.neighbors.extend(self.id_index[x] for x in graph.vertices.get(canonical_id, ()))
+            self.offsets.append(len(self.neighbors))
+
+            for target, field in out_edges.get(canonical_id, ()):
+                self.edge_targets.append(target)
+                self.edge_fields.append(field)
+            self.edge_offsets.append(len(self.edge_targets))
+
+    def __len__(self) -> int:
+        """
+        Returns the number of Nodes in the Graph.
+        :return: Node Count
+        """
+
+        return len(self.ids)
+
+    def get_node(self, canonical_id: str) -> BaseNode | None:
+        """
+        Retrieves a Node by Canonical ID.
+        :param canonical_id: Canonical ID
+        :return: Optional Node
+        """
+
+        index = self.id_index.get(canonical_id)
+        return None if index is None else self.nodes[index]
+
+    def degree(self, canonical_id: str) -> int:
+        """
+        Returns the number of Nodes related to a Node.
+        :param canonical_id: Canonical ID
+        :return: Degree
+        """
+
+        index = self.id_index.get(canonical_id)
+        if index is None:
+            return 0
+        return self.offsets[index + 1] - self.offsets[index]
+
+    def get_vertices(self, canonical_id: str) -> list[str]:
+        """
+        Returns the Canonical IDs related to a Node.
+        :param canonical_id: Canonical ID
+        :return: List of Canonical IDs
+        """
+
+        index = self.id_index.get(canonical_id)
+        if index is None:
+            return []
+        ids = self.ids
+        return [ids[x] for x in self.neighbors[self.offsets[index]:self.offsets[index + 1]]]
+
+    def get_edges(self, canonical_id: str, field: str | None = None) -> list[tuple[str, str]]:
+        """
+        Returns the outgoing relationships of a Node.
+        :param canonical_id: Source Canonical ID
+        :param field: Optional Field Name to limit the relationships to
+        :return: List of Destination Canonical ID and Field Name pairs
+        """
+
+        index = self.id_index.get(canonical_id)
+        if index is None:
+            return []
+
+        start = self.edge_offsets[index]
+        end = self.edge_offsets[index + 1]
+        return [(self.ids[target], self.fields[label]) for target, label in
+                zip(self.edge_targets[start:end], self.edge_fields[start:end])
+                if field is None or self.fields[label] == field]
+
+    def traverse(self, canonical_id: str, max_depth: int | None = None,
+                 field: str | None = None) -> Iterator[tuple[str, int]]:
+        """
+        Breadth first traversal from a Node.
+
+        Without a field the undirected adjacency is followed, otherwise only outgoing
+        relationships with the Field Name.
+        :param canonical_id: Starting Canonical ID
+        :param max_depth: Optional maximum number of hops
+        :param field: Optional Field Name to follow
+        :return: Iterator of Canonical ID and Depth pairs, excluding the starting Node
+        """
+
+        start = self.id_index.get(canonical_id)
+        if start is None:
+            return
+
+        if field is None:
+            offsets, targets, labels, label = self.offsets, self.neighbors, None, -1
+        elif field in self.fields:
+            offsets, targets = self.edge_offsets, self.edge_targets
+            labels, label = self.edge_fields, self.fields.index(field)
+        else:
+            return
 
-        return None
+        ids = self.ids
+        visited = bytearray(len(ids))
+        visited[start] = 1
+        level = [start]
+        depth = 0
+        while level and (max_depth is None or depth < max_depth):
+            depth += 1
+            next_level = []
+            for index in level:
+                begin, end = offsets[index], offsets[index + 1]
+                if labels is None:
+                    related = targets[begin:end]
+                else:
+                    related = [target for target, target_label in
+                               zip(targets[begin:end], labels[begin:end]) if target_label == label]
+                for target in related:
+                    if not visited[target]:
+                        visited[target] = 1
+                        next_level.append(target)
+                        yield ids[target], depth
+            level = next_level
@@ -0,0 +1,251 @@
+"""
+Secondary Indexes of Node attributes maintained by Node Graphs.
+"""
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable
+from datetime import datetime, timezone
+from operator import attrgetter, itemgetter
+
+from nodes import BaseNode
+
+INSORT_LIMIT = 32
+
+
+def get_range_key(value: object) -> object:
+    """
+    Normalizes a value for ordering, naive datetimes are compared as UTC.
+    :param value: Attribute value
+    :return: Comparable value
+    """
+
+    if isinstance(value, datetime) and value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+class AttributeIndex:
+    """
+    Hash Index of the Canonical IDs of a Node type by the values of one or more attributes.
+
+    Keys are the attribute value for a single attribute and a tuple of values otherwise. Keys of a
+    single Node hold its Canonical ID instead of a set to save memory on unique values.
+    """
+
+    node_type: str
+    attributes: tuple[str, ...]
+    entries: dict
+    get_key: Callable[[BaseNode], object]
+
+    def __init__(self, node_type: str, attributes: tuple[str, ...]) -> None:
+        """
+        Constructor.
+        :param node_type: Node class name
+        :param attributes: Indexed attribute names
+        """
+
+        self.node_type = node_type
+        self.attributes = attributes
+        self.entries = {}
+        self.get_key = attrgetter(*attributes)
+
+    def add(self, node: BaseNode) -> None:
+        """
+        Adds a Node to the Index.
+        :param node: Node
+        :return: None
+        """
+
+        key = self.get_key(node)
+        ids = self.entries.get(key)
+        if ids is None:
+            self.entries[key] = node.canonical_id
+        elif isinstance(ids, set):
+            ids.add(node.canonical_id)
+        elif ids != node.canonical_id:
+            self.entries[key] = {ids, node.canonical_id}
+
+    def remove(self, node: BaseNode) -> None:
+        """
+        Removes a Node from the Index.
+        :param node: Node
+        :return: None
+        """
+
+        key = self.get_key(node)
+        ids = self.entries.get(key)
+        if isinstance(ids, set):
+            ids.discard(node.canonical_id)
+            if len(ids) == 1:
+                self.entries[key] = ids.pop()
+        elif ids == node.canonical_id:
+            del self.entries[key]
+
+    def replace(self, previous: BaseNode, node: BaseNode) -> None:
+        """
+        Updates the Index for a Node replacing another one with the same Canonical ID.
+        :param previous: Replaced Node
+        :param node: Added Node
+        :return: None
+        """
+
+        if self.get_key(previous) != self.get_key(node):
+            self.remove(previous)
+            self.add(node)
+
+    def find(self, values: dict) -> set:
+        """
+        Finds the Canonical IDs of the Nodes with the given values.
+        :param values: Value of every indexed attribute
+        :return: Set of Canonical IDs
+        """
+
+        if len(self.attributes) == 1:
+            ids = self.entries.get(values[self.attributes[0]])
+        else:
+            ids = self.entries.get(tuple(values[x] for x in self.attributes))
+
+        if ids is None:
+            return set()
+        return ids if isinstance(ids, set) else {ids}
+
+    def compact(self) -> None:
+        """
+        Rebuilds the entries at their current size.
+        :return: None
+        """
+
+        self.entries = dict(self.entries)
+
+
+class RangeIndex:
+    """
+    Ordered Index of the Canonical IDs of a Node type by an attribute, like a date.
+
+    Added Nodes are buffered and merged into the sorted keys on the next lookup, a few at a time
+    with ``insort`` and otherwise with a single sort, so building the Index costs one sort.
+    Removed Nodes leave the buffer directly or are tombstoned until the next rebuild, instead of
+    deleting from the sorted keys. Nodes with a None value are not indexed.
+    """
+
+    node_type: str
+    attribute: str
+
+    def __init__(self, node_type: str, attribute: str) -> None:
+        """
+        Constructor.
+        :param node_type: Node class name
+        :param attribute: Indexed attribute name
+        """
+
+        self.node_type = node_type
+        self.attribute = attribute
+        self._keys = []
+        self._ids = []
+        self._pending = {}
+        self._removed = set()
+
+    def __len__(self) -> int:
+        return len(self._keys) - len(self._removed) + len(self._pending)
+
+    def add(self, node: BaseNode) -> None:
+        """
+        Adds a Node to the Index.
+        :param node: Node
+        :return: None
+        """
+
+        value = getattr(node, self.attribute)
+        if value is not None:
+            self._pending[node.canonical_id] = get_range_key(value)
+
+    def remove(self, node: BaseNode) -> None:
+        """
+        Removes a Node from the Index.
+        :param node: Node
+        :return: None
+        """
+
+        value = getattr(node, self.attribute)
+        if value is None or self._pending.pop(node.canonical_id, None) is not None:
+            return
+
+        key = get_range_key(value)
+        position = bisect_left(self._keys, key)
+        while position < len(self._keys) and self._keys[position] == key:
+            if self._ids[position] == node.canonical_id:
+                self._removed.add(node.canonical_id)
+                if len(self._removed) * 2 > len(self._keys):
+                    self._rebuild()
+                return
+            position += 1
+
+    def replace(self, previous: BaseNode, node: BaseNode) -> None:
+        """
+        Updates the Index for a Node replacing another one with the same Canonical ID.
+        :param previous: Replaced Node
+        :param node: Added Node
+        :return: None
+        """
+
+        if getattr(previous, self.attribute) != getattr(node, self.attribute):
+            self.remove(previous)
+            self.add(node)
+
+    def find(self, low: object = None, high: object = None) -> list[str]:
+        """
+        Finds the Canonical IDs of the Nodes with values from low, inclusive, to high, exclusive.
+        :param low: Optional lower bound, unbounded when None
+        :param high: Optional upper bound, unbounded when None
+        :return: Canonical IDs ordered by value
+        """
+
+        self._merge_pending()
+        start = 0 if low is None else bisect_left(self._keys, get_range_key(low))
+        end = len(self._keys) if high is None else bisect_left(self._keys, get_range_key(high))
+        if self._removed:
+            return [x for x in self._ids[start:end] if x not in self._removed]
+        return self._ids[start:end]
+
+    def compact(self) -> None:
+        """
+        Merges the buffered Nodes, drops the tombstones and rebuilds the keys at their current
+        size.
+        :return: None
+        """
+
+        self._rebuild()
+
+    def _merge_pending(self) -> None:
+        """
+        Merges the buffered Nodes into the sorted keys.
+        :return: None
+        """
+
+        if not self._pending:
+            return
+        if self._removed or len(self._pending) > INSORT_LIMIT:
+            self._rebuild()
+            return
+
+        for canonical_id, key in self._pending.items():
+            position = bisect_right(self._keys, key)
+            self._keys.insert(position, key)
+            self._ids.insert(position, canonical_id)
+        self._pending = {}
+
+    def _rebuild(self) -> None:
+        """
+        Sorts the live and buffered Nodes into new keys, dropping the tombstones.
+        :return: None
+        """
+
+        removed = self._removed
+        entries = [x for x in zip(self._keys, self._ids) if x[1] not in removed] \
+            if removed else list(zip(self._keys, self._ids))
+        entries.extend((y, x) for x, y in self._pending.items())
+        entries.sort(key=itemgetter(0))
+        self._keys = [x for x, _ in entries]
+        self._ids = [x for _, x in entries]
+        self._pending = {}
+        self._removed = set()
@@ -0,0 +1,76 @@
+"""
+String Interning shared by the Nodes and Vertices of a Graph.
+"""
+
+import sys
+from collections.abc import Iterable
+
+
+class StringPool:
+    """
+    Pool holding a single instance of every distinct String, like Canonical IDs and code system
+    OIDs, so repeated values share one object.
+
+    Unlike ``sys.intern`` the pool is scoped to its owner and released together with it.
+    """
+
+    strings: dict
+    lookups: int
+    duplicates: int
+    saved_bytes: int
+
+    def __init__(self) -> None:
+        """
+        Constructor.
+        """
+
+        self.strings = {}
+        self.lookups = 0
+        self.duplicates = 0
+        self.saved_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self.strings)
+
+    def __contains__(self, value: str) -> bool:
+        return value in self.strings
+
+    def intern(self, value: str | None) -> str | None:
+        """
+        Retrieves the pooled instance of a String, adding it on first use.
+        :param value: String
+        :return: Pooled String, None for None
+        """
+
+        if value is None:
+            return None
+
+        self.lookups += 1
+        pooled = self.strings.setdefault(value, value)
+        if pooled is not value:
+            self.duplicates += 1
+            self.saved_bytes += sys.getsizeof(value)
+        return pooled
+
+    def retain(self, strings: Iterable[str]) -> None:
+        """
+        Drops the pooled Strings which are not in use anymore.
+        :param strings: Strings in use
+        :return: None
+        """
+
+        self.strings = {x: x for x in (self.strings.get(y, y) for y in strings)}
+
+    def memory_report(self) -> dict:
+        """
+        Reports the size of the pool and the memory saved by sharing Strings.
+        :return: Dictionary of strings, pooled_bytes, lookups, duplicates and saved_bytes
+        """
+
+        return {
+            'strings': len(self.strings),
+            'pooled_bytes': sum(sys.getsizeof(x) for x in self.strings),
+            'lookups': self.lookups,
+            'duplicates': self.duplicates,
+            'saved_bytes': self.saved_bytes
+        }
@@ -0,0 +1,180 @@
+"""
+Lazy Nodes reading their fields from the source Element on first access.
+"""
+
+from collections.abc import Callable
+from dataclasses import fields
+from datetime import datetime
+
+from lxml import etree
+from lxml.etree import ElementBase
+
+from nodes import BaseNode, IdentifierNode, CodeNode, ContactNode, AddressNode, NameNode
+from timestamps import parse_timestamp
+
+
+class LazyField:
+    """
+    Descriptor loading a Node field from the source Element on first access and caching it in
+    the slot of the field.
+    """
+
+    __slots__ = ('slot', 'loader')
+
+    def __init__(self, slot, loader: Callable[[ElementBase], object]) -> None:
+        """
+        Constructor.
+        :param slot: Slot descriptor of the field
+        :param loader: Function reading the value from the Element
+        """
+
+        self.slot = slot
+        self.loader = loader
+
+    def __get__(self, instance: 'LazyNode | None', owner: type | None = None) -> object:
+        if instance is None:
+            return self
+
+        try:
+            return self.slot.__get__(instance, owner)
+        except AttributeError:
+            value = self.loader(instance.element)
+            self.slot.__set__(instance, value)
+            return value
+
+    def __set__(self, instance: 'LazyNode', value: object) -> None:
+        self.slot.__set__(instance, value)
+
+
+class LazyNode:
+    """
+    Mixin of Lazy Nodes holding the source Element until every field is loaded.
+
+    The Element keeps its Document in memory, so call ``load`` before releasing or clearing the
+    Element, like when streaming with the DocumentReader. Lazy Nodes are pickled as regular Nodes.
+    """
+
+    __slots__ = ()
+
+    node_class: type[BaseNode]
+    lazy_fields: tuple[str, ...]
+
+    @classmethod
+    def from_element(cls, element: ElementBase, **values) -> 'LazyNode':
+        """
+        Creates a Lazy Node with the eagerly read values.
+        :param element: Source Element
+        :param values: Values of the fields which are not lazy
+        :return: Lazy Node
+        """
+
+        node = cls.__new__(cls)
+        node.element = element
+        for name, value in values.items():
+            setattr(node, name, value)
+        return node
+
+    def load(self) -> 'LazyNode':
+        """
+        Loads every lazy field and releases the source Element.
+        :return: This Node
+        """
+
+        if self.element is not None:
+            for name in self.lazy_fields:
+                getattr(self, name)
+            self.element = None
+        return self
+
+    def __reduce__(self) -> tuple:
+        return build_node, (self.node_class, {x.name: getattr(self, x.name) for x in fields(self)})
+
+
+def build_node(node_class: type[BaseNode], values: dict) -> BaseNode:
+    """
+    Creates a regular Node from its field values.
+    :param node_class: Node Class
+    :param values: Field values
+    :return: Node
+    """
+
+    return node_class(**values)
+
+
+def lazy_node_class(node_class: type[BaseNode],
+                    loaders: dict[str, Callable[[ElementBase], object]]) -> type:
+    """
+    Creates the Lazy variant of a Node Class.
+
+    The variant keeps the name of the Node Class, so exporters and serializers label its Nodes
+    like regular ones.
+    :param node_class: Node Class
+    :param loaders: Functions reading the lazy fields from the source Element
+    :return: Lazy Node Class
+    """
+
+    namespace = {
+        '__slots__': ('element',),
+        '__module__': __name__,
+        '__qualname__': f"Lazy{node_class.__name__}",
+        'node_class': node_class,
+        'lazy_fields': tuple(loaders)
+    }
+    for name, loader in loaders.items():
+        namespace[name] = LazyField(getattr(node_class, name), loader)
+    return type(node_class.__name__, (LazyNode, node_class), namespace)
+
+
+def get_child_text(element: ElementBase, name: str, separator: str = ' ') -> str:
+    """
+    Joins the normalized texts of the children of an Element with a local name.
+    :param element: Parent Element
+    :param name: Local name of the children
+    :param separator: Separator
+    :return: Joined Text
+    """
+
+    return separator.join(text for text in (' '.join((x.text or '').split())
+                                            for x in element.iterchildren(etree.Element)
+                                            if x.tag.rpartition('}')[2] == name) if text)
+
+
+def get_valid_time(element: ElementBase, boundary: str) -> datetime | None:
+    """
+    Reads a boundary of the validTime of an Element.
+    :param element: Parent Element
+    :param boundary: low or high
+    :return: Optional Datetime
+    """
+
+    for valid_time in element.iterchildren(etree.Element):
+        if valid_time.tag.rpartition('}')[2] == 'validTime':
+            for child in valid_time.iterchildren(etree.Element):
+                if child.tag.rpartition('}')[2] == boundary:
+                    return parse_timestamp(child.get('value'))
+    return None
+
+
+LazyIdentifierNode = lazy_node_class(IdentifierNode, {
+    'assign_authority': lambda x: x.get('assigningAuthorityName', '')
+})
+
+LazyCodeNode = lazy_node_class(CodeNode, {
+    'code_system_name': lambda x: x.get('codeSystemName', ''),
+    'code_system_version': lambda x: x.get('codeSystemVersion', ''),
+    'display_name': lambda x: x.get('displayName', '')
+})
+
+LazyContactNode = lazy_node_class(ContactNode, {
+    'use': lambda x: x.get('use', '')
+})
+
+LazyAddressNode = lazy_node_class(AddressNode, {
+    'type': lambda x: x.get('type', ''),
+    'county': lambda x: get_child_text(x, 'county')
+})
+
+LazyNameNode = lazy_node_class(NameNode, {
+    'valid_start_date': lambda x: get_valid_time(x, 'low'),
+    'valid_end_date': lambda x: get_valid_time(x, 'high')
+})
@@ -0,0 +1,409 @@
+"""
+Declarative Section Mappings compiled to single pass Extraction Plans.
+"""
+
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+
+from lxml import etree
+from lxml.etree import ElementBase
+
+from factories import NodeFactory
+from graphs import NodeGraph
+from nodes import BaseNode, EncounterNode, GeneralEntityNode
+from readers import SectionIndex
+from timestamps import parse_timestamp
+
+BUILDERS = {
+    'code': 'build_code_node',
+    'identifier': 'build_identifier_node',
+    'address': 'build_address_node',
+    'contact': 'build_contact_node',
+    'name': 'build_name_node'
+}
+
+PARENT = '..'
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class FieldMapping:
+    """
+    Maps a Node field to an attribute or the text of the mapped Element or of a descendant.
+    """
+
+    path: str = ''
+    attribute: str | None = None
+    convert: Callable[[str], object] | None = None
+    default: object = ''
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class EdgeMapping:
+    """
+    Maps the descendants at a path to Nodes related by a field, built either by a NodeFactory
+    builder (code, identifier, address, contact or name) or by a nested Node Mapping.
+    """
+
+    path: str
+    field: str
+    builder: str | None = None
+    node: 'NodeMapping | None' = None
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class NodeMapping:
+    """
+    Maps an Element to a Node.
+
+    The Canonical ID is derived from the ``identity`` values: field names, builder edge fields
+    (the Canonical IDs of the related Nodes) or ``PARENT`` for the Canonical ID of the parent
+    Node. Constants never identify a Node on their own: without other identity values the
+    position of the Element in the Document is used.
+    """
+
+    node_class: type[BaseNode]
+    fields: dict[str, FieldMapping] = field(default_factory=dict)
+    constants: dict[str, object] = field(default_factory=dict)
+    identity: tuple[str, ...] = ()
+    edges: tuple[EdgeMapping, ...] = ()
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class SectionMapping:
+    """
+    Maps the Elements at a path of every entry of a Section, found by template id, to Nodes.
+    """
+
+    template_id: str
+    extension: str | None = None
+    path: str
+    node: NodeMapping
+
+
+class PlanStep:
+    """
+    Step of an Extraction Plan matching a child Element by tag.
+    """
+
+    __slots__ = ('slots', 'children')
+
+    slots: list[int]
+    children: dict[str, 'PlanStep']
+
+    def __init__(self) -> None:
+        """
+        Constructor.
+        """
+
+        self.slots = []
+        self.children = {}
+
+
+class NodePlan:
+    """
+    Compiled Node Mapping collecting every Element it reads in one walk of the mapped Element.
+    """
+
+    __slots__ = ('mapping', 'steps', 'size', 'fields', 'builder_edges', 'node_edges')
+
+    mapping: NodeMapping
+    steps: dict[str, PlanStep]
+    size: int
+    fields: list[tuple]
+    builder_edges: list[tuple]
+    node_edges: list[tuple]
+
+    def __init__(self, mapping: NodeMapping, namespaces: dict) -> None:
+        """
+        Constructor.
+        :param mapping: Node Mapping
+        :param namespaces: Namespaces of the mapping paths
+        """
+
+        self.mapping = mapping
+        self.steps = {}
+        self.size = 0
+        self.fields = []
+        self.builder_edges = []
+        self.node_edges = []
+
+        for name, field_mapping in mapping.fields.items():
+            slot = self._add_path(field_mapping.path, namespaces) if field_mapping.path else None
+            self.fields.append((name, slot, field_mapping))
+
+        for edge in mapping.edges:
+            if (edge.builder is None) == (edge.node is None):
+                raise ValueError(f"Edge {edge.field} needs either a builder or a node mapping")
+            slot = self._add_path(edge.path, namespaces)
+            if edge.node is not None:
+                self.node_edges.append((edge.field, slot, NodePlan(edge.node, namespaces)))
+            elif edge.builder in BUILDERS:
+                self.builder_edges.append((edge.field, slot, edge.builder))
+            else:
+                raise ValueError(f"Unknown builder: {edge.builder}")
+
+    def collect(self, element: ElementBase) -> list[list[ElementBase]]:
+        """
+        Collects the Elements at every path of the Plan in a single walk.
+        :param element: Mapped Element
+        :return: Elements per slot
+        """
+
+        slots = [[] for _ in range(self.size)]
+        self._walk(element, self.steps, slots)
+        return slots
+
+    def _add_path(self, path: str, namespaces: dict) -> int:
+        """
+        Adds the steps of a path to the Plan.
+        :param path: Relative path of child steps, like v3:performer/v3:assignedEntity
+        :param namespaces: Namespaces of the path prefixes
+        :return: Slot collecting the Elements at the path
+        """
+
+        steps = self.steps
+        step = None
+        for tag in compile_path(path, namespaces):
+            step = steps.get(tag)
+            if step is None:
+                step = steps[tag] = PlanStep()
+            steps = step.children
+
+        slot = self.size
+        self.size += 1
+        step.slots.append(slot)
+        return slot
+
+    @classmethod
+    def _walk(cls, element: ElementBase, steps: dict[str, PlanStep],
+              slots: list[list[ElementBase]]) -> None:
+        """
+        Walks the children of an Element matching the Plan steps.
+        :param element: Element
+        :param steps: Plan steps by tag
+        :param slots: Elements per slot
+        :return: None
+        """
+
+        for child in element.iterchildren(etree.Element):
+            step = steps.get(child.tag)
+            if step is not None:
+                for slot in step.slots:
+                    slots[slot].append(child)
+                if step.children:
+                    cls._walk(child, step.children, slots)
+
+
+def compile_path(path: str, namespaces: dict) -> list[str]:
+    """
+    Converts a relative path of child steps to Clark notation tags.
+    :param path: Path like ./v3:effectiveTime/v3:low
+    :param namespaces: Namespaces of the path prefixes
+    :return: List of tags
+    """
+
+    tags = []
+    for segment in path.split('/'):
+        if segment in ('', '.'):
+            continue
+        prefix, _, name = segment.rpartition(':')
+        if prefix and prefix not in namespaces:
+            raise ValueError(f"Unknown namespace prefix in path: {path}")
+        tags.append(f"{{{namespaces[prefix]}}}{name}" if prefix else name)
+
+    if not tags:
+        raise ValueError(f"Empty mapping path: {path}")
+    return tags
+
+
+class SectionMapper:
+    """
+    Maps the Sections of a Document to a Node Graph with declarative Section Mappings.
+
+    Mappings are compiled once to Extraction Plans, so each mapped Element is walked a single
+    time and the Nodes are built by the NodeFactory builders. Instances can be used as the mapper
+    of a BatchIngestor or IngestPipeline.
+    """
+
+    namespaces: dict
+    mappings: list[SectionMapping]
+
+    def __init__(self, namespaces: dict, mappings: Iterable[SectionMapping]) -> None:
+        """
+        Constructor.
+        :param namespaces: Document Namespaces
+        :param mappings: Section Mappings
+        """
+
+        self.namespaces = namespaces
+        self.mappings = list(mappings)
+        self._plans = [(x, compile_path(x.path, namespaces), NodePlan(x.node, namespaces))
+                       for x in self.mappings]
+
+    def __call__(self, document: ElementBase, factory: NodeFactory) -> NodeGraph:
+        return self.map(document, factory)
+
+    def map(self, document: ElementBase, factory: NodeFactory,
+            graph: NodeGraph | None = None) -> NodeGraph:
+        """
+        Maps the entries of every mapped Section of a Document.
+        :param document: ClinicalDocument Element
+        :param factory: Node Factory of the Document
+        :param graph: Optional Graph to add the Nodes to
+        :return: Node Graph
+        """
+
+        if graph is None:
+            graph = NodeGraph(string_pool=factory.string_pool)
+
+        section_index = SectionIndex(self.namespaces, document)
+        for mapping, tags, plan in self._plans:
+            for entry in section_index.get_entries(mapping.template_id, mapping.extension):
+                for element in self._find_descendants(entry, tags):
+                    self.map_element(element, plan, factory, graph)
+        return graph
+
+    def map_element(self, element: ElementBase, plan: NodePlan, factory: NodeFactory,
+                    graph: NodeGraph, parent_id: str | None = None) -> BaseNode:
+        """
+        Maps an Element and its related Elements to Nodes.
+        :param element: Mapped Element
+        :param plan: Node Plan
+        :param factory: Node Factory
+        :param graph: Graph to add the Nodes to
+        :param parent_id: Optional Canonical ID of the parent Node
+        :return: Node
+        """
+
+        mapping = plan.mapping
+        slots = plan.collect(element)
+
+        values = dict(mapping.constants)
+        for name, slot, field_mapping in plan.fields:
+            values[name] = self._get_value(element if slot is None else
+                                           (slots[slot][0] if slots[slot] else None),
+                                           field_mapping)
+
+        related = []
+        related_ids = {}
+        for field_name, slot, builder in plan.builder_edges:
+            build = getattr(factory, BUILDERS[builder])
+            for child in slots[slot]:
+                node = build(child)
+                if node is None:
+                    continue
+                related.append((field_name, node))
+                related_ids.setdefault(field_name, []).append(node.canonical_id)
+                if builder == 'code':
+                    for translation in factory.build_code_translations(child):
+                        graph.add_vertex(node, translation, 'translation')
+
+        identity = []
+        identified = False
+        for name in mapping.identity:
+            if name == PARENT:
+                identity_values = [parent_id]
+            elif name in related_ids:
+                identity_values = related_ids[name]
+            else:
+                identity_values = [values.get(name)]
+            identity.extend(identity_values)
+            if name not in mapping.constants:
+                identified = identified or any(x is not None and str(x).strip()
+                                               for x in identity_values)
+        node_type = mapping.node_class.__name__
+        if not identified:
+            identity = [factory.doc_id, factory.doc_source_id, parent_id,
+                        element.getroottree().getpath(element)]
+
+        node = mapping.node_class(context=factory.context,
+                                  canonical_id=factory.string_pool.intern(
+                                      factory.build_canonical_id(node_type, *identity)),
+                                  **values)
+        graph.add_node(node)
+
+        for field_name, related_node in related:
+            graph.add_vertex(node, related_node, field_name)
+
+        for field_name, slot, node_plan in plan.node_edges:
+            for child in slots[slot]:
+                graph.add_vertex(node, self.map_element(child, node_plan, factory, graph,
+                                                        node.canonical_id), field_name)
+        return node
+
+    @staticmethod
+    def _get_value(element: ElementBase | None, field_mapping: FieldMapping) -> object:
+        """
+        Reads a field value from an Element.
+        :param element: Optional Element
+        :param field_mapping: Field Mapping
+        :return: Value, the default when missing
+        """
+
+        if element is None:
+            return field_mapping.default
+
+        if field_mapping.attribute is None:
+            value = ' '.join((element.text or '').split())
+        else:
+            value = element.get(field_mapping.attribute)
+
+        if not value:
+            return field_mapping.default
+        return value if field_mapping.convert is None else field_mapping.convert(value)
+
+    @staticmethod
+    def _find_descendants(element: ElementBase, tags: list[str]) -> list[ElementBase]:
+        """
+        Finds the descendants of an Element at a path of tags.
+        :param element: Element
+        :param tags: Path tags
+        :return: List of Elements
+        """
+
+        elements = [element]
+        for tag in tags:
+            elements = [y for x in elements for y in x.iterchildren(tag)]
+        return elements
+
+
+IDENTIFIER_EDGE = EdgeMapping(path='v3:id', field='id', builder='identifier')
+CODE_EDGE = EdgeMapping(path='v3:code', field='code', builder='code')
+ADDRESS_EDGE = EdgeMapping(path='v3:addr', field='addr', builder='address')
+TELECOM_EDGE = EdgeMapping(path='v3:telecom', field='telecom', builder='contact')
+
+ENCOUNTER_SECTION = SectionMapping(
+    template_id='2.16.840.1.113883.10.20.22.2.22',
+    path='v3:encounter',
+    node=NodeMapping(
+        node_class=EncounterNode,
+        fields={
+            'status_code': FieldMapping(path='v3:statusCode', attribute='code'),
+            'encounter_start': FieldMapping(path='v3:effectiveTime/v3:low', attribute='value',
+                                            convert=parse_timestamp, default=None),
+            'encounter_end': FieldMapping(path='v3:effectiveTime/v3:high', attribute='value',
+                                          convert=parse_timestamp, default=None)
+        },
+        identity=('id',),
+        edges=(
+            IDENTIFIER_EDGE,
+            CODE_EDGE,
+            EdgeMapping(path='v3:performer/v3:assignedEntity', field='performer', node=NodeMapping(
+                node_class=GeneralEntityNode,
+                constants={'class_code': 'ASSIGNED'},
+                identity=('class_code', 'id'),
+                edges=(
+                    IDENTIFIER_EDGE,
+                    CODE_EDGE,
+                    ADDRESS_EDGE,
+                    TELECOM_EDGE,
+                    EdgeMapping(path='v3:assignedPerson', field='assignedPerson', node=NodeMapping(
+                        node_class=BaseNode,
+                        identity=(PARENT,),
+                        edges=(EdgeMapping(path='v3:name', field='name', builder='name'),)))))),
+            EdgeMapping(path='v3:participant/v3:participantRole', field='location',
+                        node=NodeMapping(
+                            node_class=GeneralEntityNode,
+                            fields={'class_code': FieldMapping(attribute='classCode')},
+                            identity=('class_code', 'id'),
+                            edges=(IDENTIFIER_EDGE, CODE_EDGE, ADDRESS_EDGE, TELECOM_EDGE))))))
@@ -6,22 +6,73 @@ from datetime import datetime
 from dataclasses import dataclass
 
 
-@dataclass(kw_only=True)
-class BaseNode:
+@dataclass(frozen=True, kw_only=True, slots=True)
+class DocumentContext:
     """
-    Base Node Class with common field structures.
+    Document and ETL provenance shared by every Node created from a Document.
     """
 
     doc_id: int
     doc_source_id: str
-    canonical_id: str
     etl_dg_code: int
     etl_load_datetime: datetime
     etl_src_inc_datetime: datetime
     etl_src_sys_id: int
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
+class BaseNode:
+    """
+    Base Node Class with common field structures.
+    """
+
+    context: DocumentContext
+    canonical_id: str
+
+    @property
+    def doc_id(self) -> int:
+        """
+        Document Id of the Document Context.
+        """
+        return self.context.doc_id
+
+    @property
+    def doc_source_id(self) -> str:
+        """
+        Document Source Id of the Document Context.
+        """
+        return self.context.doc_source_id
+
+    @property
+    def etl_dg_code(self) -> int:
+        """
+        ETL Code of the Document Context.
+        """
+        return self.context.etl_dg_code
+
+    @property
+    def etl_load_datetime(self) -> datetime:
+        """
+        ETL Load Datetime of the Document Context.
+        """
+        return self.context.etl_load_datetime
+
+    @property
+    def etl_src_inc_datetime(self) -> datetime:
+        """
+        Source included Datetime of the Document Context.
+        """
+        return self.context.etl_src_inc_datetime
+
+    @property
+    def etl_src_sys_id(self) -> int:
+        """
+        ETL Source Id of the Document Context.
+        """
+        return self.context.etl_src_sys_id
+
+
+@dataclass(kw_only=True, slots=True)
 class IdentifierNode(BaseNode):
     """
     Node for capturing Identifier Data Type Information
@@ -32,7 +83,7 @@ class IdentifierNode(BaseNode):
     assign_authority: str
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class CodeNode(BaseNode):
     """
     Node for capturing coded information.
@@ -45,7 +96,7 @@ class CodeNode(BaseNode):
     display_name: str
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class NameNode(BaseNode):
     """
     Node for capturing a Person's Name
@@ -60,7 +111,7 @@ class NameNode(BaseNode):
     valid_end_date: datetime | None
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class AddressNode(BaseNode):
     """
     Node for capturing Address Information.
@@ -76,7 +127,7 @@ class AddressNode(BaseNode):
     postal_code: str
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class EncounterNode(BaseNode):
     """
     Node for Capturing Encounter information.
@@ -87,7 +138,7 @@ class EncounterNode(BaseNode):
     encounter_end: datetime
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class GeneralEntityNode(BaseNode):
     """
     Denotes a General Entity Node like a Person, or Assigned Entity
@@ -96,7 +147,7 @@ class GeneralEntityNode(BaseNode):
     class_code: str
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class DiagnosisNode(BaseNode):
     """
     Denotes a Basic Diagnosis Node.
@@ -108,7 +159,7 @@ class DiagnosisNode(BaseNode):
     effective_end_datetime: datetime
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class ContactNode(BaseNode):
     """
     Denotes a Node for Capturing Contact Information
@@ -0,0 +1,194 @@
+"""
+Asyncio Ingestion Pipeline for C-CDA Documents.
+"""
+
+import asyncio
+import logging
+from collections.abc import AsyncIterable, Awaitable, Callable
+from concurrent.futures import Executor
+
+from lxml import etree
+from lxml.etree import ElementBase
+
+from factories import NodeFactory
+from graphs import NodeGraph
+
+_DONE = object()
+
+
+class IngestPipeline:
+    """
+    Pipeline of Source, Parse, Map and Sink stages joined by bounded queues.
+
+    The Source yields Document Id and Document Bytes pairs. Parsing and mapping are offloaded to
+    an Executor, each with a configurable number of concurrent workers, and the Sink is awaited
+    with each Document Id and Graph. A full queue suspends the stage feeding it, so a slow Sink
+    holds back the Source. When preserving order the Source also waits while the Documents read
+    and not yet delivered fill the reorder window, the larger of the queue size and the number of
+    workers, so a slow Document cannot make the Graphs behind it pile up. A failure in any stage cancels the others and is raised from run.
+    """
+
+    namespaces: dict
+    mapper: Callable[[ElementBase, NodeFactory], NodeGraph]
+    parse_concurrency: int
+    map_concurrency: int
+    queue_size: int
+    preserve_order: bool
+    executor: Executor | None
+    factory_kwargs: dict
+    logger: logging.Logger
+
+    def __init__(self, namespaces: dict, mapper: Callable[[ElementBase, NodeFactory], NodeGraph],
+                 **kwargs) -> None:
+        """
+        Constructor.
+        :param namespaces: Document Namespaces
+        :param mapper: Callable mapping a ClinicalDocument Element and Node Factory to a Graph
+        :keyword parse_concurrency: Number of concurrent Parse workers
+        :keyword map_concurrency: Number of concurrent Map workers
+        :keyword queue_size: Maximum number of Documents waiting between two stages
+        :keyword preserve_order: Deliver Graphs to the Sink in Source order
+        :keyword executor: Executor for the Parse and Map stages, the loop default when omitted
+        :keyword factory_kwargs: Additional Node Factory keywords like etl_dg_code
+        """
+
+        self.namespaces = namespaces
+        self.mapper = mapper
+        self.parse_concurrency = kwargs.get('parse_concurrency', 2)
+        self.map_concurrency = kwargs.get('map_concurrency', 2)
+        self.queue_size = kwargs.get('queue_size', 16)
+        self.preserve_order = kwargs.get('preserve_order', True)
+        self.executor = kwargs.get('executor')
+        self.factory_kwargs = kwargs.get('factory_kwargs', {})
+        self.logger = logging.getLogger(__name__)
+
+    async def run(self, source: AsyncIterable[tuple[int, bytes]],
+                  sink: Callable[[int, NodeGraph], Awaitable[None]]) -> int:
+        """
+        Runs the Pipeline until the Source is exhausted.
+        :param source: Async Iterable of Document Id and Document Bytes pairs
+        :param sink: Coroutine Function receiving each Document Id and Graph
+        :return: Number of Documents delivered to the Sink
+        """
+
+        parse_queue = asyncio.Queue(self.queue_size)
+        map_queue = asyncio.Queue(self.queue_size)
+        sink_queue = asyncio.Queue(self.queue_size)
+        window = asyncio.Semaphore(max(self.queue_size,
+                                       self.parse_concurrency + self.map_concurrency)) \
+            if self.preserve_order else None
+
+        try:
+            async with asyncio.TaskGroup() as group:
+                group.create_task(self._produce(source, parse_queue, window))
+                group.create_task(self._run_stage(parse_queue, map_queue, self._parse,
+                                                  self.parse_concurrency))
+                group.create_task(self._run_stage(map_queue, sink_queue, self._map,
+                                                  self.map_concurrency))
+                delivered = group.create_task(self._consume(sink_queue, sink, window))
+        except BaseExceptionGroup as errors:
+            error = errors
+            while isinstance(error, BaseExceptionGroup):
+                error = error.exceptions[0]
+            self.logger.error('Ingestion pipeline failed: %s', error)
+            raise error from errors
+
+        return delivered.result()
+
+    @staticmethod
+    async def _produce(source: AsyncIterable[tuple[int, bytes]], queue: asyncio.Queue,
+                       window: asyncio.Semaphore | None) -> None:
+        """
+        Reads the Source into the Parse queue with a sequence number.
+        :param source: Async Iterable of Document Id and Document Bytes pairs
+        :param queue: Parse Queue
+        :param window: Optional reorder window, acquired for every Document read
+        :return: None
+        """
+
+        sequence = 0
+        async for doc_id, data in source:
+            if window is not None:
+                await window.acquire()
+            await queue.put((sequence, doc_id, data))
+            sequence += 1
+        await queue.put(_DONE)
+
+    @staticmethod
+    async def _run_stage(inbound: asyncio.Queue, outbound: asyncio.Queue,
+                         work: Callable[[int, object], Awaitable[object]],
+                         concurrency: int) -> None:
+        """
+        Runs concurrent workers applying a step to every item of a queue.
+        :param inbound: Queue to read from
+        :param outbound: Queue to write to
+        :param work: Coroutine Function applied to each Document Id and value
+        :param concurrency: Number of workers
+        :return: None
+        """
+
+        async def worker() -> None:
+            while True:
+                item = await inbound.get()
+                if item is _DONE:
+                    await inbound.put(_DONE)
+                    return
+                sequence, doc_id, value = item
+                await outbound.put((sequence, doc_id, await work(doc_id, value)))
+
+        async with asyncio.TaskGroup() as group:
+            for _ in range(max(1, concurrency)):
+                group.create_task(worker())
+        await outbound.put(_DONE)
+
+    async def _parse(self, _: int, data: bytes) -> ElementBase:
+        """
+        Parses the Document Bytes within the Executor.
+        :param data: Document Bytes
+        :return: ClinicalDocument Element
+        """
+
+        return await asyncio.get_running_loop().run_in_executor(self.executor, etree.fromstring,
+                                                                data)
+
+    async def _map(self, doc_id: int, document: ElementBase) -> NodeGraph:
+        """
+        Maps a Document to a Graph within the Executor.
+        :param doc_id: Document Id
+        :param document: ClinicalDocument Element
+        :return: Node Graph
+        """
+
+        factory = NodeFactory(self.namespaces, doc_id=doc_id, **self.factory_kwargs)
+        return await asyncio.get_running_loop().run_in_executor(self.executor, self.mapper,
+                                                                document, factory)
+
+    async def _consume(self, queue: asyncio.Queue,
+                       sink: Callable[[int, NodeGraph], Awaitable[None]],
+                       window: asyncio.Semaphore | None) -> int:
+        """
+        Delivers the mapped Graphs to the Sink.
+        :param queue: Sink Queue
+        :param sink: Coroutine Function receiving each Document Id and Graph
+        :param window: Optional reorder window, released for every Document delivered
+        :return: Number of Documents delivered
+        """
+
+        pending = {}
+        expected = 0
+        delivered = 0
+        while (item := await queue.get()) is not _DONE:
+            sequence, doc_id, graph = item
+            if not self.preserve_order:
+                await sink(doc_id, graph)
+                delivered += 1
+                continue
+
+            pending[sequence] = (doc_id, graph)
+            while expected in pending:
+                await sink(*pending.pop(expected))
+                expected += 1
+                delivered += 1
+                if window is not None:
+                    window.release()
+        return delivered
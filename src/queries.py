@@ -0,0 +1,221 @@
+"""
+Traversals and Path Pattern Queries over Node Graphs.
+"""
+
+import re
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+
+from graphs import NodeGraph
+from nodes import BaseNode
+from vertices import VertexInfo
+
+DIRECTIONS = ('out', 'in', 'both')
+
+NODE_TYPE_PATTERN = re.compile(r'\w+|\*')
+EDGE_PATTERN = re.compile(r'(<)?-(\w+|\*)-(>)?')
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class PathPattern:
+    """
+    Typed Path Pattern like ``EncounterNode -performer-> GeneralEntityNode -addr-> AddressNode``.
+
+    Node types are class names and edges are ``-field->`` for outgoing or ``<-field-`` for
+    incoming relationships, ``*`` matches any type or field.
+    """
+
+    node_types: tuple[str | None, ...]
+    edges: tuple[tuple[str | None, str], ...]
+
+    @classmethod
+    def parse(cls, pattern: str) -> 'PathPattern':
+        """
+        Parses a Path Pattern.
+        :param pattern: Pattern text
+        :return: Path Pattern
+        """
+
+        tokens = pattern.split()
+        if not tokens or len(tokens) % 2 == 0:
+            raise ValueError(f"Invalid path pattern: {pattern}")
+
+        node_types = []
+        edges = []
+        for position, token in enumerate(tokens):
+            if position % 2 == 0:
+                if not NODE_TYPE_PATTERN.fullmatch(token):
+                    raise ValueError(f"Invalid node type {token} in path pattern: {pattern}")
+                node_types.append(None if token == '*' else token)
+            else:
+                match = EDGE_PATTERN.fullmatch(token)
+                if match is None or bool(match.group(1)) == bool(match.group(3)):
+                    raise ValueError(f"Invalid edge {token} in path pattern: {pattern}")
+                edges.append((None if match.group(2) == '*' else match.group(2),
+                              'in' if match.group(1) else 'out'))
+
+        return cls(node_types=tuple(node_types), edges=tuple(edges))
+
+
+class GraphQuery:
+    """
+    Lazy Traversals over a Node Graph.
+
+    Results are generators, so consumers stop a traversal by not asking for more results.
+    Visited sets are returned to a pool once a traversal ends and reused by the next one.
+    """
+
+    graph: NodeGraph
+
+    def __init__(self, graph: NodeGraph) -> None:
+        """
+        Constructor.
+        :param graph: Node Graph
+        """
+
+        self.graph = graph
+        self._visited_pool = []
+
+    def neighbors(self, canonical_id: str, field: str | None = None,
+                  direction: str = 'out') -> Iterator[tuple[VertexInfo | None, BaseNode]]:
+        """
+        Iterates the Nodes related to a Node.
+
+        Without a field and in both directions every Vertex is followed, including those without
+        Vertex Info, which are returned with a None Vertex Info.
+        :param canonical_id: Canonical ID of the Node
+        :param field: Optional field name of the relationships
+        :param direction: out, in or both
+        :return: Iterator of Vertex Info and related Node
+        """
+
+        if direction not in DIRECTIONS:
+            raise ValueError(f"Unknown direction: {direction}")
+
+        graph = self.graph
+        if field is None and direction == 'both':
+            for related in graph.vertices.get(canonical_id, ()):
+                yield None, graph.nodes[related]
+            return
+
+        for vertex_id in graph.node_vertex_info.get(canonical_id, ()):
+            vertex_info = graph.vertex_info[vertex_id]
+            if field is not None and vertex_info.field_name != field:
+                continue
+            if direction != 'in' and vertex_info.source_node == canonical_id:
+                yield vertex_info, graph.nodes[vertex_info.destination_node]
+            if direction != 'out' and vertex_info.destination_node == canonical_id:
+                yield vertex_info, graph.nodes[vertex_info.source_node]
+
+    def neighborhood(self, canonical_id: str, max_depth: int | None = None,
+                     fields: Iterable[str] | None = None, node_types: Iterable[str] | None = None,
+                     direction: str = 'both') -> Iterator[tuple[BaseNode, int]]:
+        """
+        Breadth first traversal of the Nodes within a number of hops of a Node.
+        :param canonical_id: Starting Canonical ID
+        :param max_depth: Optional maximum number of hops
+        :param fields: Optional field names of the followed relationships
+        :param node_types: Optional class names of the returned Nodes, others are still traversed
+        :param direction: out, in or both
+        :return: Iterator of Node and depth, excluding the starting Node
+        """
+
+        if direction not in DIRECTIONS:
+            raise ValueError(f"Unknown direction: {direction}")
+
+        fields = None if fields is None else frozenset(fields)
+        node_types = None if node_types is None else set(node_types)
+        visited = self._visited_pool.pop() if self._visited_pool else set()
+        try:
+            visited.add(canonical_id)
+            level = [canonical_id]
+            depth = 0
+            while level and (max_depth is None or depth < max_depth):
+                depth += 1
+                next_level = []
+                for current in level:
+                    for node in self._get_related(current, fields, direction):
+                        related = node.canonical_id
+                        if related in visited:
+                            continue
+                        visited.add(related)
+                        next_level.append(related)
+                        if node_types is None or type(node).__name__ in node_types:
+                            yield node, depth
+                level = next_level
+        finally:
+            visited.clear()
+            self._visited_pool.append(visited)
+
+    def match(self, pattern: str | PathPattern,
+              start: BaseNode | None = None) -> Iterator[tuple[BaseNode, ...]]:
+        """
+        Finds the paths matching a Path Pattern, without visiting a Node twice in a path.
+
+        Paths start at the Nodes of the first type, found through the type index of the Graph.
+        :param pattern: Path Pattern or its text
+        :param start: Optional starting Node
+        :return: Iterator of the Nodes of each matching path
+        """
+
+        if isinstance(pattern, str):
+            pattern = PathPattern.parse(pattern)
+
+        first_type = pattern.node_types[0]
+        if start is not None:
+            starts = [start] if first_type is None or type(start).__name__ == first_type else []
+        elif first_type is None:
+            starts = self.graph.nodes.values()
+        else:
+            starts = self.graph.get_nodes_by_type(first_type)
+
+        for node in starts:
+            yield from self._match_from((node,), pattern)
+
+    def _match_from(self, path: tuple[BaseNode, ...],
+                    pattern: PathPattern) -> Iterator[tuple[BaseNode, ...]]:
+        """
+        Extends a partial path along the Path Pattern.
+        :param path: Nodes matched so far
+        :param pattern: Path Pattern
+        :return: Iterator of matching paths
+        """
+
+        position = len(path) - 1
+        if position == len(pattern.edges):
+            yield path
+            return
+
+        field, direction = pattern.edges[position]
+        node_type = pattern.node_types[position + 1]
+        for _, node in self.neighbors(path[-1].canonical_id, field, direction):
+            if node_type is not None and type(node).__name__ != node_type:
+                continue
+            if any(node is x for x in path):
+                continue
+            yield from self._match_from(path + (node,), pattern)
+
+    def _get_related(self, canonical_id: str, fields: frozenset[str] | None,
+                     direction: str) -> Iterator[BaseNode]:
+        """
+        Iterates the Nodes related to a Node by any of the fields.
+        :param canonical_id: Canonical ID of the Node
+        :param fields: Optional field names
+        :param direction: out, in or both
+        :return: Iterator of Nodes
+        """
+
+        if fields is None:
+            for _, node in self.neighbors(canonical_id, None, direction):
+                yield node
+            return
+
+        graph = self.graph
+        for vertex_id in graph.node_vertex_info.get(canonical_id, ()):
+            vertex_info = graph.vertex_info[vertex_id]
+            if vertex_info.field_name not in fields:
+                continue
+            if direction != 'in' and vertex_info.source_node == canonical_id:
+                yield graph.nodes[vertex_info.destination_node]
+            if direction != 'out' and vertex_info.destination_node == canonical_id:
+                yield graph.nodes[vertex_info.source_node]
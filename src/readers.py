@@ -0,0 +1,253 @@
+"""
+Readers for streaming and indexing Sections and Entries of a C-CDA Document.
+"""
+
+import logging
+from collections.abc import Iterator
+from typing import BinaryIO
+
+from lxml import etree
+from lxml.etree import ElementBase
+
+
+class DocumentReader:
+    """
+    Streaming C-CDA Reader built on iterparse.
+
+    Sections and Entries are yielded one at a time and cleared once the caller moves on, so only
+    the Document Header, the element currently being processed and the parser read-ahead are held
+    in memory. The Document Header (id, effectiveTime, recordTarget, etc.) is fully parsed before
+    the first Section is yielded and is available through ``element.getroottree().getroot()``.
+    """
+
+    namespaces: dict
+    logger: logging.Logger
+    huge_tree: bool
+
+    def __init__(self, namespaces: dict, **kwargs) -> None:
+        """
+        Constructor.
+        :param namespaces: Document Namespaces
+        :keyword huge_tree: Disable the libxml2 security limits for very large documents.
+        """
+
+        self.namespaces = namespaces
+        self.logger = logging.getLogger(__name__)
+        self.huge_tree = kwargs.get('huge_tree', False)
+
+        namespace = namespaces.get('v3', '')
+        self._section_tag = f"{{{namespace}}}section"
+        self._entry_tag = f"{{{namespace}}}entry"
+        self._component_tag = f"{{{namespace}}}component"
+        self._body_tag = f"{{{namespace}}}structuredBody"
+        self._template_tag = f"{{{namespace}}}templateId"
+
+    def iter_sections(self, source: str | BinaryIO,
+                      template_ids: set | None = None) -> Iterator[ElementBase]:
+        """
+        Yields each structuredBody/component/section of the Document.
+        :param source: File Path or Binary File Object
+        :param template_ids: Optional Template ID Roots to limit the Sections to
+        :return: Iterator of Section Elements
+        """
+
+        depth = 0
+        for event, element in etree.iterparse(source, events=('start', 'end'),
+                                              tag=self._section_tag, huge_tree=self.huge_tree):
+            if event == 'start':
+                depth += 1
+                continue
+
+            depth -= 1
+            if depth > 0 or not self._is_body_section(element):
+                continue
+
+            if self._has_template(element, template_ids):
+                yield element
+            self._release_section(element)
+
+    def iter_entries(self, source: str | BinaryIO,
+                     template_ids: set | None = None) -> Iterator[ElementBase]:
+        """
+        Yields each Entry of the structuredBody Sections.
+
+        The parent Section of an Entry is available through ``entry.getparent()`` and still holds
+        its templateId, code, title and text elements; previously yielded Entries are removed.
+        :param source: File Path or Binary File Object
+        :param template_ids: Optional Template ID Roots to limit the Sections to
+        :return: Iterator of Entry Elements
+        """
+
+        depth = 0
+        for event, element in etree.iterparse(source, events=('start', 'end'),
+                                              tag=(self._section_tag, self._entry_tag),
+                                              huge_tree=self.huge_tree):
+            if element.tag == self._section_tag:
+                if event == 'start':
+                    depth += 1
+                    continue
+                depth -= 1
+                if depth == 0 and self._is_body_section(element):
+                    self._release_section(element)
+                continue
+
+            if event == 'start' or depth != 1:
+                continue
+
+            section = element.getparent()
+            if not self._is_body_section(section):
+                continue
+
+            if self._has_template(section, template_ids):
+                yield element
+            self._release_entry(element)
+
+    def _is_body_section(self, section: ElementBase | None) -> bool:
+        """
+        Determines if the Section is a direct structuredBody/component/section.
+        :param section: Section Element
+        :return: True if the Section belongs to the Structured Body
+        """
+
+        if section is None or section.tag != self._section_tag:
+            return False
+
+        component = section.getparent()
+        if component is None or component.tag != self._component_tag:
+            return False
+
+        body = component.getparent()
+        return body is not None and body.tag == self._body_tag
+
+    def _has_template(self, section: ElementBase, template_ids: set | None) -> bool:
+        """
+        Determines if the Section carries one of the requested Template IDs.
+        :param section: Section Element
+        :param template_ids: Template ID Roots or None for all Sections
+        :return: True if the Section should be yielded
+        """
+
+        if not template_ids:
+            return True
+
+        for child in section.iterchildren(self._template_tag):
+            if child.get('root') in template_ids:
+                return True
+        return False
+
+    @staticmethod
+    def _release_section(section: ElementBase) -> None:
+        """
+        Clears a processed Section and drops the Components preceding it.
+        :param section: Section Element
+        :return: None
+        """
+
+        section.clear(keep_tail=True)
+        component = section.getparent()
+        body = component.getparent()
+        while component.getprevious() is not None:
+            del body[0]
+
+    def _release_entry(self, entry: ElementBase) -> None:
+        """
+        Clears a processed Entry and drops the Entries preceding it.
+        :param entry: Entry Element
+        :return: None
+        """
+
+        entry.clear(keep_tail=True)
+        section = entry.getparent()
+        previous = entry.getprevious()
+        while previous is not None and (previous.tag == self._entry_tag
+                                        or not isinstance(previous.tag, str)):
+            section.remove(previous)
+            previous = entry.getprevious()
+
+
+class SectionIndex:
+    """
+    Index of the structuredBody Sections of a Document keyed by Template ID.
+
+    The Document is walked once on construction so repeated Section lookups are dictionary hits.
+    """
+
+    namespaces: dict
+    sections: dict
+    entry_counts: dict
+
+    def __init__(self, namespaces: dict, document: ElementBase) -> None:
+        """
+        Constructor.
+        :param namespaces: Document Namespaces
+        :param document: ClinicalDocument Element
+        """
+
+        self.namespaces = namespaces
+        self.sections = {}
+        self.entry_counts = {}
+        self._roots = {}
+
+        namespace = namespaces.get('v3', '')
+        template_tag = f"{{{namespace}}}templateId"
+        entry_tag = f"{{{namespace}}}entry"
+
+        for section in document.iterfind('./v3:component/v3:structuredBody/v3:component/v3:section',
+                                         namespaces=namespaces):
+            templates = []
+            entry_count = 0
+            for child in section.iterchildren(template_tag, entry_tag):
+                if child.tag == entry_tag:
+                    entry_count += 1
+                else:
+                    templates.append((child.get('root'), child.get('extension')))
+
+            for template in templates:
+                self.sections.setdefault(template, section)
+                self.entry_counts.setdefault(template, entry_count)
+                self._roots.setdefault(template[0], template)
+
+    def get_section(self, template_id: str, extension: str | None = None) -> ElementBase | None:
+        """
+        Retrieves the Section for a Template ID.
+        :param template_id: Template ID Root
+        :param extension: Optional Template ID Extension, the first match on Root when omitted.
+        :return: Optional Section Element
+        """
+
+        return self.sections.get(self._get_key(template_id, extension))
+
+    def get_entries(self, template_id: str, extension: str | None = None) -> list[ElementBase]:
+        """
+        Retrieves the Entries of the Section for a Template ID.
+        :param template_id: Template ID Root
+        :param extension: Optional Template ID Extension
+        :return: List of Entry Elements
+        """
+
+        section = self.get_section(template_id, extension)
+        if section is None:
+            return []
+        return section.findall('./v3:entry', namespaces=self.namespaces)
+
+    def get_entry_count(self, template_id: str, extension: str | None = None) -> int:
+        """
+        Returns the number of Entries in the Section for a Template ID.
+        :param template_id: Template ID Root
+        :param extension: Optional Template ID Extension
+        :return: Entry Count
+        """
+
+        return self.entry_counts.get(self._get_key(template_id, extension), 0)
+
+    def _get_key(self, template_id: str, extension: str | None) -> tuple | None:
+        """
+        Resolves the Index Key for a Template ID.
+        :param template_id: Template ID Root
+        :param extension: Optional Template ID Extension
+        :return: Root and Extension Key
+        """
+
+        if extension is None:
+            return self._roots.get(template_id)
+        return template_id, extension
@@ -0,0 +1,412 @@
+"""
+Compact binary serialization of Node Graphs with memory-mapped loading.
+
+File layout (little endian), version 1:
+
+- Header: magic, version, flags and the offsets of the sections below.
+- Strings: count, count + 1 offsets into a UTF-8 blob, blob. Every canonical id, class name, field
+  name, string value, datetime and meta blob is stored once and referenced by index.
+- Contexts: count and rows of the six Document Context values.
+- Nodes: one block per node class with the class name, field names, row count and fixed width
+  rows of tagged values.
+- Directory: canonical id, block and row of every node, sorted by canonical id.
+- Edges: source, destination, field name and meta of every Vertex Info.
+- Adjacency: each related pair of canonical ids once.
+"""
+
+import json
+import mmap
+import struct
+from dataclasses import fields
+from datetime import datetime
+from typing import Iterator
+
+import nodes
+from graphs import NodeGraph
+from nodes import BaseNode, DocumentContext
+from vertices import VertexInfo
+
+MAGIC = b'CCDAGRPH'
+VERSION = 1
+
+HEADER = struct.Struct('<8sHH6Q')
+COUNT = struct.Struct('<Q')
+OFFSET = struct.Struct('<Q')
+VALUE = struct.Struct('<Bq')
+BLOCK = struct.Struct('<III')
+INDEX = struct.Struct('<I')
+DIRECTORY = struct.Struct('<III')
+EDGE = struct.Struct('<IIIq')
+PAIR = struct.Struct('<II')
+
+TAG_NONE = 0
+TAG_STR = 1
+TAG_INT = 2
+TAG_BOOL = 3
+TAG_DATETIME = 4
+TAG_FLOAT = 5
+TAG_CONTEXT = 6
+
+CONTEXT_FIELDS = [x.name for x in fields(DocumentContext)]
+
+
+class GraphWriter:
+    """
+    Writes a Node Graph to the binary format.
+    """
+
+    def __init__(self) -> None:
+        """
+        Constructor.
+        """
+
+        self._strings = {}
+        self._contexts = {}
+
+    def write(self, graph: NodeGraph, path: str) -> None:
+        """
+        Writes the Graph to a File.
+        :param graph: Node Graph
+        :param path: File Path
+        :return: None
+        """
+
+        self._strings = {}
+        self._contexts = {}
+
+        blocks = {}
+        directory = []
+        for canonical_id, node in graph.nodes.items():
+            class_name = type(node).__name__
+            if class_name not in blocks:
+                blocks[class_name] = (len(blocks), [])
+            block_index, block = blocks[class_name]
+            directory.append((canonical_id, block_index, len(block)))
+            block.append(node)
+
+        node_section = self._encode_nodes(blocks)
+        directory.sort(key=lambda x: x[0])
+        directory_section = COUNT.pack(len(directory)) + b''.join(
+            DIRECTORY.pack(self._intern(x), y, z) for x, y, z in directory)
+
+        edge_section = COUNT.pack(len(graph.vertex_info)) + b''.join(
+            EDGE.pack(self._intern(x.source_node), self._intern(x.destination_node),
+                      self._intern(x.field_name),
+                      -1 if x.meta is None else self._intern(json.dumps(x.meta)))
+            for x in graph.vertex_info.values())
+
+        pairs = [(self._intern(x), self._intern(y)) for x, related in graph.vertices.items()
+                 for y in related if x <= y]
+        pair_section = COUNT.pack(len(pairs)) + b''.join(PAIR.pack(x, y) for x, y in pairs)
+
+        context_section = COUNT.pack(len(self._contexts)) + b''.join(
+            b''.join(self._encode_value(getattr(x, y)) for y in CONTEXT_FIELDS)
+            for x in self._contexts)
+
+        string_section = self._encode_strings()
+
+        sections = [string_section, context_section, node_section, directory_section,
+                    edge_section, pair_section]
+        offsets = []
+        position = HEADER.size
+        for section in sections:
+            offsets.append(position)
+            position += len(section)
+
+        with open(path, 'wb') as output_file:
+            output_file.write(HEADER.pack(MAGIC, VERSION, 0, *offsets))
+            for section in sections:
+                output_file.write(section)
+
+    def _intern(self, value: str) -> int:
+        """
+        Returns the String Table index of a String.
+        :param value: String
+        :return: Index
+        """
+
+        index = self._strings.get(value)
+        if index is None:
+            index = self._strings[value] = len(self._strings)
+        return index
+
+    def _encode_value(self, value: object) -> bytes:
+        """
+        Encodes a field value as a tagged 64 bit slot.
+        :param value: Field Value
+        :return: Encoded Value
+        """
+
+        if value is None:
+            return VALUE.pack(TAG_NONE, 0)
+        if isinstance(value, str):
+            return VALUE.pack(TAG_STR, self._intern(value))
+        if isinstance(value, bool):
+            return VALUE.pack(TAG_BOOL, int(value))
+        if isinstance(value, int):
+            return VALUE.pack(TAG_INT, value)
+        if isinstance(value, datetime):
+            return VALUE.pack(TAG_DATETIME, self._intern(value.isoformat()))
+        if isinstance(value, float):
+            return VALUE.pack(TAG_FLOAT, struct.unpack('<q', struct.pack('<d', value))[0])
+        raise ValueError(f"Unsupported value type: {type(value).__name__}")
+
+    def _encode_nodes(self, blocks: dict) -> bytes:
+        """
+        Encodes the Node Blocks.
+        :param blocks: Block Index and Nodes grouped by Class Name
+        :return: Encoded Node Section
+        """
+
+        parts = [COUNT.pack(len(blocks))]
+        for class_name, (_, block) in blocks.items():
+            field_names = [x.name for x in fields(block[0])]
+            parts.append(BLOCK.pack(self._intern(class_name), len(field_names), len(block)))
+            parts.extend(INDEX.pack(self._intern(x)) for x in field_names)
+            for node in block:
+                for field_name in field_names:
+                    if field_name == 'context':
+                        index = self._contexts.setdefault(node.context, len(self._contexts))
+                        parts.append(VALUE.pack(TAG_CONTEXT, index))
+                    else:
+                        parts.append(self._encode_value(getattr(node, field_name)))
+        return b''.join(parts)
+
+    def _encode_strings(self) -> bytes:
+        """
+        Encodes the String Table.
+        :return: Encoded String Section
+        """
+
+        encoded = [x.encode('utf-8') for x in self._strings]
+        offsets = [0]
+        for value in encoded:
+            offsets.append(offsets[-1] + len(value))
+        return (COUNT.pack(len(encoded)) + b''.join(OFFSET.pack(x) for x in offsets)
+                + b''.join(encoded))
+
+
+class GraphReader:
+    """
+    Memory-mapped reader of the binary format.
+
+    Opening a File only reads the header and node block headers; Nodes are decoded from the
+    mapped File on access and cached.
+    """
+
+    path: str
+
+    def __init__(self, path: str) -> None:
+        """
+        Constructor.
+        :param path: File Path
+        """
+
+        self.path = path
+        with open(path, 'rb') as input_file:
+            self._map = mmap.mmap(input_file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._nodes = {}
+        self._context_cache = {}
+
+        magic, version, _, *offsets = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            raise ValueError(f"Not a node graph file: {path}")
+        if version != VERSION:
+            raise ValueError(f"Unsupported node graph file version: {version}")
+
+        (self._strings_offset, self._contexts_offset, nodes_offset, directory_offset,
+         self._edges_offset, self._pairs_offset) = offsets
+
+        self._string_count = COUNT.unpack_from(self._map, self._strings_offset)[0]
+        self._string_blob = self._strings_offset + COUNT.size + OFFSET.size * (
+                self._string_count + 1)
+        self._directory_count = COUNT.unpack_from(self._map, directory_offset)[0]
+        self._directory_offset = directory_offset + COUNT.size
+
+        self._blocks = []
+        position = nodes_offset + COUNT.size
+        for _ in range(COUNT.unpack_from(self._map, nodes_offset)[0]):
+            class_index, field_count, row_count = BLOCK.unpack_from(self._map, position)
+            position += BLOCK.size
+            field_names = [self._string(INDEX.unpack_from(self._map, position + x * INDEX.size)[0])
+                           for x in range(field_count)]
+            position += field_count * INDEX.size
+            node_class = getattr(nodes, self._string(class_index))
+            self._blocks.append((node_class, field_names, position))
+            position += row_count * field_count * VALUE.size
+
+    def __enter__(self) -> 'GraphReader':
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        """
+        Returns the number of Nodes in the File.
+        :return: Node Count
+        """
+
+        return self._directory_count
+
+    def close(self) -> None:
+        """
+        Closes the Memory Map.
+        :return: None
+        """
+
+        self._map.close()
+
+    def get_node(self, canonical_id: str) -> BaseNode | None:
+        """
+        Retrieves a Node by Canonical ID, decoding it on first access.
+        :param canonical_id: Canonical ID
+        :return: Optional Node
+        """
+
+        node = self._nodes.get(canonical_id)
+        if node is not None:
+            return node
+
+        low, high = 0, self._directory_count
+        while low < high:
+            middle = (low + high) // 2
+            string_index, block, row = DIRECTORY.unpack_from(
+                self._map, self._directory_offset + middle * DIRECTORY.size)
+            current = self._string(string_index)
+            if current == canonical_id:
+                node = self._nodes[canonical_id] = self._read_node(block, row)
+                return node
+            if current < canonical_id:
+                low = middle + 1
+            else:
+                high = middle
+
+        return None
+
+    def iter_nodes(self) -> Iterator[BaseNode]:
+        """
+        Yields every Node in Canonical ID order.
+        :return: Iterator of Nodes
+        """
+
+        for position in range(self._directory_count):
+            string_index, block, row = DIRECTORY.unpack_from(
+                self._map, self._directory_offset + position * DIRECTORY.size)
+            canonical_id = self._string(string_index)
+            node = self._nodes.get(canonical_id)
+            if node is None:
+                node = self._nodes[canonical_id] = self._read_node(block, row)
+            yield node
+
+    def iter_vertex_info(self) -> Iterator[tuple[str, str, str, dict | str | None]]:
+        """
+        Yields the Source, Destination, Field Name and Meta of every Vertex Info.
+        :return: Iterator of Vertex Info values
+        """
+
+        count = COUNT.unpack_from(self._map, self._edges_offset)[0]
+        for position in range(count):
+            source, destination, field_name, meta = EDGE.unpack_from(
+                self._map, self._edges_offset + COUNT.size + position * EDGE.size)
+            yield (self._string(source), self._string(destination), self._string(field_name),
+                   None if meta < 0 else json.loads(self._string(meta)))
+
+    def iter_vertices(self) -> Iterator[tuple[str, str]]:
+        """
+        Yields each related pair of Canonical IDs once.
+        :return: Iterator of Canonical ID pairs
+        """
+
+        count = COUNT.unpack_from(self._map, self._pairs_offset)[0]
+        for position in range(count):
+            first, second = PAIR.unpack_from(self._map,
+                                             self._pairs_offset + COUNT.size + position * PAIR.size)
+            yield self._string(first), self._string(second)
+
+    def to_graph(self) -> NodeGraph:
+        """
+        Materializes the whole File as a Node Graph.
+        :return: Node Graph
+        """
+
+        graph = NodeGraph()
+        for node in self.iter_nodes():
+            graph.add_node(node)
+
+        for first, second in self.iter_vertices():
+            graph.add_vertex(graph.nodes[first], graph.nodes[second], None)
+
+        for source, destination, field_name, meta in self.iter_vertex_info():
+            source_node = graph.nodes[source]
+            destination_node = graph.nodes[destination]
+            graph.add_vertex_with_info(source_node, destination_node,
+                                       VertexInfo(source_node, destination_node, field_name,
+                                                  meta=meta))
+        return graph
+
+    def _string(self, index: int) -> str:
+        """
+        Reads a String from the String Table.
+        :param index: String Index
+        :return: String
+        """
+
+        start, end = struct.unpack_from('<QQ', self._map,
+                                        self._strings_offset + COUNT.size + index * OFFSET.size)
+        return self._map[self._string_blob + start:self._string_blob + end].decode('utf-8')
+
+    def _decode_value(self, tag: int, payload: int) -> object:
+        """
+        Decodes a tagged 64 bit slot.
+        :param tag: Value Tag
+        :param payload: Value Payload
+        :return: Field Value
+        """
+
+        if tag == TAG_NONE:
+            return None
+        if tag == TAG_STR:
+            return self._string(payload)
+        if tag == TAG_INT:
+            return payload
+        if tag == TAG_BOOL:
+            return bool(payload)
+        if tag == TAG_DATETIME:
+            return datetime.fromisoformat(self._string(payload))
+        if tag == TAG_FLOAT:
+            return struct.unpack('<d', struct.pack('<q', payload))[0]
+        if tag == TAG_CONTEXT:
+            return self._read_context(payload)
+        raise ValueError(f"Unknown value tag: {tag}")
+
+    def _read_context(self, index: int) -> DocumentContext:
+        """
+        Reads a Document Context, sharing the instance between Nodes.
+        :param index: Context Index
+        :return: Document Context
+        """
+
+        context = self._context_cache.get(index)
+        if context is None:
+            position = self._contexts_offset + COUNT.size + index * len(
+                CONTEXT_FIELDS) * VALUE.size
+            values = [self._decode_value(*VALUE.unpack_from(self._map, position + x * VALUE.size))
+                      for x in range(len(CONTEXT_FIELDS))]
+            context = self._context_cache[index] = DocumentContext(
+                **dict(zip(CONTEXT_FIELDS, values)))
+        return context
+
+    def _read_node(self, block: int, row: int) -> BaseNode:
+        """
+        Decodes a Node from a Node Block.
+        :param block: Block Index
+        :param row: Row Index
+        :return: Node
+        """
+
+        node_class, field_names, position = self._blocks[block]
+        position += row * len(field_names) * VALUE.size
+        values = [self._decode_value(*VALUE.unpack_from(self._map, position + x * VALUE.size))
+                  for x in range(len(field_names))]
+        return node_class(**dict(zip(field_names, values)))
@@ -0,0 +1,462 @@
+"""
+Copy on Write Snapshots of Node Graphs for readers running while the Graph is written.
+"""
+
+from collections.abc import Iterator, Mapping, MutableMapping
+
+from graphs import NodeGraph
+from nodes import BaseNode
+from vertices import VertexInfo
+
+BRANCH_BITS = 5
+BRANCH_MASK = (1 << BRANCH_BITS) - 1
+LEAF_SIZE = 128
+HASH_BITS = 64
+
+VERSIONED_ATTRIBUTES = ('nodes', 'vertices', 'vertex_info', 'node_vertex_info', 'edge_index',
+                        'pair_index')
+MUTABLE_ATTRIBUTES = ('vertices', 'node_vertex_info', 'pair_index')
+
+
+class Branch:
+    """
+    Trie node holding 32 children selected by 5 bits of the key hashes.
+    """
+
+    __slots__ = ('epoch', 'children')
+
+    def __init__(self, epoch: int, children: list) -> None:
+        """
+        Constructor.
+        :param epoch: Epoch which may write the node
+        :param children: Branches, Leaves or None
+        """
+
+        self.epoch = epoch
+        self.children = children
+
+
+class Leaf:
+    """
+    Trie node holding the items whose hashes share the path to the Leaf.
+    """
+
+    __slots__ = ('epoch', 'items', 'owned')
+
+    def __init__(self, epoch: int, items: dict, owned: set | None = None) -> None:
+        """
+        Constructor.
+        :param epoch: Epoch which may write the node
+        :param items: Items
+        :param owned: Keys whose mutable values were copied by the epoch
+        """
+
+        self.epoch = epoch
+        self.items = items
+        self.owned = set() if owned is None else owned
+
+
+def find_items(root: Branch, key_hash: int) -> dict | None:
+    """
+    Retrieves the items of the Leaf a hash leads to.
+    :param root: Root of the Trie
+    :param key_hash: Hash of the key
+    :return: Optional items
+    """
+
+    node = root
+    shift = 0
+    while node.__class__ is Branch:
+        node = node.children[(key_hash >> shift) & BRANCH_MASK]
+        if node is None:
+            return None
+        shift += BRANCH_BITS
+    return node.items
+
+
+def iterate_leaves(root: Branch) -> Iterator[dict]:
+    """
+    Iterates the items of every Leaf of a Trie.
+    :param root: Root of the Trie
+    :return: Iterator of items
+    """
+
+    stack = [root]
+    while stack:
+        for child in stack.pop().children:
+            if child is None:
+                continue
+            if child.__class__ is Branch:
+                stack.append(child)
+            else:
+                yield child.items
+
+
+class TrieMapping(Mapping):
+    """
+    Read only Mapping over a Hash Trie.
+    """
+
+    root: Branch
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator:
+        for items in iterate_leaves(self.root):
+            yield from items
+
+    def __contains__(self, key: object) -> bool:
+        items = find_items(self.root, hash(key))
+        return items is not None and key in items
+
+    def __getitem__(self, key: object) -> object:
+        items = find_items(self.root, hash(key))
+        if items is None:
+            raise KeyError(key)
+        return items[key]
+
+    def get(self, key: object, default: object = None) -> object:
+        items = find_items(self.root, hash(key))
+        return default if items is None else items.get(key, default)
+
+    def keys(self) -> Iterator:
+        return iter(self)
+
+    def values(self) -> Iterator:
+        for items in iterate_leaves(self.root):
+            yield from items.values()
+
+    def items(self) -> Iterator[tuple]:
+        for items in iterate_leaves(self.root):
+            yield from items.items()
+
+
+class DictSnapshot(TrieMapping):
+    """
+    Read only view of a Copy on Write Dictionary at the time of a snapshot.
+    """
+
+    def __init__(self, root: Branch, size: int) -> None:
+        """
+        Constructor.
+        :param root: Root of the Trie, which is not written anymore
+        :param size: Number of items
+        """
+
+        self.root = root
+        self._size = size
+
+
+class CopyOnWriteDict(TrieMapping, MutableMapping):
+    """
+    Dictionary stored in a Hash Trie, which is snapshot in O(1) time.
+
+    Taking a snapshot starts a new epoch. A write copies the Trie nodes on the path to its key the
+    first time the epoch touches them, so a write copies at most a few nodes of 32 children and
+    one Leaf of about ``LEAF_SIZE`` items, whatever the size of the Dictionary. With
+    ``copy_values`` the values are mutable sets or dictionaries and every lookup counts as a
+    write, since the caller may update the returned value, which is copied on its first lookup in
+    the epoch.
+    """
+
+    epoch: int
+    copy_values: bool
+
+    def __init__(self, items: Mapping | None = None, copy_values: bool = False) -> None:
+        """
+        Constructor.
+        :param items: Optional initial items
+        :param copy_values: Values are sets or dictionaries updated in place
+        """
+
+        self.copy_values = copy_values
+        self.epoch = 0
+        self.root = Branch(0, [None] * (BRANCH_MASK + 1))
+        self._size = 0
+        for key, value in (items.items() if items else ()):
+            self[key] = value.copy() if copy_values else value
+
+    def __getitem__(self, key: object) -> object:
+        if self.copy_values:
+            value = self._own_value(key, self)
+            if value is self:
+                raise KeyError(key)
+            return value
+        return super().__getitem__(key)
+
+    def __setitem__(self, key: object, value: object) -> None:
+        leaf = self._own(key)
+        items = leaf.items
+        size = len(items)
+        items[key] = value
+        if self.copy_values:
+            leaf.owned.add(key)
+        if len(items) != size:
+            self._size += 1
+            if size >= LEAF_SIZE:
+                self._split(key)
+
+    def __delitem__(self, key: object) -> None:
+        leaf = self._own(key)
+        del leaf.items[key]
+        leaf.owned.discard(key)
+        self._size -= 1
+
+    def get(self, key: object, default: object = None) -> object:
+        if self.copy_values:
+            return self._own_value(key, default)
+        return super().get(key, default)
+
+    def setdefault(self, key: object, default: object = None) -> object:
+        value = self.get(key, self)
+        if value is self:
+            self[key] = value = default
+        return value
+
+    def pop(self, key: object, *default: object) -> object:
+        leaf = self._own(key)
+        if key in leaf.items:
+            self._size -= 1
+            leaf.owned.discard(key)
+        return leaf.items.pop(key, *default)
+
+    def add_to_set(self, key: object, value: object) -> None:
+        """
+        Adds a value to the set of a key, creating the set when missing.
+        :param key: Key
+        :param value: Value to add
+        :return: None
+        """
+
+        leaf = self._own(key)
+        values = leaf.items.get(key)
+        if values is None:
+            self[key] = {value}
+            return
+        if key not in leaf.owned:
+            values = leaf.items[key] = set(values)
+            leaf.owned.add(key)
+        values.add(value)
+
+    def snapshot(self) -> DictSnapshot:
+        """
+        Creates a read only view of the current items, later writes copy the nodes they touch.
+        :return: Dictionary Snapshot
+        """
+
+        self.epoch += 1
+        return DictSnapshot(self.root, self._size)
+
+    def _own(self, key: object) -> Leaf:
+        """
+        Retrieves the Leaf of a key for writing, copying the path once per epoch.
+        :param key: Key
+        :return: Leaf owned by the current epoch
+        """
+
+        epoch = self.epoch
+        node = self.root
+        if node.epoch != epoch:
+            node = self.root = Branch(epoch, list(node.children))
+
+        key_hash = hash(key)
+        shift = 0
+        while True:
+            index = (key_hash >> shift) & BRANCH_MASK
+            child = node.children[index]
+            if child is None:
+                child = node.children[index] = Leaf(epoch, {})
+            elif child.epoch != epoch:
+                if child.__class__ is Branch:
+                    child = Branch(epoch, list(child.children))
+                else:
+                    child = Leaf(epoch, dict(child.items))
+                node.children[index] = child
+
+            if child.__class__ is Leaf:
+                return child
+            node = child
+            shift += BRANCH_BITS
+
+    def _split(self, key: object) -> None:
+        """
+        Replaces the full Leaf of a key, owned by the current epoch, with a Branch.
+        :param key: Key
+        :return: None
+        """
+
+        key_hash = hash(key)
+        node = self.root
+        shift = 0
+        while True:
+            index = (key_hash >> shift) & BRANCH_MASK
+            child = node.children[index]
+            shift += BRANCH_BITS
+            if child.__class__ is Leaf:
+                break
+            node = child
+
+        if shift >= HASH_BITS:
+            return
+        children = [None] * (BRANCH_MASK + 1)
+        for item_key, value in child.items.items():
+            position = (hash(item_key) >> shift) & BRANCH_MASK
+            if children[position] is None:
+                children[position] = Leaf(self.epoch, {})
+            children[position].items[item_key] = value
+            if item_key in child.owned:
+                children[position].owned.add(item_key)
+        node.children[index] = Branch(self.epoch, children)
+
+    def _own_value(self, key: object, default: object) -> object:
+        """
+        Retrieves a mutable value for writing, copying it once per epoch.
+        :param key: Key
+        :param default: Value returned for a missing key
+        :return: Value owned by the current epoch or the default
+        """
+
+        leaf = self._own(key)
+        value = leaf.items.get(key, default)
+        if value is not default and key not in leaf.owned:
+            value = leaf.items[key] = value.copy()
+            leaf.owned.add(key)
+        return value
+
+
+class VersionedNodeGraph(NodeGraph):
+    """
+    Node Graph handing out consistent Snapshots to readers while it keeps being written.
+
+    The Nodes, Vertices, Vertex Info and their reverse indexes are Copy on Write Dictionaries, so
+    a Snapshot costs O(1) and writes after it copy only the few Trie nodes they touch.
+    Take Snapshots from the writing thread, like after every ingested Document, and hand them to
+    the readers.
+    """
+
+    version: int
+
+    def __init__(self, **kwargs) -> None:
+        """
+        Constructor.
+        :keyword string_pool: Pool interning the Canonical IDs and field names, None to disable
+        """
+
+        super().__init__(**kwargs)
+        self.version = 0
+        self._make_versioned()
+
+    def snapshot(self) -> 'GraphSnapshot':
+        """
+        Creates a read only view of the current version of the Graph.
+        :return: Graph Snapshot
+        """
+
+        self.version += 1
+        return GraphSnapshot(self.version, {x: getattr(self, x).snapshot()
+                                            for x in VERSIONED_ATTRIBUTES})
+
+    def add_vertex(self, source_node: BaseNode, destination_node: BaseNode,
+                   field: str | None) -> None:
+        """
+        Adds a Vertex for two Nodes.
+        :param source_node: Source Node
+        :param destination_node: Destination Node
+        :param field: Field Name associated to the Vertex.
+        :return: None
+        """
+
+        if field:
+            vertex_info = VertexInfo(source_node, destination_node, field)
+            self.add_vertex_with_info(source_node, destination_node, vertex_info)
+            return
+
+        self.add_node(source_node)
+        self.add_node(destination_node)
+        self.vertices.add_to_set(source_node.canonical_id, destination_node.canonical_id)
+        self.vertices.add_to_set(destination_node.canonical_id, source_node.canonical_id)
+
+    def add_vertex_with_info(self, source_node: BaseNode, destination_node: BaseNode,
+                             vertex_info: VertexInfo | None) -> None:
+        """
+        Adds a Vertex to the Graph for two Nodes with Additional Information.
+        :param source_node: Source Node
+        :param destination_node: Destination Node
+        :param vertex_info: Info about the relationship
+        :return: None
+        """
+
+        self.add_vertex(source_node, destination_node, None)
+        if not vertex_info:
+            return
+
+        if self.string_pool is not None:
+            vertex_info.source_node = self.string_pool.intern(vertex_info.source_node)
+            vertex_info.destination_node = self.string_pool.intern(vertex_info.destination_node)
+            vertex_info.field_name = self.string_pool.intern(vertex_info.field_name)
+
+        self.vertex_info[vertex_info.vertx_id] = vertex_info
+        self.node_vertex_info.add_to_set(source_node.canonical_id, vertex_info.vertx_id)
+        self.node_vertex_info.add_to_set(destination_node.canonical_id, vertex_info.vertx_id)
+        self._index_edge(vertex_info)
+
+    def compact(self) -> None:
+        super().compact()
+        self._make_versioned()
+
+    def _make_versioned(self) -> None:
+        """
+        Wraps the versioned attributes in Copy on Write Dictionaries.
+        :return: None
+        """
+
+        for name in VERSIONED_ATTRIBUTES:
+            setattr(self, name, CopyOnWriteDict(getattr(self, name),
+                                                copy_values=name in MUTABLE_ATTRIBUTES))
+
+
+class GraphSnapshot:
+    """
+    Read only version of a Versioned Node Graph, usable with Graph Queries, diffs and exporters.
+
+    Secondary Indexes are not versioned, so Nodes are found by type by scanning the Snapshot.
+    """
+
+    version: int
+    nodes: DictSnapshot
+    vertices: DictSnapshot
+    vertex_info: DictSnapshot
+    node_vertex_info: DictSnapshot
+    edge_index: DictSnapshot
+    pair_index: DictSnapshot
+    attribute_indexes: dict
+
+    def __init__(self, version: int, attributes: dict[str, DictSnapshot]) -> None:
+        """
+        Constructor.
+        :param version: Version of the Graph
+        :param attributes: Dictionary Snapshots by attribute name
+        """
+
+        self.version = version
+        for name, value in attributes.items():
+            setattr(self, name, value)
+        self.attribute_indexes = {}
+
+    def get_nodes_by_type(self, node_type: str) -> list[BaseNode]:
+        """
+        Retrieves every Node of a type.
+        :param node_type: Node class name, like EncounterNode
+        :return: List of Nodes
+        """
+
+        return [x for x in self.nodes.values() if type(x).__name__ == node_type]
+
+    find_nodes = NodeGraph.find_nodes
+    get_vertices = NodeGraph.get_vertices
+    get_node_vertex_info = NodeGraph.get_node_vertex_info
+    get_vertex_info = NodeGraph.get_vertex_info
+    find_vertex_info = NodeGraph.find_vertex_info
+    find_all_vertex_info = NodeGraph.find_all_vertex_info
+    freeze = NodeGraph.freeze
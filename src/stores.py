@@ -0,0 +1,745 @@
+"""
+Persistent Graph Stores exposing the Node Graph API.
+"""
+
+import json
+import logging
+import sqlite3
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from dataclasses import fields
+from datetime import datetime
+
+import nodes
+from graphs import CONFLICT_POLICIES, MergeStatistics, NodeGraph, same_content
+from nodes import BaseNode, DocumentContext
+from vertices import VertexInfo
+
+CONTEXT_FIELDS = [x.name for x in fields(DocumentContext)]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS contexts (
+    context_id INTEGER PRIMARY KEY,
+    doc_id INTEGER, doc_source_id TEXT, etl_dg_code INTEGER, etl_load_datetime TEXT,
+    etl_src_inc_datetime TEXT, etl_src_sys_id INTEGER,
+    UNIQUE (doc_id, doc_source_id, etl_dg_code, etl_load_datetime, etl_src_inc_datetime,
+            etl_src_sys_id)
+);
+CREATE TABLE IF NOT EXISTS nodes (
+    canonical_id TEXT PRIMARY KEY,
+    node_class TEXT NOT NULL,
+    context_id INTEGER NOT NULL,
+    data TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS nodes_class ON nodes (node_class);
+CREATE TABLE IF NOT EXISTS vertices (
+    source TEXT NOT NULL,
+    destination TEXT NOT NULL,
+    PRIMARY KEY (source, destination)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS vertex_info (
+    vertx_id TEXT PRIMARY KEY,
+    source TEXT NOT NULL,
+    destination TEXT NOT NULL,
+    field_name TEXT NOT NULL,
+    meta TEXT
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS vertex_info_edge ON vertex_info (source, destination, field_name);
+CREATE INDEX IF NOT EXISTS vertex_info_destination ON vertex_info (destination);
+"""
+
+
+def encode_value(value: object) -> object:
+    """
+    Encodes a Node field value for JSON.
+    :param value: Field Value
+    :return: JSON Value
+    """
+
+    if isinstance(value, datetime):
+        return {'$datetime': value.isoformat()}
+    return value
+
+
+def decode_value(value: object) -> object:
+    """
+    Decodes a JSON value to a Node field value.
+    :param value: JSON Value
+    :return: Field Value
+    """
+
+    if isinstance(value, dict) and '$datetime' in value:
+        return datetime.fromisoformat(value['$datetime'])
+    return value
+
+
+def attribute_sql(attribute: str) -> str:
+    """
+    Builds the SQL expression of a Node field stored in the data column.
+
+    Datetimes are compared by their ISO format, so the expression orders them chronologically.
+    :param attribute: Field Name
+    :return: SQL Expression
+    """
+
+    if not attribute.isidentifier():
+        raise ValueError(f"Invalid attribute: {attribute}")
+    return (f"COALESCE(json_extract(data, '$.{attribute}.\"$datetime\"'), "
+            f"json_extract(data, '$.{attribute}'))")
+
+
+def sql_value(value: object) -> object:
+    """
+    Converts a Node field value to the value of its SQL expression.
+    :param value: Field Value
+    :return: SQL Value
+    """
+
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+class SqliteMapping(Mapping):
+    """
+    Read-only view of a SQLite Node Graph table in place of a NodeGraph dictionary.
+
+    Keys are streamed from a query and values are looked up one key at a time, so iterating the
+    view does not load the table in memory.
+    """
+
+    graph: 'SqliteNodeGraph'
+    keys_sql: str
+    lookup: Callable[[object], object]
+
+    def __init__(self, graph: 'SqliteNodeGraph', keys_sql: str,
+                 lookup: Callable[[object], object]) -> None:
+        """
+        Constructor.
+        :param graph: SQLite Node Graph
+        :param keys_sql: Query selecting the keys, tuple keys select several columns
+        :param lookup: Function of a key returning its value or None
+        """
+
+        self.graph = graph
+        self.keys_sql = keys_sql
+        self.lookup = lookup
+
+    def __getitem__(self, key: object) -> object:
+        value = self.lookup(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __iter__(self) -> Iterator:
+        self.graph.flush()
+        for row in self.graph.connection.execute(self.keys_sql):
+            yield row[0] if len(row) == 1 else row
+
+    def __len__(self) -> int:
+        self.graph.flush()
+        return self.graph.connection.execute(
+            f"SELECT COUNT(*) FROM ({self.keys_sql})").fetchone()[0]
+
+
+class SqliteNodeGraph:
+    """
+    Node Graph persisted to a SQLite File.
+
+    Writes are buffered and flushed with executemany in a single transaction once ``batch_size``
+    items are pending, before any read, and on commit or close. Nodes are upserted on canonical_id.
+
+    The NodeGraph dictionaries are exposed as read-only Mapping views of the tables, and Indexes
+    are SQLite expression indexes. The String Pool and ``freeze`` of the in-memory Graph are not
+    available.
+    """
+
+    path: str
+    batch_size: int
+    logger: logging.Logger
+    nodes: Mapping
+    vertices: Mapping
+    vertex_info: Mapping
+    node_vertex_info: Mapping
+    edge_index: Mapping
+    pair_index: Mapping
+
+    def __init__(self, path: str, **kwargs) -> None:
+        """
+        Constructor.
+        :param path: SQLite File Path
+        :keyword batch_size: Number of pending writes flushed in one transaction
+        """
+
+        self.path = path
+        self.batch_size = kwargs.get('batch_size', 50000)
+        self.logger = logging.getLogger(__name__)
+        self.connection = sqlite3.connect(path)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        self.connection.executescript(SCHEMA)
+
+        self._contexts = {}
+        self._context_ids = {}
+        self._pending_nodes = {}
+        self._pending_vertices = []
+        self._pending_vertex_info = []
+
+        self.nodes = SqliteMapping(self, 'SELECT canonical_id FROM nodes', self.get_node)
+        self.vertices = SqliteMapping(self, 'SELECT DISTINCT source FROM vertices',
+                                      lambda x: self._find_vertices(x) or None)
+        self.vertex_info = SqliteMapping(self, 'SELECT vertx_id FROM vertex_info',
+                                         self.get_vertex_info)
+        self.node_vertex_info = SqliteMapping(
+            self, 'SELECT source FROM vertex_info UNION SELECT destination FROM vertex_info',
+            lambda x: self._find_node_vertex_info(x) or None)
+        self.edge_index = SqliteMapping(
+            self, 'SELECT source, destination, field_name FROM vertex_info',
+            lambda x: self._find_vertex_info(*x))
+        self.pair_index = SqliteMapping(
+            self, 'SELECT DISTINCT source, destination FROM vertex_info',
+            lambda x: {y.field_name: y for y in self._find_all_vertex_info(*x)} or None)
+
+    def __enter__(self) -> 'SqliteNodeGraph':
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def add_node(self, node: BaseNode) -> None:
+        """
+        Adds or Updates a Node to the Graph.
+        :param node: Node to Add
+        :return: None
+        """
+
+        self._pending_nodes[node.canonical_id] = node
+        self._flush_if_full()
+
+    def add_vertex(self, source_node: BaseNode, destination_node: BaseNode,
+                   field: str | None) -> None:
+        """
+        Adds a Vertex for two Nodes.
+        :param source_node: Source Node
+        :param destination_node: Destination Node
+        :param field: Field Name associated to the Vertex.
+        :return: None
+        """
+
+        if field:
+            self.add_vertex_with_info(source_node, destination_node,
+                                      VertexInfo(source_node, destination_node, field))
+            return
+
+        self._pending_nodes[source_node.canonical_id] = source_node
+        self._pending_nodes[destination_node.canonical_id] = destination_node
+        self._pending_vertices.append((source_node.canonical_id, destination_node.canonical_id))
+        self._pending_vertices.append((destination_node.canonical_id, source_node.canonical_id))
+        self._flush_if_full()
+
+    def add_vertex_with_info(self, source_node: BaseNode, destination_node: BaseNode,
+                             vertex_info: VertexInfo | None) -> None:
+        """
+        Adds a Vertex to the Graph for two Nodes with Additional Information.
+        :param source_node: Source Node
+        :param destination_node: Destination Node
+        :param vertex_info: Info about the relationship
+        :return: None
+        """
+
+        self.add_vertex(source_node, destination_node, None)
+
+        if vertex_info:
+            self._pending_vertex_info.append(self._to_vertex_info_row(vertex_info))
+            self._flush_if_full()
+
+    def add_index(self, node_type: str, *attributes: str, ordered: bool = False) -> None:
+        """
+        Declares a Secondary Index of a Node type as a SQLite expression index.
+
+        The index serves both ``find_nodes`` on exactly these attributes and
+        ``find_nodes_in_range`` on its first attribute.
+        :param node_type: Node class name, like CodeNode
+        :param attributes: Indexed attributes, like code_system and code
+        :param ordered: Declare an ordered Index of a single attribute for range lookups
+        :return: None
+        """
+
+        if ordered and len(attributes) != 1:
+            raise ValueError('Ordered indexes cover a single attribute')
+        if not node_type.isidentifier():
+            raise ValueError(f"Invalid node type: {node_type}")
+
+        self.connection.execute(
+            f"CREATE INDEX IF NOT EXISTS {'_'.join(('nodes', node_type, *attributes))} ON nodes "
+            f"(node_class, {', '.join(attribute_sql(x) for x in attributes)}) "
+            f"WHERE node_class = '{node_type}'")
+
+    def get_nodes_by_type(self, node_type: str) -> list[BaseNode]:
+        """
+        Retrieves every Node of a type.
+        :param node_type: Node class name, like EncounterNode
+        :return: List of Nodes
+        """
+
+        return self.find_nodes(node_type)
+
+    def find_nodes(self, node_type: str, **values) -> list[BaseNode]:
+        """
+        Finds the Nodes of a type with the given attribute values.
+
+        Uses the Index declared on these attributes, otherwise scans the Nodes of the type.
+        :param node_type: Node class name, like CodeNode
+        :param values: Attribute values, like code_system='2.16.840.1.113883.6.96'
+        :return: List of Nodes
+        """
+
+        return self._select_nodes(node_type, [f"{attribute_sql(x)} = ?" for x in values],
+                                  [sql_value(x) for x in values.values()])
+
+    def find_nodes_in_range(self, node_type: str, attribute: str, low: object = None,
+                            high: object = None) -> list[BaseNode]:
+        """
+        Finds the Nodes of a type with an attribute from low, inclusive, to high, exclusive.
+        :param node_type: Node class name, like EncounterNode
+        :param attribute: Attribute, like encounter_start
+        :param low: Optional lower bound
+        :param high: Optional upper bound
+        :return: List of Nodes ordered by the attribute
+        """
+
+        expression = attribute_sql(attribute)
+        conditions = [f"{expression} IS NOT NULL"]
+        parameters = []
+        if low is not None:
+            conditions.append(f"{expression} >= ?")
+            parameters.append(sql_value(low))
+        if high is not None:
+            conditions.append(f"{expression} < ?")
+            parameters.append(sql_value(high))
+        return self._select_nodes(node_type, conditions, parameters, order_by=expression)
+
+    def get_node(self, canonical_id: str) -> BaseNode | None:
+        """
+        Retrieves a Node by Canonical ID.
+        :param canonical_id: Canonical ID
+        :return: Optional Node
+        """
+
+        self.flush()
+        return self._load_node(canonical_id)
+
+    def get_vertices(self, node: BaseNode) -> set:
+        """
+        Returns the Canonical IDs related to the provided Node.
+        :param node: Node
+        :return: Set of Canonical IDs
+        """
+
+        self.flush()
+        return self._find_vertices(node.canonical_id)
+
+    def get_node_vertex_info(self, node: BaseNode) -> set:
+        """
+        Returns the vertex info IDs for a given Node.
+        :param node: Node
+        :return: Set of Vertex Info IDs
+        """
+
+        self.flush()
+        return self._find_node_vertex_info(node.canonical_id)
+
+    def get_vertex_info(self, vertex_id: str) -> VertexInfo | None:
+        """
+        Retrieves the Vertex Info for a provided ID
+        :param vertex_id: Vertex Info ID.
+        :return: Vertex Info
+        """
+
+        self.flush()
+        row = self.connection.execute(
+            'SELECT source, destination, field_name, meta FROM vertex_info WHERE vertx_id = ?',
+            (vertex_id,)).fetchone()
+        return None if row is None else self._to_vertex_info(row)
+
+    def find_vertex_info(self, source_node: BaseNode, destination_node: BaseNode,
+                         field: str | None = None) -> VertexInfo | None:
+        """
+        Retrieves the Vertex Info for a relationship.
+        :param source_node: Source Node
+        :param destination_node: Destination Node
+        :param field: Optional Field Name, any relationship is returned when omitted.
+        :return: Vertex Info
+        """
+
+        if field is None:
+            edges = self.find_all_vertex_info(source_node, destination_node)
+            return edges[0] if edges else None
+
+        self.flush()
+        return self._find_vertex_info(source_node.canonical_id, destination_node.canonical_id,
+                                      field)
+
+    def find_all_vertex_info(self, source_node: BaseNode,
+                             destination_node: BaseNode) -> list[VertexInfo]:
+        """
+        Retrieves the Vertex Info for every relationship from the Source to the Destination Node.
+        :param source_node: Source Node
+        :param destination_node: Destination Node
+        :return: List of Vertex Info
+        """
+
+        self.flush()
+        return self._find_all_vertex_info(source_node.canonical_id,
+                                          destination_node.canonical_id)
+
+    def remove_node(self, node: BaseNode) -> bool:
+        """
+        Removes a Node and every Vertex of the Node from the Graph.
+        :param node: Node to Remove
+        :return: True if the Node was in the Graph
+        """
+
+        return self.remove_nodes([node]) == 1
+
+    def remove_nodes(self, removed_nodes: Iterable[BaseNode]) -> int:
+        """
+        Removes many Nodes and their Vertices in a single transaction.
+        :param removed_nodes: Nodes to Remove
+        :return: Number of Nodes removed
+        """
+
+        self.flush()
+        canonical_ids = [(x,) for x in dict.fromkeys(x.canonical_id for x in removed_nodes)]
+        with self.connection:
+            self.connection.executemany('DELETE FROM vertex_info WHERE source = ?',
+                                        canonical_ids)
+            self.connection.executemany('DELETE FROM vertex_info WHERE destination = ?',
+                                        canonical_ids)
+            self.connection.executemany(
+                'DELETE FROM vertices WHERE (source, destination) IN '
+                '(SELECT destination, source FROM vertices WHERE source = ?)', canonical_ids)
+            self.connection.executemany('DELETE FROM vertices WHERE source = ?', canonical_ids)
+            return self.connection.executemany('DELETE FROM nodes WHERE canonical_id = ?',
+                                               canonical_ids).rowcount
+
+    def remove_vertex(self, source_node: BaseNode, destination_node: BaseNode,
+                      field: str | None = None) -> bool:
+        """
+        Removes a Vertex between two Nodes.
+
+        With a field only that relationship is removed, and the Nodes stay related while other
+        relationships connect them. Without a field every relationship between the Nodes, in both
+        directions, is removed.
+        :param source_node: Source Node
+        :param destination_node: Destination Node
+        :param field: Optional Field Name of the relationship
+        :return: True if a Vertex was removed
+        """
+
+        self.flush()
+        pair = (source_node.canonical_id, destination_node.canonical_id,
+                destination_node.canonical_id, source_node.canonical_id)
+        either_direction = '(source = ? AND destination = ?) OR (source = ? AND destination = ?)'
+        with self.connection:
+            if field is not None:
+                if not self.connection.execute(
+                        'DELETE FROM vertex_info '
+                        'WHERE source = ? AND destination = ? AND field_name = ?',
+                        (*pair[:2], field)).rowcount:
+                    return False
+                if self.connection.execute(
+                        f"SELECT 1 FROM vertex_info WHERE {either_direction} LIMIT 1",
+                        pair).fetchone():
+                    return True
+            else:
+                self.connection.execute(f"DELETE FROM vertex_info WHERE {either_direction}", pair)
+            removed = self.connection.execute(f"DELETE FROM vertices WHERE {either_direction}",
+                                              pair).rowcount
+        return field is not None or removed > 0
+
+    def compact(self) -> None:
+        """
+        Reclaims the space left in the SQLite File by removed Nodes and Vertices.
+        :return: None
+        """
+
+        self.flush()
+        self.connection.execute('VACUUM')
+
+    def merge(self, other: NodeGraph, conflict_policy: str = 'keep') -> MergeStatistics:
+        """
+        Merges the Nodes and Vertices of another Graph into this Graph.
+
+        Nodes sharing a Canonical ID are stored once. When their values differ the conflict
+        policy decides the outcome: ``keep`` the existing Node, ``replace`` it with the incoming
+        Node, or raise a ValueError with ``error`` before anything is merged.
+        :param other: Graph to merge
+        :param conflict_policy: keep, replace or error
+        :return: Merge Statistics
+        """
+
+        if conflict_policy not in CONFLICT_POLICIES:
+            raise ValueError(f"Unknown conflict policy: {conflict_policy}")
+
+        self.flush()
+        if conflict_policy == 'error':
+            for canonical_id, node in other.nodes.items():
+                existing = self._load_node(canonical_id)
+                if existing is not None and not same_content(existing, node):
+                    raise ValueError(f"Conflicting node for {canonical_id}")
+
+        statistics = MergeStatistics()
+        for canonical_id, node in other.nodes.items():
+            existing = self._load_node(canonical_id)
+            if existing is None:
+                self._pending_nodes[canonical_id] = node
+                statistics.nodes_added += 1
+            elif same_content(existing, node):
+                statistics.nodes_shared += 1
+            else:
+                statistics.nodes_conflicted += 1
+                if conflict_policy == 'replace':
+                    self._pending_nodes[canonical_id] = node
+
+        self.flush()
+        with self.connection:
+            changes = self.connection.total_changes
+            self.connection.executemany(
+                'INSERT OR IGNORE INTO vertices (source, destination) VALUES (?, ?)',
+                ((x, y) for x, related in other.vertices.items() for y in related))
+            statistics.vertices_added = self.connection.total_changes - changes
+            changes = self.connection.total_changes
+            self.connection.executemany(
+                'INSERT OR IGNORE INTO vertex_info '
+                '(vertx_id, source, destination, field_name, meta) VALUES (?, ?, ?, ?, ?)',
+                (self._to_vertex_info_row(x) for x in other.vertex_info.values()))
+            statistics.vertex_info_added = self.connection.total_changes - changes
+        return statistics
+
+    def flush(self) -> None:
+        """
+        Writes the pending Nodes and Vertices in a single transaction.
+        :return: None
+        """
+
+        if not (self._pending_nodes or self._pending_vertices or self._pending_vertex_info):
+            return
+
+        with self.connection:
+            self.connection.executemany(
+                'INSERT INTO nodes (canonical_id, node_class, context_id, data) '
+                'VALUES (?, ?, ?, ?) ON CONFLICT (canonical_id) DO UPDATE SET '
+                'node_class = excluded.node_class, context_id = excluded.context_id, '
+                'data = excluded.data',
+                [self._to_row(x) for x in self._pending_nodes.values()])
+            self.connection.executemany(
+                'INSERT OR IGNORE INTO vertices (source, destination) VALUES (?, ?)',
+                self._pending_vertices)
+            self.connection.executemany(
+                'INSERT OR REPLACE INTO vertex_info '
+                '(vertx_id, source, destination, field_name, meta) VALUES (?, ?, ?, ?, ?)',
+                self._pending_vertex_info)
+
+        self._pending_nodes = {}
+        self._pending_vertices = []
+        self._pending_vertex_info = []
+
+    def commit(self) -> None:
+        """
+        Flushes the pending writes.
+        :return: None
+        """
+
+        self.flush()
+
+    def close(self) -> None:
+        """
+        Flushes the pending writes and closes the Connection.
+        :return: None
+        """
+
+        self.flush()
+        self.connection.close()
+
+    def _flush_if_full(self) -> None:
+        """
+        Flushes the pending writes once the batch size is reached.
+        :return: None
+        """
+
+        if (len(self._pending_nodes) + len(self._pending_vertices)
+                + len(self._pending_vertex_info)) >= self.batch_size:
+            self.flush()
+
+    def _load_node(self, canonical_id: str) -> BaseNode | None:
+        """
+        Reads a stored Node without flushing the pending writes.
+        :param canonical_id: Canonical ID
+        :return: Optional Node
+        """
+
+        row = self.connection.execute(
+            'SELECT canonical_id, node_class, context_id, data FROM nodes WHERE canonical_id = ?',
+            (canonical_id,)).fetchone()
+        return None if row is None else self._to_node(row)
+
+    def _select_nodes(self, node_type: str, conditions: list[str], parameters: list,
+                      order_by: str | None = None) -> list[BaseNode]:
+        """
+        Reads the stored Nodes of a type matching SQL conditions.
+
+        The Node type is written in the query so the partial indexes of the type apply.
+        :param node_type: Node class name
+        :param conditions: SQL conditions on the data column
+        :param parameters: Condition parameters
+        :param order_by: Optional SQL expression ordering the Nodes
+        :return: List of Nodes
+        """
+
+        if not node_type.isidentifier():
+            raise ValueError(f"Invalid node type: {node_type}")
+
+        self.flush()
+        query = ' AND '.join([f"node_class = '{node_type}'", *conditions])
+        if order_by is not None:
+            query += f" ORDER BY {order_by}"
+        return [self._to_node(x) for x in self.connection.execute(
+            f"SELECT canonical_id, node_class, context_id, data FROM nodes WHERE {query}",
+            parameters)]
+
+    def _find_vertices(self, canonical_id: str) -> set:
+        """
+        Reads the Canonical IDs related to a Node.
+        :param canonical_id: Canonical ID
+        :return: Set of Canonical IDs
+        """
+
+        return {x for x, in self.connection.execute(
+            'SELECT destination FROM vertices WHERE source = ?', (canonical_id,))}
+
+    def _find_node_vertex_info(self, canonical_id: str) -> set:
+        """
+        Reads the Vertex Info IDs of a Node.
+        :param canonical_id: Canonical ID
+        :return: Set of Vertex Info IDs
+        """
+
+        return {x for x, in self.connection.execute(
+            'SELECT vertx_id FROM vertex_info WHERE source = ? '
+            'UNION SELECT vertx_id FROM vertex_info WHERE destination = ?',
+            (canonical_id, canonical_id))}
+
+    def _find_vertex_info(self, source: str, destination: str,
+                          field: str) -> VertexInfo | None:
+        """
+        Reads the Vertex Info of a relationship.
+        :param source: Source Canonical ID
+        :param destination: Destination Canonical ID
+        :param field: Field Name
+        :return: Vertex Info
+        """
+
+        row = self.connection.execute(
+            'SELECT source, destination, field_name, meta FROM vertex_info '
+            'WHERE source = ? AND destination = ? AND field_name = ?',
+            (source, destination, field)).fetchone()
+        return None if row is None else self._to_vertex_info(row)
+
+    def _find_all_vertex_info(self, source: str, destination: str) -> list[VertexInfo]:
+        """
+        Reads the Vertex Info of every relationship from the Source to the Destination.
+        :param source: Source Canonical ID
+        :param destination: Destination Canonical ID
+        :return: List of Vertex Info
+        """
+
+        return [self._to_vertex_info(x) for x in self.connection.execute(
+            'SELECT source, destination, field_name, meta FROM vertex_info '
+            'WHERE source = ? AND destination = ?', (source, destination))]
+
+    def _to_node(self, row: tuple) -> BaseNode:
+        """
+        Converts a nodes table row to a Node.
+        :param row: Canonical ID, Node Class, Context Id and Data
+        :return: Node
+        """
+
+        canonical_id, node_class, context_id, data = row
+        values = {x: decode_value(y) for x, y in json.loads(data).items()}
+        return getattr(nodes, node_class)(context=self._get_context(context_id),
+                                          canonical_id=canonical_id, **values)
+
+    def _to_row(self, node: BaseNode) -> tuple:
+        """
+        Converts a Node to a nodes table row.
+        :param node: Node
+        :return: Row Values
+        """
+
+        data = {x.name: encode_value(getattr(node, x.name)) for x in fields(node)
+                if x.name not in ('context', 'canonical_id')}
+        return (node.canonical_id, type(node).__name__, self._get_context_id(node.context),
+                json.dumps(data))
+
+    def _get_context_id(self, context: DocumentContext) -> int:
+        """
+        Retrieves or stores the Id of a Document Context.
+        :param context: Document Context
+        :return: Context Id
+        """
+
+        context_id = self._context_ids.get(context)
+        if context_id is not None:
+            return context_id
+
+        values = [encode_value(getattr(context, x)) for x in CONTEXT_FIELDS]
+        values = [x['$datetime'] if isinstance(x, dict) else x for x in values]
+        self.connection.execute(
+            f"INSERT OR IGNORE INTO contexts ({', '.join(CONTEXT_FIELDS)}) "
+            f"VALUES ({', '.join('?' * len(CONTEXT_FIELDS))})", values)
+        context_id = self.connection.execute(
+            f"SELECT context_id FROM contexts WHERE "
+            f"{' AND '.join(f'{x} = ?' for x in CONTEXT_FIELDS)}", values).fetchone()[0]
+        self._context_ids[context] = context_id
+        return context_id
+
+    def _get_context(self, context_id: int) -> DocumentContext:
+        """
+        Retrieves a Document Context, sharing the instance between Nodes.
+        :param context_id: Context Id
+        :return: Document Context
+        """
+
+        context = self._contexts.get(context_id)
+        if context is None:
+            row = self.connection.execute(
+                f"SELECT {', '.join(CONTEXT_FIELDS)} FROM contexts WHERE context_id = ?",
+                (context_id,)).fetchone()
+            values = dict(zip(CONTEXT_FIELDS, row))
+            values['etl_load_datetime'] = datetime.fromisoformat(values['etl_load_datetime'])
+            values['etl_src_inc_datetime'] = datetime.fromisoformat(
+                values['etl_src_inc_datetime'])
+            context = self._contexts[context_id] = DocumentContext(**values)
+        return context
+
+    @staticmethod
+    def _to_vertex_info_row(vertex_info: VertexInfo) -> tuple:
+        """
+        Converts Vertex Info to a vertex_info table row.
+        :param vertex_info: Vertex Info
+        :return: Row Values
+        """
+
+        return (vertex_info.vertx_id, vertex_info.source_node, vertex_info.destination_node,
+                vertex_info.field_name,
+                None if vertex_info.meta is None else json.dumps(vertex_info.meta))
+
+    @staticmethod
+    def _to_vertex_info(row: tuple) -> VertexInfo:
+        """
+        Converts a vertex_info table row to Vertex Info.
+        :param row: Source, Destination, Field Name and Meta
+        :return: Vertex Info
+        """
+
+        source, destination, field_name, meta = row
+        return VertexInfo.from_canonical_ids(source, destination, field_name,
+                                             meta=None if meta is None else json.loads(meta))
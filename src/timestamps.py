@@ -0,0 +1,70 @@
+"""
+Parsing of HL7 v3 TS (point in time) and PQ (physical quantity) time values.
+"""
+
+import re
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+
+TIMESTAMP_PATTERN = re.compile(
+    r'(\d{4})(\d{2})?(\d{2})?(\d{2})?(\d{2})?(\d{2})?(?:\.(\d{1,4}))?(?:([+-])(\d{2})(\d{2}))?')
+
+UNITS = {
+    's': 'seconds',
+    'min': 'minutes',
+    'h': 'hours',
+    'd': 'days',
+    'wk': 'weeks'
+}
+
+
+@lru_cache(maxsize=8192)
+def parse_timestamp(value: str | None) -> datetime | None:
+    """
+    Parses an HL7 TS value of any precision from YYYY to YYYYMMDDHHMMSS.ffff+ZZZZ.
+
+    Missing components default to the start of the period and the result is timezone aware when
+    an offset is present. Results are memoized since the same values repeat within a Document.
+    :param value: TS value
+    :return: Optional Datetime, None when the value is empty or invalid
+    """
+
+    if not value:
+        return None
+
+    match = TIMESTAMP_PATTERN.fullmatch(value.strip())
+    if match is None:
+        return None
+
+    year, month, day, hour, minute, second, fraction, sign, offset_hours, offset_minutes = \
+        match.groups()
+
+    try:
+        tzinfo = None
+        if sign:
+            offset = timedelta(hours=int(offset_hours), minutes=int(offset_minutes))
+            tzinfo = timezone(-offset if sign == '-' else offset)
+
+        return datetime(int(year), int(month or 1), int(day or 1), int(hour or 0),
+                        int(minute or 0), int(second or 0),
+                        int(fraction.ljust(6, '0')) if fraction else 0, tzinfo=tzinfo)
+    except ValueError:
+        return None
+
+
+def parse_duration(value: str | None, unit: str | None) -> timedelta | None:
+    """
+    Parses an HL7 PQ time value like an IVL_TS width.
+    :param value: Quantity
+    :param unit: UCUM unit, one of s, min, h, d or wk
+    :return: Optional Timedelta, None when the value or unit is unsupported
+    """
+
+    name = UNITS.get(unit or 's')
+    if not value or name is None:
+        return None
+
+    try:
+        return timedelta(**{name: float(value)})
+    except ValueError:
+        return None
@@ -10,6 +10,8 @@ class VertexInfo:
     Base Vertex Class
     """
 
+    __slots__ = ('vertx_id', 'source_node', 'destination_node', 'field_name', 'meta')
+
     vertx_id: str
     source_node: str
     destination_node: str
@@ -26,8 +28,28 @@ class VertexInfo:
         :keyword meta: Dictionary or String to add additional information about the relationship.
         """
 
-        self.vertx_id = f"{source_node.canonical_id}_{destination_node.canonical_id}"
+        self.vertx_id = f"{source_node.canonical_id}_{destination_node.canonical_id}_{field_name}"
         self.source_node = source_node.canonical_id
         self.destination_node = destination_node.canonical_id
         self.field_name = field_name
         self.meta = kwargs.get('meta')
+
+    @classmethod
+    def from_canonical_ids(cls, source_node: str, destination_node: str, field_name: str,
+                           **kwargs) -> 'VertexInfo':
+        """
+        Creates the Vertex Info for a relationship from the Canonical IDs of its Nodes.
+        :param source_node: Source Node Canonical ID
+        :param destination_node: Destination Node Canonical ID
+        :param field_name: Relationship Field Name
+        :keyword meta: Dictionary or String to add additional information about the relationship.
+        :return: Vertex Info
+        """
+
+        vertex_info = cls.__new__(cls)
+        vertex_info.vertx_id = f"{source_node}_{destination_node}_{field_name}"
+        vertex_info.source_node = source_node
+        vertex_info.destination_node = destination_node
+        vertex_info.field_name = field_name
+        vertex_info.meta = kwargs.get('meta')
+        return vertex_info
@@ -0,0 +1,127 @@
+"""
+Tests for the Batch Ingestor
+"""
+
+import shutil
+
+from lxml.etree import ElementBase
+from assertpy import assert_that
+from src.batch import BatchIngestor
+from src.graphs import NodeGraph
+from src.nodes import IdentifierNode
+import pytest
+
+TEST_FILE = './tests/test_files/test-ccda.xml'
+
+NAMESPACES = {
+    'v3': 'urn:hl7-org:v3',
+    'voc': 'urn:hl7-org:v3/voc',
+    'sdtc': 'urn:hl7-org:sdtc',
+    'xsi': 'http://www.w3.org/2001/XMLSchema-instance'
+}
+
+
+def map_document(document: ElementBase, factory) -> NodeGraph:
+    """
+    Maps the Document Id and Encounter Ids of a Document.
+    :param document: ClinicalDocument Element
+    :param factory: Node Factory
+    :return: Node Graph
+    """
+
+    graph = NodeGraph()
+    document_id = document.find('./v3:id', namespaces=NAMESPACES)
+    document_node = IdentifierNode(context=factory.context,
+                                   canonical_id=f"urn:test:document:{factory.doc_id}",
+                                   root=document_id.get('root', ''),
+                                   extension=document_id.get('extension', ''),
+                                   assign_authority='')
+    for id_element in document.iterfind('.//v3:encounter/v3:id', namespaces=NAMESPACES):
+        id_node = IdentifierNode(
+            context=factory.context,
+            canonical_id=f"{id_element.get('root', '')}:{id_element.get('extension', '')}",
+            root=id_element.get('root', ''), extension=id_element.get('extension', ''),
+            assign_authority='')
+        graph.add_vertex(document_node, id_node, 'id')
+    return graph
+
+
+def map_failing_document(document: ElementBase, factory) -> NodeGraph:
+    """
+    Maps a Document, failing for the second Document.
+    :param document: ClinicalDocument Element
+    :param factory: Node Factory
+    :return: Node Graph
+    """
+
+    if factory.doc_id == 2:
+        raise KeyError('chicken')
+    return map_document(document, factory)
+
+
+@pytest.fixture
+def document_directory(tmp_path) -> str:
+    """
+    Creates a Directory with three Documents and one invalid Document.
+    :param tmp_path: Temporary Path
+    :return: Directory Path
+    """
+
+    for index in range(3):
+        shutil.copy(TEST_FILE, tmp_path / f"document-{index}.xml")
+    (tmp_path / 'invalid.xml').write_text('<ClinicalDocument>')
+    return str(tmp_path)
+
+
+def test_ingest_merged(document_directory):
+    """
+    Tests ingesting a Directory into a single merged Graph.
+    """
+
+    ingestor = BatchIngestor(NAMESPACES, map_document, max_workers=2, chunk_size=2)
+
+    result = ingestor.ingest(document_directory)
+
+    assert_that(result.graph).is_not_none()
+    assert_that(result.errors).is_length(1)
+    assert_that([x for x in result.graph.nodes if x.startswith('urn:test:document:')]) \
+        .contains_only('urn:test:document:1', 'urn:test:document:2', 'urn:test:document:3')
+    assert_that(result.graph.nodes).is_length(4)
+    assert_that(sum(x.documents for x in result.workers.values())).is_equal_to(3)
+    assert_that(result.statistics.nodes_added).is_equal_to(4)
+    assert_that(result.statistics.nodes_shared).is_equal_to(2)
+
+
+def test_ingest_per_document(document_directory):
+    """
+    Tests ingesting a Glob into a Graph per Document.
+    """
+
+    ingestor = BatchIngestor(NAMESPACES, map_document, max_workers=1, merge=False,
+                             factory_kwargs={'etl_dg_code': 20})
+
+    result = ingestor.ingest(f"{document_directory}/document-*.xml")
+
+    assert_that(result.graph).is_none()
+    assert_that(result.graphs).is_length(3)
+    for path, graph in result.graphs.items():
+        node = next(iter(graph.nodes.values()))
+        assert_that(node.doc_source_id).is_equal_to(path.split('/')[-1])
+        assert_that(node.etl_dg_code).is_equal_to(20)
+
+
+def test_ingest_mapping_error(document_directory):
+    """
+    Tests a Document failing to map is recorded without losing the other Documents.
+    """
+
+    ingestor = BatchIngestor(NAMESPACES, map_failing_document, max_workers=1, chunk_size=2)
+
+    result = ingestor.ingest(f"{document_directory}/document-*.xml")
+
+    assert_that(result.errors).is_length(1)
+    assert_that(list(result.errors.values())[0]).contains('KeyError')
+    assert_that(list(result.errors)[0]).ends_with('document-1.xml')
+    assert_that([x for x in result.graph.nodes if x.startswith('urn:test:document:')]) \
+        .contains_only('urn:test:document:1', 'urn:test:document:3')
+    assert_that(sum(x.documents for x in result.workers.values())).is_equal_to(2)
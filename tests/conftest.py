@@ -0,0 +1,52 @@
+"""
+Shared Fixtures for the Unit Tests
+"""
+
+from collections.abc import Callable
+from datetime import datetime
+
+import pytest
+
+from src.nodes import CodeNode, DocumentContext
+
+
+@pytest.fixture
+def build_context() -> Callable[..., DocumentContext]:
+    """
+    Provides a function creating the Document Context of a test Document.
+    :return: Function of an optional Document Id
+    """
+
+    def build(doc_id: int = 1) -> DocumentContext:
+        return DocumentContext(doc_id=doc_id, doc_source_id='test', etl_dg_code=20,
+                               etl_load_datetime=datetime(2024, 1, 22, 0, 0, 0),
+                               etl_src_inc_datetime=datetime(2024, 1, 22, 0, 0, 0),
+                               etl_src_sys_id=10)
+
+    return build
+
+
+@pytest.fixture
+def context(build_context) -> DocumentContext:
+    """
+    Provides the Document Context of the first test Document.
+    :return: Document Context
+    """
+
+    return build_context()
+
+
+@pytest.fixture
+def build_code_node(context) -> Callable[..., CodeNode]:
+    """
+    Provides a function creating Code Nodes identified by Code System and Code.
+    :return: Function of a Code, an optional Code System and an optional Display Name
+    """
+
+    def build(code: str, code_system: str = '2.16.840.1.113883.6.96',
+              display_name: str = '') -> CodeNode:
+        return CodeNode(context=context, canonical_id=f"{code_system}:{code}", code=code,
+                        code_system=code_system, code_system_name='', code_system_version='',
+                        display_name=display_name)
+
+    return build
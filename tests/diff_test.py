@@ -0,0 +1,83 @@
+"""
+Tests for the Graph Changesets
+"""
+
+from assertpy import assert_that
+from lxml import etree
+
+from src.diffs import diff_graphs
+from src.factories import NodeFactory
+from src.graphs import NodeGraph
+from src.mappings import SectionMapper, ENCOUNTER_SECTION
+from src.nodes import CodeNode
+
+TEST_FILE = './tests/test_files/test-ccda.xml'
+
+NAMESPACES = {'v3': 'urn:hl7-org:v3'}
+
+
+def graph_state(graph: NodeGraph) -> tuple:
+    """
+    Summarizes the content of a Graph for comparisons.
+    :param graph: Node Graph
+    :return: Sorted Canonical IDs, Edges and Vertices
+    """
+
+    return (sorted(graph.nodes), sorted(graph.edge_index),
+            sorted((x, y) for x, z in graph.vertices.items() for y in z),
+            sorted((x, sorted(y)) for x, y in graph.node_vertex_info.items() if y))
+
+
+def test_diff_and_apply(build_code_node):
+    """
+    Tests the changeset of two Graph versions turns the previous Graph into the current one.
+    """
+
+    def code(value: str, display_name: str = '') -> CodeNode:
+        return build_code_node(value, '1.2.3', display_name)
+
+    previous = NodeGraph()
+    previous.add_vertex(code('1'), code('2'), 'translation')
+    previous.add_vertex(code('1'), code('3'), 'translation')
+    previous.add_vertex(code('3'), code('4'), None)
+
+    current = NodeGraph()
+    current.add_vertex(code('1'), code('2', 'Changed'), 'translation')
+    current.add_vertex(code('1'), code('5'), 'translation')
+    current.add_vertex(code('2', 'Changed'), code('5'), None)
+
+    changes = diff_graphs(previous, current)
+
+    assert_that(changes.added_nodes).extracting('canonical_id').is_equal_to(['1.2.3:5'])
+    assert_that(changes.changed_nodes).extracting('display_name').is_equal_to(['Changed'])
+    assert_that(sorted(changes.removed_nodes)).is_equal_to(['1.2.3:3', '1.2.3:4'])
+    assert_that(changes.removed_edges).is_equal_to([('1.2.3:1', '1.2.3:3', 'translation')])
+    assert_that(changes.added_vertices).is_equal_to([('1.2.3:2', '1.2.3:5')])
+    assert_that(changes.removed_vertices).is_equal_to([('1.2.3:3', '1.2.3:4')])
+
+    previous.add_index('CodeNode', 'display_name')
+    changes.apply(previous)
+
+    assert_that(graph_state(previous)).is_equal_to(graph_state(current))
+    assert_that(previous.find_nodes('CodeNode', display_name='Changed')).is_length(1)
+    assert_that(diff_graphs(previous, current)).is_empty()
+
+
+def test_document_versions(build_context):
+    """
+    Tests a resent Document with new provenance yields an empty changeset.
+    """
+
+    document = etree.parse(TEST_FILE).getroot()
+    mapper = SectionMapper(NAMESPACES, [ENCOUNTER_SECTION])
+    previous = mapper(document, NodeFactory(NAMESPACES, context=build_context(1)))
+    current = mapper(document, NodeFactory(NAMESPACES, context=build_context(2)))
+
+    assert_that(diff_graphs(previous, current)).is_empty()
+
+    document.find('.//{urn:hl7-org:v3}encounter/{urn:hl7-org:v3}statusCode').set('code', 'active')
+    changes = diff_graphs(previous, mapper(document, NodeFactory(NAMESPACES,
+                                                                 context=build_context(3))))
+
+    assert_that(changes).is_length(1)
+    assert_that(changes.changed_nodes[0]).has_status_code('active')
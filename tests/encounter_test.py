@@ -2,7 +2,6 @@
 Test usage for mapping an encounter.
 """
 import urllib.parse
-import uuid
 
 from lxml.etree import ElementBase
 from lxml import etree
@@ -10,16 +9,16 @@ import os
 
 from src.graphs import NodeGraph
 from src.nodes import NameNode, DiagnosisNode, BaseNode, IdentifierNode, CodeNode, AddressNode, \
-    EncounterNode, GeneralEntityNode, ContactNode
+    EncounterNode, GeneralEntityNode, ContactNode, DocumentContext
 from src.vertices import VertexInfo
+from src.readers import SectionIndex
+from src.factories import ValueFactory, NodeFactory
 import pytest
 from datetime import datetime
 import json
 
 TEST_FILE = './tests/test_files/test-ccda.xml'
 
-DATEFORMAT = '%Y%m%d'
-
 NAMESPACES = {
     'v3': 'urn:hl7-org:v3',
     'voc': 'urn:hl7-org:v3/voc',
@@ -39,24 +38,6 @@ def xml_file() -> bytes:
         return input_file.read()
 
 
-def get_section(ccda: ElementBase, template_id: str) -> ElementBase | None:
-    """
-    Retrieves the Section for a Given Template ID
-    :param ccda: CCDA File
-    :param template_id: Template ID Oid
-    :return: Section
-    """
-
-    components = ccda.findall('./v3:component/v3:structuredBody/v3:component',
-                              namespaces=NAMESPACES)
-
-    for component in components:
-        templates = component.findall('./v3:section/v3:templateId', namespaces=NAMESPACES)
-        if len([x for x in templates if x.get('root') == template_id]) > 0:
-            return component.find('./v3:section', namespaces=NAMESPACES)
-    return None
-
-
 def test_graph_encounter(xml_file) -> None:
     """
     Test Graphing an Encounter.
@@ -69,21 +50,25 @@ def test_graph_encounter(xml_file) -> None:
 
     document_id = 1
     source_id = 5
+    context = DocumentContext(doc_id=document_id, doc_source_id=str(source_id), etl_dg_code=0,
+                              etl_load_datetime=datetime.now(),
+                              etl_src_inc_datetime=datetime.now(), etl_src_sys_id=source_id)
 
     document_id_element: ElementBase = ccda_file.find('./v3:id', namespaces=NAMESPACES)
 
     document_id_node = IdentifierNode(
-        doc_id=document_id,
-        doc_source_id=str(source_id),
+        context=context,
         canonical_id=f"{document_id_element.get('root', '')}:{document_id_element.get('extension', '')}",
-        etl_dg_code=0, etl_load_datetime=datetime.now(), etl_src_inc_datetime=datetime.now(),
-        etl_src_sys_id=source_id, root=document_id_element.get('root', ''),
+        root=document_id_element.get('root', ''),
         extension=document_id_element.get('extension', ''),
         assign_authority=document_id_element.get('assigningAuthorityName', ''))
 
     ccda_graph.add_node(document_id_node)
 
-    encounter_section = get_section(ccda_file, '2.16.840.1.113883.10.20.22.2.22')
+    section_index = SectionIndex(NAMESPACES, ccda_file)
+    value_factory = ValueFactory(NAMESPACES)
+    node_factory = NodeFactory(NAMESPACES, context=context)
+    encounter_section = section_index.get_section('2.16.840.1.113883.10.20.22.2.22')
 
     if encounter_section is None:
         raise SyntaxError('No Encounter Section Found')
@@ -101,38 +86,23 @@ def test_graph_encounter(xml_file) -> None:
                                                                   namespaces=NAMESPACES)
         type_code_element: ElementBase = encounter_element.find('./v3:code', namespaces=NAMESPACES)
 
-        effective_time_start_element: ElementBase = encounter_element.find(
-            './v3:effectiveTime/v3:low', namespaces=NAMESPACES)
-        effective_time_end_element: ElementBase = encounter_element.find(
-            './v3:effectiveTime/v3:high', namespaces=NAMESPACES)
-
-        encounter_start = ''
-        encounter_end = ''
-        if effective_time_start_element is not None:
-            encounter_start = effective_time_start_element.get('value', '')
-        if effective_time_end_element is not None:
-            encounter_end = effective_time_end_element.get('value', '')
+        effective_time = value_factory.build_effective_time(
+            encounter_element.find('./v3:effectiveTime', namespaces=NAMESPACES))
 
         encounter_node = EncounterNode(
-            doc_id=document_id,
-            doc_source_id=str(source_id),
-            etl_dg_code=0, etl_load_datetime=datetime.now(),
-            etl_src_inc_datetime=datetime.now(),
-            etl_src_sys_id=source_id,
-            canonical_id=f"http://upmc.com/encounter/{uuid.uuid4()}",
+            context=context,
+            canonical_id=node_factory.build_canonical_id(
+                'EncounterNode', *[f"{x.get('root', '')}:{x.get('extension', '')}"
+                                   for x in encounter_ids]),
             status_code=status_code_element.get('code', ''),
-            encounter_start=datetime.strptime(encounter_start[:8], DATEFORMAT),
-            encounter_end=datetime.strptime(encounter_end[:8], DATEFORMAT)
+            encounter_start=effective_time['low'],
+            encounter_end=effective_time['high']
         )
 
         ccda_graph.add_node(encounter_node)
 
         type_code_node = CodeNode(
-            doc_id=document_id,
-            doc_source_id=str(source_id),
-            etl_dg_code=0, etl_load_datetime=datetime.now(),
-            etl_src_inc_datetime=datetime.now(),
-            etl_src_sys_id=source_id,
+            context=context,
             canonical_id=f"{type_code_element.get('codeSystem', '')}:{type_code_element.get('code', '')}",
             code_system=type_code_element.get('code_system', ''),
             code=type_code_element.get('code', ''),
@@ -145,11 +115,7 @@ def test_graph_encounter(xml_file) -> None:
                                                                          namespaces=NAMESPACES)
 
         for code_translation in code_translations:
-            translation_code_node = CodeNode(doc_id=document_id,
-                                             doc_source_id=str(source_id),
-                                             etl_dg_code=0, etl_load_datetime=datetime.now(),
-                                             etl_src_inc_datetime=datetime.now(),
-                                             etl_src_sys_id=source_id,
+            translation_code_node = CodeNode(context=context,
                                              canonical_id=f"{code_translation.get('codeSystem', '')}:{code_translation.get('code', '')}",
                                              code_system=code_translation.get('code_system', ''),
                                              code=code_translation.get('code', ''),
@@ -166,12 +132,9 @@ def test_graph_encounter(xml_file) -> None:
 
         for encounter_id in encounter_ids:
             encounter_id_node = IdentifierNode(
-                doc_id=document_id,
-                doc_source_id=str(source_id),
+                context=context,
                 canonical_id=f"{encounter_id.get('root', '')}:{encounter_id.get('extension', '')}",
-                etl_dg_code=0, etl_load_datetime=datetime.now(),
-                etl_src_inc_datetime=datetime.now(),
-                etl_src_sys_id=source_id, root=encounter_id.get('root', ''),
+                root=encounter_id.get('root', ''),
                 extension=encounter_id.get('extension', ''),
                 assign_authority=encounter_id.get('assigningAuthorityName', '')
             )
@@ -185,11 +148,7 @@ def test_graph_encounter(xml_file) -> None:
             function_code_element: ElementBase = performer_element.find('./v3:functionCode',
                                                                         namespaces=NAMESPACES)
             function_code_node = CodeNode(
-                doc_id=document_id,
-                doc_source_id=str(source_id),
-                etl_dg_code=0, etl_load_datetime=datetime.now(),
-                etl_src_inc_datetime=datetime.now(),
-                etl_src_sys_id=source_id,
+                context=context,
                 canonical_id=f"{function_code_element.get('codeSystemName', '')}:{function_code_element.get('code', '')}",
                 code=function_code_element.get('code', ''),
                 code_system=function_code_element.get('codeSystem', ''),
@@ -202,11 +161,7 @@ def test_graph_encounter(xml_file) -> None:
                 './translation', namespaces=NAMESPACES)
             for function_code_translation_element in function_code_translation_elements:
                 translation_code_node = CodeNode(
-                    doc_id=document_id,
-                    doc_source_id=str(source_id),
-                    etl_dg_code=0, etl_load_datetime=datetime.now(),
-                    etl_src_inc_datetime=datetime.now(),
-                    etl_src_sys_id=source_id,
+                    context=context,
                     canonical_id=f"{function_code_translation_element.get('codeSystemName', '')}:{function_code_translation_element.get('code', '')}",
                     code=function_code_translation_element.get('code', ''),
                     code_system=function_code_translation_element.get('codeSystem', ''),
@@ -221,12 +176,11 @@ def test_graph_encounter(xml_file) -> None:
             assigned_entity_element: ElementBase = performer_element.find('./v3:assignedEntity',
                                                                           namespaces=NAMESPACES)
             performer_entity_node = GeneralEntityNode(
-                doc_id=document_id,
-                doc_source_id=str(source_id),
-                etl_dg_code=0, etl_load_datetime=datetime.now(),
-                etl_src_inc_datetime=datetime.now(),
-                etl_src_sys_id=source_id,
-                canonical_id=f"urn:uuid:{uuid.uuid4()}",
+                context=context,
+                canonical_id=node_factory.build_canonical_id(
+                    'GeneralEntityNode', 'ASSIGNED',
+                    *[f"{x.get('root', '')}:{x.get('extension', '')}" for x in
+                      assigned_entity_element.findall('./v3:id', namespaces=NAMESPACES)]),
                 class_code='ASSIGNED')
 
             ccda_graph.add_node(performer_entity_node)
@@ -236,11 +190,7 @@ def test_graph_encounter(xml_file) -> None:
                                                                     namespaces=NAMESPACES)
             for performer_id_element in performer_id_elements:
                 id_node = IdentifierNode(
-                    doc_id=document_id,
-                    doc_source_id=str(source_id),
-                    etl_dg_code=0, etl_load_datetime=datetime.now(),
-                    etl_src_inc_datetime=datetime.now(),
-                    etl_src_sys_id=source_id,
+                    context=context,
                     canonical_id=f"{performer_id_element.get('root', '')}:{performer_id_element.get('extension', '')}",
                     root=performer_id_element.get('root', ''),
                     extension=performer_id_element.get('extension', ''),
@@ -252,11 +202,7 @@ def test_graph_encounter(xml_file) -> None:
             performer_code_element = assigned_entity_element.find('./v3:code',
                                                                   namespaces=NAMESPACES)
             performer_code_node = CodeNode(
-                doc_id=document_id,
-                doc_source_id=str(source_id),
-                etl_dg_code=0, etl_load_datetime=datetime.now(),
-                etl_src_inc_datetime=datetime.now(),
-                etl_src_sys_id=source_id,
+                context=context,
                 canonical_id=f"{performer_code_element.get('codeSystemName', '')}:{performer_code_element.get('code', '')}",
                 code=performer_code_element.get('code', ''),
                 code_system=performer_code_element.get('codeSystem', ''),
@@ -270,11 +216,7 @@ def test_graph_encounter(xml_file) -> None:
                                                                                  namespaces=NAMESPACES)
             for performer_code_translation_element in performer_code_translation_elements:
                 translation_code_node = CodeNode(
-                    doc_id=document_id,
-                    doc_source_id=str(source_id),
-                    etl_dg_code=0, etl_load_datetime=datetime.now(),
-                    etl_src_inc_datetime=datetime.now(),
-                    etl_src_sys_id=source_id,
+                    context=context,
                     canonical_id=f"{performer_code_translation_element.get('codeSystemName', '')}:{performer_code_translation_element.get('code', '')}",
                     code=performer_code_translation_element.get('code', ''),
                     code_system=performer_code_translation_element.get('codeSystem', ''),
@@ -297,12 +239,12 @@ def test_graph_encounter(xml_file) -> None:
                                                                   namespaces=NAMESPACES)
 
                 address_node = AddressNode(
-                    doc_id=document_id,
-                    doc_source_id=str(source_id),
-                    etl_dg_code=0, etl_load_datetime=datetime.now(),
-                    etl_src_inc_datetime=datetime.now(),
-                    etl_src_sys_id=source_id,
-                    canonical_id=f"urn:uuid:{uuid.uuid4()}",
+                    context=context,
+                    canonical_id=node_factory.build_canonical_id(
+                        'AddressNode', performer_address_element.get('use', ''), address_lines,
+                        city_element.text if city_element is not None else '',
+                        state_element.text if state_element is not None else '',
+                        zip_code_element.text if zip_code_element is not None else '', 'US'),
                     street_address_line=address_lines,
                     country='US',
                     city=city_element.text if city_element is not None else '',
@@ -318,11 +260,7 @@ def test_graph_encounter(xml_file) -> None:
             performer_phone_elements = assigned_entity_element.findall('./v3:tel',
                                                                        namespaces=NAMESPACES)
             for performer_phone_element in performer_phone_elements:
-                contact_node = ContactNode(doc_id=document_id,
-                                           doc_source_id=str(source_id),
-                                           etl_dg_code=0, etl_load_datetime=datetime.now(),
-                                           etl_src_inc_datetime=datetime.now(),
-                                           etl_src_sys_id=source_id,
+                contact_node = ContactNode(context=context,
                                            canonical_id=f"http://upmc.com/contact/value/{performer_phone_element.get('value', '')}",
                                            use=performer_phone_element.get('use', ''),
                                            value=performer_phone_element.get('value', ''))
@@ -332,12 +270,9 @@ def test_graph_encounter(xml_file) -> None:
                 './v3:assignedPerson/v3:name', namespaces=NAMESPACES)
 
             performer_person_node = BaseNode(
-                doc_id=document_id,
-                doc_source_id=str(source_id),
-                etl_dg_code=0, etl_load_datetime=datetime.now(),
-                etl_src_inc_datetime=datetime.now(),
-                etl_src_sys_id=source_id,
-                canonical_id=f"urn:uuid:{uuid.uuid4()}"
+                context=context,
+                canonical_id=node_factory.build_canonical_id('assignedPerson',
+                                                             performer_entity_node.canonical_id)
             )
             ccda_graph.add_node(performer_person_node)
             ccda_graph.add_vertex(performer_entity_node, performer_person_node, 'assignedPerson')
@@ -351,11 +286,7 @@ def test_graph_encounter(xml_file) -> None:
                 suffix_element = person_name_element.find('./v3:suffix', namespaces=NAMESPACES)
 
                 name_node = NameNode(
-                    doc_id=document_id,
-                    doc_source_id=str(source_id),
-                    etl_dg_code=0, etl_load_datetime=datetime.now(),
-                    etl_src_inc_datetime=datetime.now(),
-                    etl_src_sys_id=source_id,
+                    context=context,
                     family_name=family_name_element.text if family_name_element is not None else '',
                     given_name=given_name_string,
                     canonical_id=f"http://upmc.com/performers/names/{urllib.parse.quote_plus(given_name_string)}_{urllib.parse.quote_plus(family_name_element.text)}_{urllib.parse.quote_plus(suffix_element.text)}",
@@ -0,0 +1,109 @@
+"""
+Tests for the CSV Exporter
+"""
+
+import csv
+import gzip
+from datetime import datetime
+
+from assertpy import assert_that
+from src.exporters import CsvExporter
+from src.graphs import NodeGraph
+from src.nodes import CodeNode, EncounterNode, DocumentContext
+from src.vertices import VertexInfo
+
+
+def build_graph(index: int, context: DocumentContext) -> NodeGraph:
+    """
+    Creates a Graph with an Encounter and a shared Code.
+    :param index: Encounter Number
+    :param context: Document Context
+    :return: Node Graph
+    """
+
+    encounter = EncounterNode(context=context, canonical_id=f"urn:test:encounter:{index}",
+                              status_code='completed', encounter_start=datetime(2020, 5, 13),
+                              encounter_end=datetime(2020, 5, 14))
+    code = CodeNode(context=context, canonical_id='2.16.840.1.113883.6.96:1', code='1',
+                    code_system='2.16.840.1.113883.6.96', code_system_name='SNOMED CT',
+                    code_system_version='', display_name='Code, "quoted"')
+    graph = NodeGraph()
+    graph.add_vertex_with_info(encounter, code, VertexInfo(encounter, code, 'code',
+                                                           meta={'index': index}))
+    return graph
+
+
+def read_rows(path: str) -> list[list[str]]:
+    """
+    Reads the Rows of a plain or gzip CSV File.
+    :param path: File Path
+    :return: Rows
+    """
+
+    opener = gzip.open if path.endswith('.gz') else open
+    with opener(path, 'rt', newline='', encoding='utf-8') as input_file:
+        return list(csv.reader(input_file))
+
+
+def test_export(tmp_path, context):
+    """
+    Tests exporting Graphs to Node and Relationship Files.
+    """
+
+    with CsvExporter(str(tmp_path)) as exporter:
+        exporter.export(build_graph(1, context))
+        exporter.export(build_graph(2, context))
+
+    encounters = read_rows(str(tmp_path / 'EncounterNode-00000.csv'))
+    codes = read_rows(str(tmp_path / 'CodeNode-00000.csv'))
+    relationships = read_rows(str(tmp_path / 'relationships-00000.csv'))
+
+    assert_that(encounters[0][0]).is_equal_to('canonical_id:ID')
+    assert_that(encounters[0][-1]).is_equal_to(':LABEL')
+    assert_that(encounters).is_length(3)
+    assert_that(encounters[1]).contains('urn:test:encounter:1', '2020-05-13T00:00:00',
+                                        'EncounterNode')
+    assert_that(codes).is_length(3)
+    assert_that(codes[1]).contains('Code, "quoted"')
+    assert_that(relationships[0]).is_equal_to([':START_ID', ':END_ID', ':TYPE', 'meta'])
+    assert_that(relationships[2]).is_equal_to(['urn:test:encounter:2',
+                                               '2.16.840.1.113883.6.96:1', 'code',
+                                               '{"index": 2}'])
+
+
+def test_export_chunked(tmp_path, context):
+    """
+    Tests compressed, chunked export skipping duplicate Nodes and Relationships.
+    """
+
+    with CsvExporter(str(tmp_path), chunk_size=2, compress=True,
+                     skip_duplicates=True) as exporter:
+        for index in range(5):
+            exporter.export(build_graph(index, context))
+        exporter.export(build_graph(0, context))
+
+    encounter_files = exporter.writers['EncounterNode'].files
+
+    assert_that(encounter_files).is_length(3)
+    assert_that([len(read_rows(x)) for x in encounter_files]).is_equal_to([3, 3, 2])
+    assert_that(read_rows(str(tmp_path / 'CodeNode-00000.csv.gz'))).is_length(2)
+    assert_that(exporter.writers['relationships'].rows).is_equal_to(5)
+
+
+def test_export_unlabeled_duplicates(tmp_path, build_code_node):
+    """
+    Tests skipping duplicate Relationships of Vertices without Vertex Info.
+    """
+
+    with CsvExporter(str(tmp_path), skip_duplicates=True) as exporter:
+        for _ in range(2):
+            graph = NodeGraph()
+            graph.add_vertex(build_code_node('1'), build_code_node('2'), None)
+            exporter.export(graph)
+
+    relationships = read_rows(str(tmp_path / 'relationships-00000.csv'))
+
+    assert_that(relationships).is_length(2)
+    assert_that(relationships[1][:3]).is_equal_to(['2.16.840.1.113883.6.96:1',
+                                                   '2.16.840.1.113883.6.96:2',
+                                                   exporter.default_type])
@@ -0,0 +1,428 @@
+"""
+Tests for the Node Graph
+"""
+
+from assertpy import assert_that
+from src.graphs import NodeGraph, ConcurrentNodeGraph, LockStripes
+from src.indexes import RangeIndex
+from src.nodes import CodeNode, EncounterNode
+from datetime import datetime, timedelta, timezone
+import dataclasses
+import pytest
+import sys
+import threading
+
+
+def test_find_vertex_info(build_code_node):
+    """
+    Tests finding the Vertex Info for a relationship by Field Name.
+    """
+
+    graph = NodeGraph()
+    source = build_code_node('1')
+    destination = build_code_node('2')
+
+    graph.add_vertex(source, destination, 'translation')
+
+    result = graph.find_vertex_info(source, destination, 'translation')
+
+    assert_that(result).is_not_none()
+    assert_that(result).has_field_name('translation')
+    assert_that(graph.find_vertex_info(source, destination)).is_same_as(result)
+    assert_that(graph.find_vertex_info(source, destination, 'code')).is_none()
+    assert_that(graph.find_vertex_info(destination, source)).is_none()
+
+
+def test_multiple_vertex_info(build_code_node):
+    """
+    Tests multiple labeled relationships between the same Nodes are retained.
+    """
+
+    graph = NodeGraph()
+    source = build_code_node('1')
+    destination = build_code_node('2')
+
+    graph.add_vertex(source, destination, 'code')
+    graph.add_vertex(source, destination, 'translation')
+
+    result = graph.find_all_vertex_info(source, destination)
+
+    assert_that(graph.vertex_info).is_length(2)
+    assert_that([x.field_name for x in result]).is_equal_to(['code', 'translation'])
+    assert_that(graph.find_vertex_info(source, destination)).has_field_name('code')
+    assert_that(graph.find_vertex_info(source, destination, 'code')).has_field_name('code')
+
+    assert_that(graph.get_vertices(source)).is_equal_to({destination.canonical_id})
+    assert_that(graph.find_all_vertex_info(destination, source)).is_empty()
+
+    graph.remove_vertex(source, destination, 'code')
+    assert_that([x.field_name for x in graph.find_all_vertex_info(source, destination)]) \
+        .is_equal_to(['translation'])
+    graph.remove_vertex(source, destination)
+    assert_that(graph.pair_index).is_empty()
+
+
+def test_freeze(build_code_node):
+    """
+    Tests the Frozen Graph mirrors the adjacency and relationships of the Graph.
+    """
+
+    graph = NodeGraph()
+    first = build_code_node('1')
+    second = build_code_node('2')
+    third = build_code_node('3')
+
+    graph.add_vertex(first, second, 'translation')
+    graph.add_vertex(first, second, 'code')
+    graph.add_vertex(second, third, 'translation')
+
+    result = graph.freeze()
+
+    assert_that(result).is_length(3)
+    assert_that(result.get_node(first.canonical_id)).is_same_as(first)
+    assert_that(result.degree(second.canonical_id)).is_equal_to(2)
+    assert_that(result.get_vertices(second.canonical_id)).contains_only(
+        first.canonical_id, third.canonical_id)
+    assert_that(result.get_edges(first.canonical_id)).contains_only(
+        (second.canonical_id, 'translation'), (second.canonical_id, 'code'))
+    assert_that(result.get_edges(first.canonical_id, 'code')).is_equal_to(
+        [(second.canonical_id, 'code')])
+    assert_that(result.degree('chicken')).is_zero()
+
+
+def test_freeze_traverse(build_code_node):
+    """
+    Tests traversing the Frozen Graph by depth and Field Name.
+    """
+
+    graph = NodeGraph()
+    first = build_code_node('1')
+    second = build_code_node('2')
+    third = build_code_node('3')
+    fourth = build_code_node('4')
+
+    graph.add_vertex(first, second, 'translation')
+    graph.add_vertex(second, third, 'translation')
+    graph.add_vertex(third, fourth, 'code')
+
+    result = graph.freeze()
+
+    assert_that(list(result.traverse(first.canonical_id))).is_equal_to(
+        [(second.canonical_id, 1), (third.canonical_id, 2), (fourth.canonical_id, 3)])
+    assert_that(list(result.traverse(first.canonical_id, max_depth=1))).is_equal_to(
+        [(second.canonical_id, 1)])
+    assert_that([x for x, _ in result.traverse(first.canonical_id, field='translation')]) \
+        .is_equal_to([second.canonical_id, third.canonical_id])
+    assert_that(list(result.traverse(fourth.canonical_id, field='translation'))).is_empty()
+    assert_that(list(result.traverse('chicken'))).is_empty()
+
+
+def test_merge(context, build_code_node):
+    """
+    Tests merging Graphs shares Nodes by Canonical ID and unions the Vertices.
+    """
+
+    graph = NodeGraph()
+    other = NodeGraph()
+    first = build_code_node('1')
+    second = build_code_node('2')
+    third = build_code_node('3')
+
+    graph.add_vertex(first, second, 'translation')
+    other.add_vertex(dataclasses.replace(first, context=dataclasses.replace(context, doc_id=2)),
+                     third, 'translation')
+
+    result = graph.merge(other)
+
+    assert_that(result).has_nodes_added(1)
+    assert_that(result).has_nodes_shared(1)
+    assert_that(result).has_nodes_conflicted(0)
+    assert_that(result).has_vertex_info_added(1)
+    assert_that(graph.nodes[first.canonical_id]).is_same_as(first)
+    assert_that(graph.get_vertices(first)).contains_only(second.canonical_id, third.canonical_id)
+    assert_that(graph.find_vertex_info(first, third, 'translation')).is_not_none()
+    assert_that(other.get_vertices(first)).is_equal_to({third.canonical_id})
+
+
+def test_merge_conflict_policy(build_code_node):
+    """
+    Tests the conflict policies when Nodes with the same Canonical ID differ.
+    """
+
+    first = build_code_node('1')
+    changed = dataclasses.replace(first, display_name='Changed')
+
+    graph = NodeGraph()
+    graph.add_node(first)
+    other = NodeGraph()
+    other.add_node(changed)
+
+    assert_that(graph.merge(other)).has_nodes_conflicted(1)
+    assert_that(graph.nodes[first.canonical_id]).is_same_as(first)
+
+    graph.merge(other, 'replace')
+    assert_that(graph.nodes[first.canonical_id]).is_same_as(changed)
+
+    graph.add_node(first)
+    with pytest.raises(ValueError):
+        graph.merge(other, 'error')
+    with pytest.raises(ValueError):
+        graph.merge(other, 'chicken')
+
+
+def test_merge_graphs(build_code_node):
+    """
+    Tests merging many Graphs into a new Graph.
+    """
+
+    graphs = []
+    for index in range(3):
+        graph = NodeGraph()
+        graph.add_vertex(build_code_node('root'), build_code_node(str(index)), 'translation')
+        graphs.append(graph)
+
+    result, statistics = NodeGraph.merge_graphs(graphs)
+
+    assert_that(result.nodes).is_length(4)
+    assert_that(result.vertex_info).is_length(3)
+    assert_that(statistics).has_nodes_added(4)
+    assert_that(statistics).has_nodes_shared(2)
+
+
+def test_string_pool(build_code_node):
+    """
+    Tests the Graph shares one instance of each Canonical ID and field name.
+    """
+
+    graph = NodeGraph()
+    source = build_code_node('1')
+    destination = build_code_node('2')
+    copy = build_code_node('2')
+
+    graph.add_node(destination)
+    graph.add_vertex(source, copy, ''.join(['trans', 'lation']))
+    vertex_info = graph.find_vertex_info(source, destination, 'translation')
+
+    assert_that(copy.canonical_id).is_same_as(destination.canonical_id)
+    assert_that(vertex_info.destination_node).is_same_as(destination.canonical_id)
+    assert_that(next(iter(graph.vertices[source.canonical_id]))).is_same_as(
+        destination.canonical_id)
+    assert_that(graph.string_pool.memory_report()).has_duplicates(2)
+    assert_that(NodeGraph(string_pool=None).string_pool).is_none()
+
+
+def test_secondary_indexes(context, build_code_node):
+    """
+    Tests Nodes are found through the type, attribute and range Indexes.
+    """
+
+    graph = NodeGraph()
+    index = graph.add_index('CodeNode', 'code_system', 'code')
+    graph.add_node(build_code_node('1'))
+    graph.add_node(build_code_node('2'))
+    graph.add_node(build_code_node('1', '2.16.840.1.113883.6.1'))
+    encounters = [EncounterNode(context=context, canonical_id=f"encounter:{x}",
+                                status_code='completed',
+                                encounter_start=datetime(2024, 1, x, tzinfo=timezone.utc),
+                                encounter_end=None) for x in range(1, 6)]
+    for encounter in reversed(encounters):
+        graph.add_node(encounter)
+    graph.add_index('EncounterNode', 'encounter_start', ordered=True)
+
+    assert_that(graph.get_nodes_by_type('CodeNode')).is_length(3)
+    assert_that(graph.find_nodes('CodeNode', code='1', code_system='2.16.840.1.113883.6.96')) \
+        .extracting('canonical_id').is_equal_to(['2.16.840.1.113883.6.96:1'])
+    assert_that(graph.find_nodes('CodeNode', code='1')).is_length(2)
+    assert_that(graph.add_index('CodeNode', 'code_system', 'code')).is_same_as(index)
+    assert_that(graph.find_nodes_in_range('EncounterNode', 'encounter_start',
+                                          datetime(2024, 1, 2), datetime(2024, 1, 4))) \
+        .extracting('canonical_id').is_equal_to(['encounter:2', 'encounter:3'])
+
+    replacement = build_code_node('3')
+    replacement.canonical_id = '2.16.840.1.113883.6.96:1'
+    graph.add_node(replacement)
+
+    assert_that(graph.find_nodes('CodeNode', code_system='2.16.840.1.113883.6.96', code='1')) \
+        .is_empty()
+    assert_that(graph.find_nodes('CodeNode', code_system='2.16.840.1.113883.6.96', code='3')) \
+        .is_length(1)
+    assert_that(graph.get_nodes_by_type('CodeNode')).is_length(3)
+
+    rescheduled = dataclasses.replace(encounters[0], status_code='cancelled')
+    graph.add_node(rescheduled)
+    graph.add_node(dataclasses.replace(encounters[1], encounter_start=datetime(2024, 2, 1)))
+
+    assert_that(graph.find_nodes_in_range('EncounterNode', 'encounter_start')) \
+        .extracting('canonical_id').is_equal_to(['encounter:1', 'encounter:3', 'encounter:4',
+                                                 'encounter:5', 'encounter:2'])
+    assert_that(graph.find_nodes_in_range('EncounterNode', 'encounter_start')[0]) \
+        .is_same_as(rescheduled)
+
+    with pytest.raises(ValueError):
+        graph.find_nodes_in_range('EncounterNode', 'encounter_end')
+
+
+def test_range_index(context):
+    """
+    Tests the Range Index buffers, tombstones and replaces Nodes.
+    """
+
+    index = RangeIndex('EncounterNode', 'encounter_start')
+    encounters = [EncounterNode(context=context, canonical_id=f"encounter:{x}",
+                                status_code='completed',
+                                encounter_start=datetime(2023, 12, 31) + timedelta(days=x),
+                                encounter_end=None) for x in range(1, 41)]
+    for encounter in reversed(encounters):
+        index.add(encounter)
+    index.remove(encounters[0])
+
+    assert_that(index.find()).is_length(39)
+    assert_that(index.find()[0]).is_equal_to('encounter:2')
+
+    index.remove(encounters[1])
+    moved = dataclasses.replace(encounters[2], encounter_start=datetime(2024, 3, 1))
+    index.replace(encounters[2], moved)
+    index.replace(moved, dataclasses.replace(moved))
+
+    assert_that(index).is_length(38)
+    assert_that(index.find(datetime(2024, 1, 1), datetime(2024, 1, 6))) \
+        .is_equal_to(['encounter:4', 'encounter:5'])
+    assert_that(index.find(datetime(2024, 3, 1))).is_equal_to(['encounter:3'])
+
+    index.compact()
+    index.add(encounters[0])
+
+    assert_that(index).is_length(39)
+    assert_that(index.find(high=datetime(2024, 1, 5))).is_equal_to(['encounter:1',
+                                                                    'encounter:4'])
+    for encounter in encounters[3:]:
+        index.remove(encounter)
+    assert_that(index.find()).is_equal_to(['encounter:1', 'encounter:3'])
+
+
+def test_remove_node(build_code_node):
+    """
+    Tests removing Nodes and Vertices keeps every index consistent.
+    """
+
+    graph = NodeGraph()
+    graph.add_index('CodeNode', 'code')
+    first = build_code_node('1')
+    second = build_code_node('2')
+    third = build_code_node('3')
+    graph.add_vertex(first, second, 'translation')
+    graph.add_vertex(second, first, 'translation')
+    graph.add_vertex(first, third, 'translation')
+
+    assert_that(graph.remove_vertex(first, second, 'translation')).is_true()
+    assert_that(graph.get_vertices(first)).contains(second.canonical_id)
+    assert_that(graph.remove_vertex(first, second, 'translation')).is_false()
+    assert_that(graph.remove_vertex(second, first)).is_true()
+    assert_that(graph.get_vertices(first)).does_not_contain(second.canonical_id)
+    assert_that(graph.get_node_vertex_info(second)).is_empty()
+
+    assert_that(graph.remove_node(first)).is_true()
+    assert_that(graph.remove_node(first)).is_false()
+    assert_that(graph.nodes).does_not_contain_key(first.canonical_id)
+    assert_that(graph.get_vertices(third)).is_empty()
+    assert_that(graph.get_node_vertex_info(third)).is_empty()
+    assert_that(graph.vertex_info).is_empty()
+    assert_that(graph.edge_index).is_empty()
+    assert_that(graph.pair_index).is_empty()
+    assert_that(graph.find_nodes('CodeNode', code='1')).is_empty()
+    assert_that(graph.get_nodes_by_type('CodeNode')).is_length(2)
+
+
+def test_remove_nodes_and_compact(build_code_node):
+    """
+    Tests bulk removal only updates the surviving Nodes and compaction keeps the Graph intact.
+    """
+
+    graph = NodeGraph()
+    graph.add_index('CodeNode', 'code')
+    nodes = [build_code_node(str(x)) for x in range(10)]
+    for node in nodes[1:]:
+        graph.add_vertex(nodes[0], node, 'translation')
+        graph.add_vertex(node, nodes[0], None)
+    graph.add_vertex(nodes[1], nodes[2], 'translation')
+
+    assert_that(graph.remove_nodes(nodes[:5] + [build_code_node('chicken')])).is_equal_to(5)
+    graph.compact()
+
+    assert_that(sorted(graph.nodes)).is_equal_to(sorted(x.canonical_id for x in nodes[5:]))
+    assert_that(graph.vertices).is_empty()
+    assert_that(graph.vertex_info).is_empty()
+    assert_that(graph.node_vertex_info).is_empty()
+    assert_that(graph.edge_index).is_empty()
+    assert_that(graph.pair_index).is_empty()
+    assert_that(graph.find_nodes('CodeNode', code='0')).is_empty()
+    assert_that(graph.find_nodes('CodeNode', code='5')).is_length(1)
+    assert_that(graph.string_pool).does_not_contain(nodes[0].canonical_id)
+    assert_that(graph.string_pool).contains(nodes[5].canonical_id)
+
+    graph.add_vertex(nodes[5], nodes[6], 'translation')
+    assert_that(graph.find_vertex_info(nodes[5], nodes[6], 'translation')).is_not_none()
+
+
+def test_concurrent_graph(build_code_node):
+    """
+    Tests threads adding overlapping Nodes and Vertices build the same Graph as a single thread.
+    """
+
+    def add_section(graph: NodeGraph, section: int) -> None:
+        hub = build_code_node('hub')
+        for index in range(200):
+            node = build_code_node(f"{section}:{index}")
+            shared = build_code_node(str(index % 20))
+            graph.add_vertex(hub, node, 'component')
+            graph.add_vertex(node, shared, 'code')
+            graph.add_vertex(shared, node, None)
+
+    expected = NodeGraph()
+    for section in range(8):
+        add_section(expected, section)
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-5)
+    try:
+        graph = ConcurrentNodeGraph(stripes=4)
+        graph.add_index('CodeNode', 'code')
+        threads = [threading.Thread(target=add_section, args=(graph, x)) for x in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+
+    assert_that(set(graph.nodes)).is_equal_to(set(expected.nodes))
+    assert_that(graph.vertices).is_equal_to(expected.vertices)
+    assert_that(graph.node_vertex_info).is_equal_to(expected.node_vertex_info)
+    assert_that(set(graph.vertex_info)).is_equal_to(set(expected.vertex_info))
+    assert_that(set(graph.edge_index)).is_equal_to(set(expected.edge_index))
+    assert_that(graph.type_index).is_equal_to(expected.type_index)
+    assert_that(graph.find_nodes('CodeNode', code='hub')).is_length(1)
+    assert_that(graph.string_pool.memory_report()['lookups']).is_equal_to(
+        expected.string_pool.memory_report()['lookups'])
+
+    graph.add_node(build_code_node('hub'))
+    assert_that(graph.find_nodes('CodeNode', code='hub')).is_length(1)
+
+    assert_that(graph.remove_nodes(graph.get_nodes_by_type('CodeNode')[:100])).is_equal_to(100)
+    graph.compact()
+    assert_that(graph.nodes).is_length(len(expected.nodes) - 100)
+
+
+def test_lock_stripes():
+    """
+    Tests Lock stripes are acquired once and in order.
+    """
+
+    stripes = LockStripes(2)
+    held = stripes.hold('a', 'a', 'b', 'c')
+    assert_that(len(held.locks)).is_less_than_or_equal_to(2)
+    assert_that(held.locks).is_equal_to([x for x in stripes.locks if x in held.locks])
+    with held:
+        assert_that(all(x.locked() for x in held.locks)).is_true()
+    assert_that(any(x.locked() for x in stripes.locks)).is_false()
+    assert_that(LockStripes).raises(ValueError).when_called_with(0)
@@ -0,0 +1,39 @@
+"""
+Tests for the String Pool
+"""
+
+from assertpy import assert_that
+from src.interning import StringPool
+
+
+def test_intern():
+    """
+    Tests equal Strings share a single pooled instance.
+    """
+
+    pool = StringPool()
+    first = ''.join(['2.16.840.1.113883', '.6.96'])
+    second = ''.join(['2.16.840.1.113883.6', '.96'])
+
+    assert_that(pool.intern(first)).is_same_as(first)
+    assert_that(pool.intern(second)).is_same_as(first)
+    assert_that(pool.intern(None)).is_none()
+    assert_that(pool).is_length(1)
+    assert_that(pool).contains(second)
+
+
+def test_memory_report():
+    """
+    Tests the memory report counts the duplicates avoided.
+    """
+
+    pool = StringPool()
+    for _ in range(3):
+        pool.intern(''.join(['urn:oid:', '1.2.3']))
+
+    report = pool.memory_report()
+
+    assert_that(report).has_strings(1)
+    assert_that(report).has_lookups(3)
+    assert_that(report).has_duplicates(2)
+    assert_that(report['saved_bytes']).is_equal_to(report['pooled_bytes'] * 2)
@@ -0,0 +1,61 @@
+"""
+Tests for the Lazy Nodes
+"""
+
+import pickle
+from datetime import datetime
+
+from assertpy import assert_that
+from lxml import etree
+
+from src.factories import NodeFactory
+from src.graphs import same_content
+
+NAMESPACES = {'v3': 'urn:hl7-org:v3'}
+
+NAME = ('<name xmlns="urn:hl7-org:v3" use="L"><given>Jim</given><family>Doctor</family>'
+        '<validTime><low value="20170613"/></validTime></name>')
+
+CODE = ('<code xmlns="urn:hl7-org:v3" code="410429000" codeSystem="2.16.840.1.113883.6.96" '
+        'codeSystemName="SNOMED CT" displayName="Cardiac Arrest"/>')
+
+
+def test_lazy_name_node(context):
+    """
+    Tests Lazy Nodes read the fields outside their identity on first access.
+    """
+
+    element = etree.fromstring(NAME)
+    lazy = NodeFactory(NAMESPACES, context=context, lazy=True).build_name_node(element)
+    eager = NodeFactory(NAMESPACES, context=context).build_name_node(element)
+
+    assert_that(lazy).is_instance_of(type(eager))
+    assert_that(type(lazy).__name__).is_equal_to('NameNode')
+    assert_that(lazy).has_canonical_id(eager.canonical_id)
+    assert_that(lazy).has_given_name('Jim')
+    assert_that(lazy.element).is_same_as(element)
+    assert_that(lazy).has_valid_start_date(datetime(2017, 6, 13))
+    assert_that(same_content(lazy, eager)).is_true()
+
+    assert_that(lazy.load().element).is_none()
+    assert_that(lazy).has_valid_end_date(None)
+
+
+def test_lazy_code_node(context):
+    """
+    Tests Lazy Code Nodes are built without a Terminology Cache and pickle as regular Nodes.
+    """
+
+    element = etree.fromstring(CODE)
+    factory = NodeFactory(NAMESPACES, context=context, lazy=True, terminology_cache=None)
+
+    node = factory.build_code_node(element)
+    element.set('displayName', 'Changed')
+
+    assert_that(node).has_canonical_id('2.16.840.1.113883.6.96:410429000')
+    assert_that(node).has_display_name('Changed')
+
+    copy = pickle.loads(pickle.dumps(node))
+    assert_that(type(copy)).is_equal_to(type(node).node_class)
+    assert_that(copy).has_code_system_name('SNOMED CT')
+    assert_that(copy).has_display_name('Changed')
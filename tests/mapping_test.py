@@ -0,0 +1,158 @@
+"""
+Tests for the Declarative Section Mappings
+"""
+
+import copy
+from datetime import datetime
+
+from assertpy import assert_that
+from lxml import etree
+import pytest
+
+from src.factories import NodeFactory
+from src.mappings import SectionMapper, SectionMapping, NodeMapping, FieldMapping, EdgeMapping, \
+    ENCOUNTER_SECTION
+from src.nodes import DiagnosisNode
+
+TEST_FILE = './tests/test_files/test-ccda.xml'
+
+NAMESPACES = {
+    'v3': 'urn:hl7-org:v3',
+    'sdtc': 'urn:hl7-org:sdtc'
+}
+
+
+@pytest.fixture
+def document() -> etree.ElementBase:
+    """
+    Parses the sample Document.
+    :return: ClinicalDocument Element
+    """
+
+    return etree.parse(TEST_FILE).getroot()
+
+
+def get_related(graph, node, field: str) -> list:
+    """
+    Retrieves the Nodes related to a Node by a field.
+    :param graph: Node Graph
+    :param node: Source Node
+    :param field: Field Name
+    :return: List of Nodes
+    """
+
+    return [graph.nodes[graph.vertex_info[x].destination_node]
+            for x in graph.get_node_vertex_info(node)
+            if graph.vertex_info[x].source_node == node.canonical_id
+            and graph.vertex_info[x].field_name == field]
+
+
+def test_encounter_section(document, context):
+    """
+    Tests mapping the Encounter Section with the declarative Encounter Mapping.
+    """
+
+    factory = NodeFactory(NAMESPACES, context=context, terminology_cache=None)
+    graph = SectionMapper(NAMESPACES, [ENCOUNTER_SECTION])(document, factory)
+
+    encounters = [x for x in graph.nodes.values() if type(x).__name__ == 'EncounterNode']
+    assert_that(encounters).is_length(1)
+    encounter = encounters[0]
+    assert_that(encounter).has_status_code('completed')
+    assert_that(encounter).has_encounter_start(datetime(1965, 11, 15, 6, 22, 41))
+    assert_that(encounter).has_encounter_end(datetime(1965, 11, 15, 8, 7, 41))
+    assert_that(encounter.canonical_id).is_equal_to(factory.build_canonical_id(
+        'EncounterNode', 'urn:uuid:1133858d-9cac-436e-8fdb-292876ef1485:123455'))
+
+    code = get_related(graph, encounter, 'code')[0]
+    assert_that(code).has_canonical_id('2.16.840.1.113883.6.96:410429000')
+    assert_that(get_related(graph, code, 'translation')[0]).has_code('101')
+
+    performer = get_related(graph, encounter, 'performer')[0]
+    assert_that(performer).has_class_code('ASSIGNED')
+    assert_that(get_related(graph, performer, 'id')[0]).has_canonical_id(
+        'urn:oid:2.16.840.1.113883.4.6:999859598')
+    assert_that(get_related(graph, performer, 'code')).is_empty()
+    assert_that(get_related(graph, performer, 'addr')[0]).has_street_address_line(
+        '123 Main St\nSTE 200')
+    assert_that(get_related(graph, performer, 'telecom')).is_length(2)
+
+    person = get_related(graph, performer, 'assignedPerson')[0]
+    name = get_related(graph, person, 'name')[0]
+    assert_that(name).has_given_name('Jim E')
+    assert_that(name).has_family_name('Doctor')
+    assert_that(name).has_suffix('MD')
+
+    location = get_related(graph, encounter, 'location')[0]
+    assert_that(location).has_class_code('SDLOC')
+    assert_that(get_related(graph, location, 'addr')[0]).has_postal_code('15124')
+
+
+def test_section_mapping_configuration(document, context):
+    """
+    Tests adding a Section is configuration and mapping the same Document is deterministic.
+    """
+
+    problem_section = SectionMapping(
+        template_id='2.16.840.1.113883.10.20.22.2.22',
+        path='v3:encounter/v3:entryRelationship/v3:act/v3:entryRelationship/v3:observation',
+        node=NodeMapping(
+            node_class=DiagnosisNode,
+            fields={
+                'negation_indicator': FieldMapping(attribute='negationInd',
+                                                   convert=lambda x: x == 'true', default=False),
+                'status_code': FieldMapping(path='v3:statusCode', attribute='code'),
+                'effective_start_datetime': FieldMapping(path='v3:effectiveTime/v3:low',
+                                                         attribute='value', default=None),
+                'effective_end_datetime': FieldMapping(path='v3:effectiveTime/v3:high',
+                                                       attribute='value', default=None)
+            },
+            identity=('id',),
+            edges=(EdgeMapping(path='v3:id', field='id', builder='identifier'),
+                   EdgeMapping(path='v3:value', field='value', builder='code'))))
+    mapper = SectionMapper(NAMESPACES, [problem_section])
+
+    graph = mapper(document, NodeFactory(NAMESPACES, context=context))
+    other = mapper(document, NodeFactory(NAMESPACES, context=context))
+
+    diagnosis = [x for x in graph.nodes.values() if type(x).__name__ == 'DiagnosisNode'][0]
+    assert_that(diagnosis).has_status_code('completed')
+    assert_that(diagnosis).has_effective_start_datetime('20120312072241')
+    assert_that(get_related(graph, diagnosis, 'value')[0]).has_code('15748401000119109')
+    assert_that(sorted(graph.nodes)).is_equal_to(sorted(other.nodes))
+
+
+def test_unidentified_performers(document, context):
+    """
+    Tests Performers without Ids are told apart by position instead of their constant class code.
+    """
+
+    performer = document.find('.//v3:encounter/v3:performer', namespaces=NAMESPACES)
+    for id_element in performer.findall('./v3:assignedEntity/v3:id', namespaces=NAMESPACES):
+        id_element.getparent().remove(id_element)
+    performer.addnext(copy.deepcopy(performer))
+
+    factory = NodeFactory(NAMESPACES, context=context, terminology_cache=None)
+    graph = SectionMapper(NAMESPACES, [ENCOUNTER_SECTION])(document, factory)
+
+    encounter = [x for x in graph.nodes.values() if type(x).__name__ == 'EncounterNode'][0]
+    performers = get_related(graph, encounter, 'performer')
+    assert_that(performers).is_length(2)
+    assert_that({x.canonical_id for x in performers}).is_length(2)
+    assert_that(performers).extracting('class_code').contains_only('ASSIGNED')
+
+
+def test_invalid_mapping():
+    """
+    Tests invalid Mappings are rejected when compiled.
+    """
+
+    with pytest.raises(ValueError):
+        SectionMapper(NAMESPACES, [SectionMapping(
+            template_id='1', path='v3:observation',
+            node=NodeMapping(node_class=DiagnosisNode,
+                             edges=(EdgeMapping(path='v3:id', field='id', builder='chicken'),)))])
+
+    with pytest.raises(ValueError):
+        SectionMapper(NAMESPACES, [SectionMapping(
+            template_id='1', path='x:observation', node=NodeMapping(node_class=DiagnosisNode))])
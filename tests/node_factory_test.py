@@ -5,7 +5,8 @@ Tests for the Node Factory
 from lxml import etree
 from lxml.etree import ElementBase
 from assertpy import assert_that
-from src.factories import NodeFactory
+from src.factories import NodeFactory, ValueFactory, TerminologyCache
+from src.nodes import DocumentContext
 import pytest
 from datetime import datetime
 
@@ -66,7 +67,7 @@ def test_identifier_node_url(xml_file):
 
     elements_file: ElementBase = etree.fromstring(xml_file)
 
-    id_element = elements_file.find('./v3:id', namespaces=NAMESPACES)
+    id_element = elements_file.find('./v3:webId', namespaces=NAMESPACES)
     factory = NodeFactory(NAMESPACES, **BASE_PROPERTIES)
 
     result = factory.build_identifier_node(id_element)
@@ -94,7 +95,205 @@ def test_identifier_node_none(xml_file):
 
 def test_contact_node(xml_file):
     """
-    Tests creating a
+    Tests creating a Contact Node.
     :param xml_file:
     :return:
-    """
\ No newline at end of file
+    """
+
+    elements_file: ElementBase = etree.fromstring(xml_file)
+    telecom_element = elements_file.find('./v3:telecom', namespaces=NAMESPACES)
+    factory = NodeFactory(NAMESPACES, **BASE_PROPERTIES)
+
+    result = factory.build_contact_node(telecom_element)
+
+    assert_that(result).has_use('WP')
+    assert_that(result).has_value('tel:+1-555-555-5555')
+    assert_that(result).has_canonical_id(
+        NodeFactory.build_canonical_id('ContactNode', 'tel:+1-555-555-5555'))
+
+
+def test_address_node(xml_file):
+    """
+    Tests creating an Address Node.
+    """
+
+    elements_file: ElementBase = etree.fromstring(xml_file)
+    addr_element = elements_file.find('./v3:addr', namespaces=NAMESPACES)
+    factory = NodeFactory(NAMESPACES, **BASE_PROPERTIES)
+
+    result = factory.build_address_node(addr_element)
+
+    assert_that(result).has_use('WP')
+    assert_that(result).has_street_address_line('123 Main St\nSTE 200')
+    assert_that(result).has_city('Anywhere')
+    assert_that(result).has_state('PA')
+    assert_that(result).has_postal_code('15123')
+    assert_that(result.canonical_id).is_equal_to(
+        factory.build_address_node(addr_element).canonical_id)
+    assert_that(factory.build_address_node(etree.fromstring(
+        '<addr xmlns="urn:hl7-org:v3" use="HP"><streetAddressLine nullFlavor="UNK"/>'
+        '<county>Allegheny</county></addr>'))).is_none()
+
+
+def test_name_node():
+    """
+    Tests creating Name Nodes for Person and Organization Names.
+    """
+
+    factory = NodeFactory(NAMESPACES, **BASE_PROPERTIES)
+    name_element = etree.fromstring(
+        '<name xmlns="urn:hl7-org:v3" use="L"><given>Jim</given><given>E</given>'
+        '<family>Doctor</family><suffix>MD</suffix>'
+        '<validTime><low value="20170613"/></validTime></name>')
+
+    result = factory.build_name_node(name_element)
+
+    assert_that(result).has_type_code('L')
+    assert_that(result).has_given_name('Jim E')
+    assert_that(result).has_family_name('Doctor')
+    assert_that(result).has_suffix('MD')
+    assert_that(result).has_valid_start_date(datetime(2017, 6, 13))
+    assert_that(result).has_valid_end_date(None)
+    assert_that(factory.build_name_node(etree.fromstring(
+        '<name xmlns="urn:hl7-org:v3">PGH HOSPITAL</name>'))).has_family_name('PGH HOSPITAL')
+
+
+def test_xpath_cache(xml_file):
+    """
+    Tests compiled XPath expressions are reused across lookups.
+    """
+
+    elements_file: ElementBase = etree.fromstring(xml_file)
+    factory = NodeFactory(NAMESPACES, **BASE_PROPERTIES)
+
+    first = factory.find(elements_file, './v3:addr/v3:city')
+    second = factory.find(elements_file, './v3:addr/v3:city')
+
+    assert_that(first.text).is_equal_to('Anywhere')
+    assert_that(second).is_same_as(first)
+    assert_that(factory.xpath_misses + factory.xpath_hits).is_equal_to(2)
+    assert_that(factory.xpath_hits).is_greater_than_or_equal_to(1)
+
+    other = ValueFactory(NAMESPACES)
+    assert_that(other.get_xpath('./v3:addr/v3:city')).is_same_as(
+        factory.get_xpath('./v3:addr/v3:city'))
+    assert_that(other.xpath_misses).is_equal_to(0)
+    assert_that(other.xpath_hits).is_equal_to(1)
+    assert_that(other.xpath_cache).is_same_as(factory.xpath_cache)
+
+
+def test_xpath_cache_findall(xml_file):
+    """
+    Tests finding all matching Elements with Clark Notation and Prefixed Paths.
+    """
+
+    elements_file: ElementBase = etree.fromstring(xml_file)
+    factory = ValueFactory(NAMESPACES)
+
+    result = factory.findall(elements_file, './v3:addr/v3:streetAddressLine')
+    clark_result = factory.findall(elements_file, '{urn:hl7-org:v3}addr/{urn:hl7-org:v3}city')
+
+    assert_that([x.text for x in result]).is_equal_to(['123 Main St', 'STE 200'])
+    assert_that(clark_result).is_length(1)
+    assert_that(factory.find(elements_file, './v3:chicken')).is_none()
+    assert_that(factory.findall(None, './v3:addr')).is_empty()
+    assert_that(factory.xpath_misses + factory.xpath_hits).is_equal_to(3)
+
+
+def test_document_context():
+    """
+    Tests the Factory shares a single Document Context.
+    """
+
+    factory = NodeFactory(NAMESPACES, **BASE_PROPERTIES)
+
+    assert_that(factory.context).has_etl_load_datetime(datetime(2024, 1, 22, 0, 0, 0))
+    assert_that(factory).has_doc_id(1)
+    assert_that(factory).has_doc_source_id('test')
+    assert_that(factory).has_etl_dg_code(20)
+    assert_that(factory).has_etl_src_sys_id(10)
+
+    context = DocumentContext(**BASE_PROPERTIES)
+    assert_that(NodeFactory(NAMESPACES, context=context).context).is_same_as(context)
+
+
+def test_canonical_id():
+    """
+    Tests Canonical IDs are stable for normalized identifying values.
+    """
+
+    result = NodeFactory.build_canonical_id('AddressNode', '123 Main  St', 'Anywhere', None)
+
+    assert_that(result).starts_with('urn:uuid:')
+    assert_that(result).is_length(45)
+    assert_that(result).is_equal_to(
+        NodeFactory.build_canonical_id('AddressNode', ' 123 main st', 'ANYWHERE', ''))
+    assert_that(result).is_not_equal_to(
+        NodeFactory.build_canonical_id('NameNode', '123 Main St', 'Anywhere', None))
+    assert_that(result).is_not_equal_to(
+        NodeFactory.build_canonical_id('AddressNode', '123 Main St', 'Anywhere'))
+    assert_that(NodeFactory.build_canonical_id('EncounterNode', datetime(2024, 1, 22))) \
+        .is_equal_to(NodeFactory.build_canonical_id('EncounterNode', '2024-01-22T00:00:00'))
+
+    with pytest.raises(ValueError):
+        NodeFactory.build_canonical_id('AddressNode', None, '', '  ')
+
+
+def test_code_node(xml_file):
+    """
+    Tests creating Code Nodes for a nullFlavor Code and its Translations.
+    """
+
+    elements_file: ElementBase = etree.fromstring(xml_file)
+    code_element = elements_file.find('./v3:code', namespaces=NAMESPACES)
+    factory = NodeFactory(NAMESPACES, terminology_cache=None, **BASE_PROPERTIES)
+
+    translations = factory.build_code_translations(code_element)
+
+    assert_that(factory.build_code_node(code_element)).is_none()
+    assert_that(factory.build_code_node(None)).is_none()
+    assert_that(translations).is_length(1)
+    assert_that(translations[0]).has_canonical_id('1.2.840.114350.1.72.1.7.7.10.688867.4160:5')
+    assert_that(translations[0]).has_code_system_name('Epic.DXC.StandardProviderSpecialtyType')
+    assert_that(translations[0]).has_display_name('Anesthesiology')
+
+
+def test_terminology_cache():
+    """
+    Tests repeated Codes share Code Node attributes through the LRU Terminology Cache.
+    """
+
+    cache = TerminologyCache(maxsize=2)
+    first = NodeFactory(NAMESPACES, terminology_cache=cache, **BASE_PROPERTIES)
+    second = NodeFactory(NAMESPACES, terminology_cache=cache,
+                         **{**BASE_PROPERTIES, 'doc_id': 2})
+    codes = [etree.fromstring(
+        f'<code xmlns="urn:hl7-org:v3" code="{x}" codeSystem="2.16.840.1.113883.6.1" '
+        f'displayName="Code {x}"><translation code="T{x}" codeSystem="1.2.3"/></code>')
+        for x in range(3)]
+    other_translation = etree.fromstring(
+        '<code xmlns="urn:hl7-org:v3" code="0" codeSystem="2.16.840.1.113883.6.1">'
+        '<translation code="X0" codeSystem="1.2.3"/></code>')
+
+    node = first.build_code_node(codes[0])
+    shared = second.build_code_node(codes[0])
+
+    assert_that(node).has_canonical_id('2.16.840.1.113883.6.1:0')
+    assert_that(node).has_display_name('Code 0')
+    assert_that(first.build_code_node(codes[0])).is_same_as(node)
+    assert_that(shared).is_not_same_as(node).has_display_name('Code 0')
+    assert_that(shared.context).has_doc_id(2)
+    assert_that(node.context).has_doc_id(1)
+    assert_that(cache.hits).is_equal_to(1)
+    assert_that(cache.misses).is_equal_to(1)
+    assert_that(cache.hit_rate).is_equal_to(0.5)
+    assert_that(second.build_code_translations(codes[0])).extracting('code') \
+        .is_equal_to(['T0'])
+    assert_that(second.build_code_translations(other_translation)).extracting('code') \
+        .is_equal_to(['X0'])
+
+    first.build_code_node(codes[1])
+    first.build_code_node(codes[2])
+
+    assert_that(cache).is_length(2)
+    assert_that(cache.get(('code', '2.16.840.1.113883.6.1', '0'))).is_none()
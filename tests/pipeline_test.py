@@ -0,0 +1,163 @@
+"""
+Tests for the Asyncio Ingestion Pipeline
+"""
+
+import asyncio
+import time
+
+from lxml.etree import ElementBase
+from assertpy import assert_that
+from src.pipeline import IngestPipeline
+from src.graphs import NodeGraph
+from src.nodes import IdentifierNode
+import pytest
+
+TEST_FILE = './tests/test_files/test-elements.xml'
+
+NAMESPACES = {
+    'v3': 'urn:hl7-org:v3',
+    'voc': 'urn:hl7-org:v3/voc',
+    'sdtc': 'urn:hl7-org:sdtc',
+    'xsi': 'http://www.w3.org/2001/XMLSchema-instance'
+}
+
+
+@pytest.fixture
+def xml_file() -> bytes:
+    """
+    Loads the Bytes from the XML File.
+    :return: Bytes
+    """
+
+    with open(TEST_FILE, 'rb') as input_file:
+        return input_file.read()
+
+
+def map_document(document: ElementBase, factory) -> NodeGraph:
+    """
+    Maps the Document Id, sleeping longer for earlier Documents to shuffle completion order.
+    :param document: ClinicalDocument Element
+    :param factory: Node Factory
+    :return: Node Graph
+    """
+
+    time.sleep(0.01 * (5 - factory.doc_id % 5))
+    id_element = document.find('./v3:id', namespaces=NAMESPACES)
+    graph = NodeGraph()
+    graph.add_node(IdentifierNode(context=factory.context,
+                                  canonical_id=f"urn:test:{factory.doc_id}",
+                                  root=id_element.get('root', ''),
+                                  extension=id_element.get('extension', ''),
+                                  assign_authority=''))
+    return graph
+
+
+def map_slow_first_document(document: ElementBase, factory) -> NodeGraph:
+    """
+    Maps a Document, the first one slowly.
+    :param document: ClinicalDocument Element
+    :param factory: Node Factory
+    :return: Node Graph
+    """
+
+    if factory.doc_id == 0:
+        time.sleep(0.2)
+    return NodeGraph()
+
+
+def fail_document(document: ElementBase, factory) -> NodeGraph:
+    """
+    Fails mapping the third Document.
+    """
+
+    if factory.doc_id == 3:
+        raise ValueError('Unable to map')
+    return NodeGraph()
+
+
+class MemorySource:
+    """
+    In memory Source tracking how far ahead of the Sink it has been read.
+    """
+
+    def __init__(self, data: bytes, count: int) -> None:
+        self.data = data
+        self.count = count
+        self.read = 0
+
+    async def __aiter__(self):
+        for doc_id in range(self.count):
+            self.read += 1
+            yield doc_id, self.data
+
+
+def test_pipeline_order(xml_file):
+    """
+    Tests the Graphs are delivered to the Sink in Source order.
+    """
+
+    results = []
+
+    async def sink(doc_id: int, graph: NodeGraph) -> None:
+        results.append((doc_id, list(graph.nodes)))
+
+    pipeline = IngestPipeline(NAMESPACES, map_document, map_concurrency=4, queue_size=2)
+    delivered = asyncio.run(pipeline.run(MemorySource(xml_file, 10), sink))
+
+    assert_that(delivered).is_equal_to(10)
+    assert_that(results).is_equal_to([(x, [f"urn:test:{x}"]) for x in range(10)])
+
+
+def test_pipeline_backpressure(xml_file):
+    """
+    Tests a slow Sink holds back the Source.
+    """
+
+    source = MemorySource(xml_file, 40)
+    ahead = []
+
+    async def sink(doc_id: int, _: NodeGraph) -> None:
+        ahead.append(source.read - doc_id)
+        await asyncio.sleep(0.001)
+
+    pipeline = IngestPipeline(NAMESPACES, lambda document, factory: NodeGraph(),
+                              preserve_order=False, queue_size=2)
+    asyncio.run(pipeline.run(source, sink))
+
+    assert_that(max(ahead)).is_less_than(15)
+
+
+def test_pipeline_ordered_backpressure(xml_file):
+    """
+    Tests a slow Document bounds how far the Source is read ahead when preserving order.
+    """
+
+    source = MemorySource(xml_file, 300)
+    ahead = []
+
+    async def sink(doc_id: int, _: NodeGraph) -> None:
+        ahead.append(source.read - doc_id)
+
+    pipeline = IngestPipeline(NAMESPACES, map_slow_first_document, queue_size=2)
+    delivered = asyncio.run(pipeline.run(source, sink))
+
+    assert_that(delivered).is_equal_to(300)
+    assert_that(max(ahead)).is_less_than_or_equal_to(5)
+
+
+def test_pipeline_failure(xml_file):
+    """
+    Tests a failing stage cancels the Pipeline and raises the error.
+    """
+
+    results = []
+
+    async def sink(doc_id: int, _: NodeGraph) -> None:
+        results.append(doc_id)
+
+    pipeline = IngestPipeline(NAMESPACES, fail_document, map_concurrency=1)
+
+    with pytest.raises(ValueError):
+        asyncio.run(pipeline.run(MemorySource(xml_file, 100), sink))
+    assert_that(results).does_not_contain(3)
+    assert_that(len(results)).is_less_than(100)
@@ -0,0 +1,90 @@
+"""
+Tests for the Graph Queries
+"""
+
+from assertpy import assert_that
+from lxml import etree
+import pytest
+
+from src.factories import NodeFactory
+from src.graphs import NodeGraph
+from src.mappings import SectionMapper, ENCOUNTER_SECTION
+from src.queries import GraphQuery, PathPattern
+
+TEST_FILE = './tests/test_files/test-ccda.xml'
+
+NAMESPACES = {'v3': 'urn:hl7-org:v3'}
+
+
+@pytest.fixture
+def graph(context) -> NodeGraph:
+    """
+    Maps the Encounters of the sample Document.
+    :return: Node Graph
+    """
+
+    document = etree.parse(TEST_FILE).getroot()
+    return SectionMapper(NAMESPACES, [ENCOUNTER_SECTION])(
+        document, NodeFactory(NAMESPACES, context=context))
+
+
+def test_match_path(graph):
+    """
+    Tests matching typed Path Patterns.
+    """
+
+    query = GraphQuery(graph)
+
+    paths = list(query.match('EncounterNode -performer-> GeneralEntityNode -addr-> AddressNode'))
+    reverse = list(query.match('AddressNode <-addr- GeneralEntityNode <-*- EncounterNode'))
+
+    assert_that(paths).is_length(1)
+    assert_that(type(paths[0][0]).__name__).is_equal_to('EncounterNode')
+    assert_that(paths[0][2]).has_street_address_line('123 Main St\nSTE 200')
+    assert_that(reverse).is_length(2)
+    assert_that(list(query.match('EncounterNode -chicken-> *'))).is_empty()
+    assert_that(list(query.match('* -telecom-> ContactNode', start=paths[0][1]))).is_length(2)
+
+
+def test_neighborhood(graph):
+    """
+    Tests k-hop neighborhoods with field and type filters and early termination.
+    """
+
+    query = GraphQuery(graph)
+    encounter = graph.get_nodes_by_type('EncounterNode')[0]
+
+    one_hop = list(query.neighborhood(encounter.canonical_id, 1, direction='out'))
+    names = list(query.neighborhood(encounter.canonical_id, node_types=['NameNode']))
+    performers = list(query.neighborhood(encounter.canonical_id, 3,
+                                         fields=['performer', 'assignedPerson', 'name'],
+                                         direction='out'))
+
+    assert_that(one_hop).is_length(4)
+    assert_that({x for _, x in one_hop}).is_equal_to({1})
+    assert_that(names).is_length(1)
+    assert_that(names[0][1]).is_equal_to(3)
+    assert_that([type(x).__name__ for x, _ in performers]).is_equal_to(
+        ['GeneralEntityNode', 'BaseNode', 'NameNode'])
+
+    iterator = query.neighborhood(encounter.canonical_id)
+    next(iterator)
+    iterator.close()
+    assert_that(query._visited_pool).is_length(1)
+    assert_that(query._visited_pool[0]).is_empty()
+
+
+def test_invalid_pattern():
+    """
+    Tests invalid Path Patterns are rejected.
+    """
+
+    for pattern in ['', 'EncounterNode -performer->', 'EncounterNode <-performer-> BaseNode',
+                    'EncounterNode performer BaseNode']:
+        with pytest.raises(ValueError):
+            PathPattern.parse(pattern)
+
+    with pytest.raises(ValueError):
+        next(GraphQuery(NodeGraph()).neighbors('x', direction='up'))
+
+    assert_that(list(GraphQuery(NodeGraph()).neighborhood('x'))).is_empty()
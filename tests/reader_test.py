@@ -0,0 +1,155 @@
+"""
+Tests for the Streaming Document Reader
+"""
+
+from lxml import etree
+from lxml.etree import ElementBase
+from assertpy import assert_that
+from src.readers import DocumentReader, SectionIndex
+from src.graphs import NodeGraph
+from src.nodes import IdentifierNode, DocumentContext
+from datetime import datetime
+
+TEST_FILE = './tests/test_files/test-ccda.xml'
+
+ENCOUNTER_SECTION = '2.16.840.1.113883.10.20.22.2.22'
+PROBLEM_SECTION = '2.16.840.1.113883.10.20.22.2.5.1'
+
+NAMESPACES = {
+    'v3': 'urn:hl7-org:v3',
+    'voc': 'urn:hl7-org:v3/voc',
+    'sdtc': 'urn:hl7-org:sdtc',
+    'xsi': 'http://www.w3.org/2001/XMLSchema-instance'
+}
+
+
+def build_id_graph(entries: list[ElementBase]) -> NodeGraph:
+    """
+    Builds a Graph of the Identifiers found within the Entries.
+    :param entries: Entry Elements
+    :return: Node Graph
+    """
+
+    graph = NodeGraph()
+    context = DocumentContext(doc_id=1, doc_source_id='test', etl_dg_code=0,
+                              etl_load_datetime=datetime(2024, 1, 22),
+                              etl_src_inc_datetime=datetime(2024, 1, 22), etl_src_sys_id=1)
+    for entry in entries:
+        for id_element in entry.iterfind('.//v3:id', namespaces=NAMESPACES):
+            graph.add_node(IdentifierNode(
+                context=context,
+                canonical_id=f"{id_element.get('root', '')}:{id_element.get('extension', '')}",
+                root=id_element.get('root', ''), extension=id_element.get('extension', ''),
+                assign_authority=id_element.get('assigningAuthorityName', '')))
+    return graph
+
+
+def test_iter_sections():
+    """
+    Tests the streamed Sections match the Sections of the full Document Tree.
+    """
+
+    document = etree.parse(TEST_FILE).getroot()
+    expected = [etree.tostring(x) for x in document.findall(
+        './v3:component/v3:structuredBody/v3:component/v3:section', namespaces=NAMESPACES)]
+
+    reader = DocumentReader(NAMESPACES)
+    result = [etree.tostring(x) for x in reader.iter_sections(TEST_FILE)]
+
+    assert_that(result).is_length(11)
+    assert_that(result).is_equal_to(expected)
+
+
+def test_iter_sections_template_filter():
+    """
+    Tests limiting the streamed Sections by Template ID.
+    """
+
+    reader = DocumentReader(NAMESPACES)
+    result = [x.findtext('./v3:title', namespaces=NAMESPACES)
+              for x in reader.iter_sections(TEST_FILE, {ENCOUNTER_SECTION, PROBLEM_SECTION})]
+
+    assert_that(result).is_equal_to(['Problems', 'Encounters'])
+
+
+def test_iter_sections_releases_previous():
+    """
+    Tests processed Sections are cleared from the Document Tree.
+    """
+
+    reader = DocumentReader(NAMESPACES)
+    for section in reader.iter_sections(TEST_FILE):
+        previous = section.getparent().getprevious()
+        if previous is not None:
+            assert_that(previous.getprevious()).is_none()
+            assert_that(len(previous[0])).is_zero()
+        root = section.getroottree().getroot()
+        assert_that(root.find('./v3:id', namespaces=NAMESPACES)).is_not_none()
+
+
+def test_iter_entries():
+    """
+    Tests the streamed Entries build the same Graph as the full Document Tree.
+    """
+
+    document = etree.parse(TEST_FILE).getroot()
+    expected = build_id_graph(document.findall(
+        './v3:component/v3:structuredBody/v3:component/v3:section/v3:entry',
+        namespaces=NAMESPACES))
+
+    reader = DocumentReader(NAMESPACES)
+    entries = []
+    for entry in reader.iter_entries(TEST_FILE):
+        entries.append(etree.fromstring(etree.tostring(entry)))
+        previous = entry.getprevious()
+        if previous.tag == entry.tag:
+            assert_that(len(previous)).is_zero()
+            assert_that(previous.getprevious().tag).is_not_equal_to(entry.tag)
+
+    result = build_id_graph(entries)
+
+    assert_that(entries).is_length(55)
+    assert_that(result.nodes.keys()).is_equal_to(expected.nodes.keys())
+
+
+def test_iter_entries_template_filter():
+    """
+    Tests limiting the streamed Entries by Template ID.
+    """
+
+    reader = DocumentReader(NAMESPACES)
+    result = list(reader.iter_entries(TEST_FILE, {ENCOUNTER_SECTION}))
+
+    assert_that(result).is_length(1)
+
+
+def test_section_index():
+    """
+    Tests retrieving Sections from the Section Index.
+    """
+
+    document = etree.parse(TEST_FILE).getroot()
+    index = SectionIndex(NAMESPACES, document)
+
+    result = index.get_section(ENCOUNTER_SECTION)
+
+    assert_that(index.sections).is_length(11)
+    assert_that(result).is_not_none()
+    assert_that(result.findtext('./v3:title', namespaces=NAMESPACES)).is_equal_to('Encounters')
+    assert_that(index.get_section(ENCOUNTER_SECTION, '2015-08-01')).is_same_as(result)
+    assert_that(index.get_section(ENCOUNTER_SECTION, '2014-06-09')).is_none()
+    assert_that(index.get_section('chicken')).is_none()
+
+
+def test_section_index_entries():
+    """
+    Tests the Entry Counts and Entries of the Section Index.
+    """
+
+    document = etree.parse(TEST_FILE).getroot()
+    index = SectionIndex(NAMESPACES, document)
+
+    assert_that(index.get_entry_count(PROBLEM_SECTION)).is_equal_to(10)
+    assert_that(index.get_entries(PROBLEM_SECTION)).is_length(10)
+    assert_that(index.get_entry_count('chicken')).is_zero()
+    assert_that(index.get_entries('chicken')).is_empty()
@@ -0,0 +1,101 @@
+"""
+Tests for the Binary Graph Serialization
+"""
+
+import dataclasses
+from datetime import datetime, timezone
+
+from assertpy import assert_that
+from src.graphs import NodeGraph
+from src.nodes import CodeNode, EncounterNode, NameNode, DiagnosisNode
+from src.serializers import GraphWriter, GraphReader
+from src.vertices import VertexInfo
+import pytest
+
+
+@pytest.fixture
+def graph(context) -> NodeGraph:
+    """
+    Creates a Graph with Nodes of several Classes.
+    :return: Node Graph
+    """
+
+    encounter = EncounterNode(context=context, canonical_id='urn:test:encounter',
+                              status_code='completed',
+                              encounter_start=datetime(2020, 5, 13, 8, 1, 37, tzinfo=timezone.utc),
+                              encounter_end=datetime(2020, 5, 13, 9, 1, 37))
+    code = CodeNode(context=context, canonical_id='2.16.840.1.113883.6.96:1', code='1',
+                    code_system='2.16.840.1.113883.6.96', code_system_name='SNOMED CT',
+                    code_system_version='', display_name='Ünïcode')
+    name = NameNode(context=dataclasses.replace(context, doc_id=2), canonical_id='urn:test:name',
+                    type_code='L', family_name='Smith', given_name='John', prefix='',
+                    suffix='', valid_start_date=None, valid_end_date=None)
+    diagnosis = DiagnosisNode(context=context, canonical_id='urn:test:diagnosis',
+                              negation_indicator=True, status_code='active',
+                              effective_start_datetime=datetime(2020, 5, 13),
+                              effective_end_datetime=datetime(2020, 5, 14))
+
+    result = NodeGraph()
+    result.add_vertex(encounter, code, 'code')
+    result.add_vertex(encounter, code, 'translation')
+    result.add_vertex_with_info(encounter, diagnosis,
+                                VertexInfo(encounter, diagnosis, 'entryRelationship',
+                                           meta={'typeCode': 'SUBJ'}))
+    result.add_vertex(encounter, name, None)
+    return result
+
+
+def test_round_trip(graph, tmp_path):
+    """
+    Tests a Graph read back from a File matches the written Graph.
+    """
+
+    path = str(tmp_path / 'graph.bin')
+    GraphWriter().write(graph, path)
+
+    with GraphReader(path) as reader:
+        result = reader.to_graph()
+
+    assert_that(result.nodes.keys()).is_equal_to(set(graph.nodes.keys()))
+    for canonical_id, node in graph.nodes.items():
+        assert_that(type(result.nodes[canonical_id]).__name__).is_equal_to(type(node).__name__)
+        assert_that(dataclasses.asdict(result.nodes[canonical_id])).is_equal_to(
+            dataclasses.asdict(node))
+    assert_that(result.vertices).is_equal_to(graph.vertices)
+    assert_that(result.vertex_info.keys()).is_equal_to(graph.vertex_info.keys())
+    assert_that(result.find_vertex_info(graph.nodes['urn:test:encounter'],
+                                        graph.nodes['urn:test:diagnosis'])) \
+        .has_meta({'typeCode': 'SUBJ'})
+
+
+def test_lazy_node(graph, tmp_path):
+    """
+    Tests Nodes are decoded on access and share their Document Context.
+    """
+
+    path = str(tmp_path / 'graph.bin')
+    GraphWriter().write(graph, path)
+
+    with GraphReader(path) as reader:
+        code = reader.get_node('2.16.840.1.113883.6.96:1')
+        encounter = reader.get_node('urn:test:encounter')
+
+        assert_that(reader).is_length(4)
+        assert_that(code).has_display_name('Ünïcode')
+        assert_that(reader.get_node('2.16.840.1.113883.6.96:1')).is_same_as(code)
+        assert_that(encounter.context).is_same_as(code.context)
+        assert_that(encounter.encounter_start.tzinfo).is_equal_to(timezone.utc)
+        assert_that(reader.get_node('urn:test:name')).has_doc_id(2)
+        assert_that(reader.get_node('chicken')).is_none()
+
+
+def test_invalid_file(tmp_path):
+    """
+    Tests opening a File that is not a Graph.
+    """
+
+    path = tmp_path / 'graph.bin'
+    path.write_bytes(b'chicken' * 20)
+
+    with pytest.raises(ValueError):
+        GraphReader(str(path))
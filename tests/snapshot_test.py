@@ -0,0 +1,70 @@
+"""
+Tests for the Copy on Write Snapshots of Node Graphs
+"""
+
+from assertpy import assert_that
+
+from src.diffs import diff_graphs
+from src.graphs import NodeGraph
+from src.queries import GraphQuery
+from src.snapshots import CopyOnWriteDict, VersionedNodeGraph
+
+
+def test_copy_on_write_dict():
+    """
+    Tests Snapshots keep their items while the Dictionary grows, shrinks and updates sets.
+    """
+
+    items = CopyOnWriteDict(copy_values=True)
+    for index in range(100):
+        items[index] = {index}
+    snapshot = items.snapshot()
+
+    for index in range(100, 5000):
+        items[index] = {index}
+    items[0].add('changed')
+    items.setdefault(1, set()).add('changed')
+    del items[2]
+    items.pop(3)
+
+    assert_that(snapshot).is_length(100)
+    assert_that(dict(snapshot)).is_equal_to({x: {x} for x in range(100)})
+    assert_that(items).is_length(4998)
+    assert_that(items[0]).is_equal_to({0, 'changed'})
+    assert_that(items[1]).is_equal_to({1, 'changed'})
+    assert_that(items).does_not_contain_key(2, 3)
+    assert_that(items.snapshot()[4999]).is_equal_to({4999})
+
+
+def test_graph_snapshot(build_code_node):
+    """
+    Tests a Graph Snapshot stays consistent while the Graph is written and answers queries.
+    """
+
+    graph = VersionedNodeGraph()
+    nodes = [build_code_node(str(x)) for x in range(50)]
+    for node in nodes[1:]:
+        graph.add_vertex(nodes[0], node, 'translation')
+    expected = NodeGraph()
+    expected.merge(graph)
+
+    snapshot = graph.snapshot()
+    graph.remove_node(nodes[1])
+    graph.add_vertex(nodes[2], nodes[3], 'translation')
+    graph.add_vertex(nodes[2], build_code_node('new'), None)
+    graph.compact()
+    later = graph.snapshot()
+
+    assert_that(snapshot.version).is_equal_to(1)
+    assert_that(later.version).is_equal_to(2)
+    assert_that(len(diff_graphs(expected, snapshot))).is_equal_to(0)
+    assert_that(snapshot.get_vertices(nodes[2])).is_equal_to({nodes[0].canonical_id})
+    assert_that(snapshot.find_vertex_info(nodes[0], nodes[1], 'translation')).is_not_none()
+    assert_that(snapshot.find_nodes('CodeNode', code='1')).is_length(1)
+    assert_that(list(GraphQuery(snapshot).match('CodeNode -translation-> CodeNode'))).is_length(49)
+
+    changes = diff_graphs(snapshot, later)
+    assert_that(changes.removed_nodes).is_equal_to([nodes[1].canonical_id])
+    assert_that(changes.added_edges).is_length(1)
+    assert_that(changes.added_vertices).is_length(1)
+    assert_that(later.freeze()).is_length(len(graph.nodes))
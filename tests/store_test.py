@@ -0,0 +1,158 @@
+"""
+Tests for the SQLite Graph Store
+"""
+
+import dataclasses
+from datetime import datetime
+
+from assertpy import assert_that
+from lxml import etree
+import pytest
+from src.factories import NodeFactory
+from src.graphs import NodeGraph
+from src.mappings import SectionMapper, ENCOUNTER_SECTION
+from src.nodes import CodeNode, EncounterNode
+from src.stores import SqliteNodeGraph
+from src.vertices import VertexInfo
+
+
+@pytest.fixture
+def encounter(context) -> EncounterNode:
+    """
+    Creates an Encounter Node.
+    :return: Encounter Node
+    """
+
+    return EncounterNode(context=context, canonical_id='urn:test:encounter',
+                         status_code='completed', encounter_start=datetime(2020, 5, 13, 8, 1, 37),
+                         encounter_end=datetime(2020, 5, 13, 9, 1, 37))
+
+
+@pytest.fixture
+def code(context) -> CodeNode:
+    """
+    Creates a Code Node.
+    :return: Code Node
+    """
+
+    return CodeNode(context=context, canonical_id='2.16.840.1.113883.6.96:1', code='1',
+                    code_system='2.16.840.1.113883.6.96', code_system_name='SNOMED CT',
+                    code_system_version='', display_name='Code')
+
+
+def test_store_nodes(tmp_path, encounter, code):
+    """
+    Tests Nodes are persisted and upserted on Canonical ID.
+    """
+
+    path = str(tmp_path / 'graph.db')
+    with SqliteNodeGraph(path, batch_size=2) as graph:
+        graph.add_node(encounter)
+        graph.add_node(code)
+        graph.add_node(dataclasses.replace(code, display_name='Updated'))
+
+    with SqliteNodeGraph(path) as graph:
+        stored_encounter = graph.get_node(encounter.canonical_id)
+        stored_code = graph.get_node(code.canonical_id)
+
+        assert_that(dataclasses.asdict(stored_encounter)).is_equal_to(
+            dataclasses.asdict(encounter))
+        assert_that(stored_code).has_display_name('Updated')
+        assert_that(stored_code.context).is_same_as(stored_encounter.context)
+        assert_that(graph.get_node('chicken')).is_none()
+
+
+def test_store_vertices(tmp_path, encounter, code):
+    """
+    Tests Vertices and Vertex Info lookups.
+    """
+
+    with SqliteNodeGraph(str(tmp_path / 'graph.db')) as graph:
+        graph.add_vertex(encounter, code, 'code')
+        graph.add_vertex_with_info(encounter, code, VertexInfo(encounter, code, 'translation',
+                                                               meta={'index': 1}))
+
+        assert_that(graph.get_vertices(encounter)).is_equal_to({code.canonical_id})
+        assert_that(graph.get_vertices(code)).is_equal_to({encounter.canonical_id})
+        assert_that(graph.get_node_vertex_info(code)).is_length(2)
+        assert_that(graph.find_vertex_info(encounter, code, 'translation')).has_meta({'index': 1})
+        assert_that(graph.find_vertex_info(encounter, code, 'chicken')).is_none()
+        assert_that(graph.find_vertex_info(code, encounter)).is_none()
+        assert_that([x.field_name for x in graph.find_all_vertex_info(encounter, code)]) \
+            .contains_only('code', 'translation')
+
+        vertex_id = graph.find_vertex_info(encounter, code, 'code').vertx_id
+        assert_that(graph.get_vertex_info(vertex_id)).has_field_name('code')
+        assert_that(graph.get_node(code.canonical_id)).is_not_none()
+
+
+def test_store_graph_views(tmp_path, encounter, code):
+    """
+    Tests the read-only NodeGraph views, removals, merges and indexes of the Store.
+    """
+
+    other = NodeGraph()
+    other.add_vertex(encounter, code, 'code')
+    other.add_vertex(code, dataclasses.replace(code, canonical_id='urn:test:code', code='2'),
+                     None)
+
+    with SqliteNodeGraph(str(tmp_path / 'graph.db')) as graph:
+        statistics = graph.merge(other)
+        assert_that(statistics).has_nodes_added(3).has_vertices_added(4) \
+            .has_vertex_info_added(1)
+        assert_that(graph.merge(other)).has_nodes_shared(3).has_vertices_added(0)
+
+        vertex_info = other.find_vertex_info(encounter, code, 'code')
+        assert_that(dict(graph.nodes)).is_length(3).contains_key(encounter.canonical_id)
+        assert_that(dict(graph.vertices)).is_equal_to(other.vertices)
+        assert_that(dict(graph.node_vertex_info)).is_equal_to(other.node_vertex_info)
+        assert_that(list(graph.vertex_info)).is_equal_to([vertex_info.vertx_id])
+        assert_that(graph.edge_index[(encounter.canonical_id, code.canonical_id, 'code')]) \
+            .has_vertx_id(vertex_info.vertx_id)
+        assert_that(graph.pair_index[(encounter.canonical_id, code.canonical_id)]) \
+            .contains_only('code')
+        assert_that(graph.nodes.get('chicken')).is_none()
+        assert_that(graph.vertices).does_not_contain_key('chicken')
+
+        graph.add_index('CodeNode', 'code_system', 'code')
+        graph.add_index('EncounterNode', 'encounter_start', ordered=True)
+        assert_that(graph.find_nodes('CodeNode', code_system=code.code_system, code='2')) \
+            .extracting('canonical_id').is_equal_to(['urn:test:code'])
+        assert_that(graph.get_nodes_by_type('CodeNode')).is_length(2)
+        assert_that(graph.find_nodes_in_range('EncounterNode', 'encounter_start',
+                                              datetime(2020, 5, 13))).is_length(1)
+        assert_that(graph.find_nodes_in_range('EncounterNode', 'encounter_start',
+                                              high=datetime(2020, 5, 13))).is_empty()
+        with pytest.raises(ValueError):
+            graph.add_index('CodeNode', 'code_system', 'code', ordered=True)
+
+        assert_that(graph.remove_vertex(encounter, code, 'chicken')).is_false()
+        assert_that(graph.remove_vertex(encounter, code, 'code')).is_true()
+        assert_that(graph.get_vertices(encounter)).is_empty()
+        assert_that(graph.remove_node(code)).is_true()
+        assert_that(graph.remove_node(code)).is_false()
+        assert_that(dict(graph.vertices)).is_empty()
+        assert_that(graph.nodes).is_length(2)
+
+
+def test_store_section_mapper(tmp_path, context):
+    """
+    Tests mapping a Document into the Store matches the in-memory Graph.
+    """
+
+    document = etree.parse('./tests/test_files/test-ccda.xml').getroot()
+    namespaces = {'v3': 'urn:hl7-org:v3', 'sdtc': 'urn:hl7-org:sdtc'}
+    mapper = SectionMapper(namespaces, [ENCOUNTER_SECTION])
+    expected = mapper.map(document, NodeFactory(namespaces, context=context))
+
+    with SqliteNodeGraph(str(tmp_path / 'graph.db')) as graph:
+        assert_that(mapper.map(document, NodeFactory(namespaces, context=context),
+                               graph=graph)).is_same_as(graph)
+
+        assert_that(sorted(graph.nodes)).is_equal_to(sorted(expected.nodes))
+        assert_that(dict(graph.vertices)).is_equal_to(expected.vertices)
+        assert_that(dict(graph.node_vertex_info)).is_equal_to(expected.node_vertex_info)
+        assert_that(sorted(graph.edge_index)).is_equal_to(sorted(expected.edge_index))
+        for canonical_id, node in expected.nodes.items():
+            assert_that(dataclasses.asdict(graph.nodes[canonical_id])) \
+                .is_equal_to(dataclasses.asdict(node))
@@ -0,0 +1,112 @@
+"""
+Tests for the Value Factory and Timestamp Parsing
+"""
+
+from datetime import datetime, timedelta, timezone
+
+from lxml import etree
+from lxml.etree import ElementBase
+from assertpy import assert_that
+from src.factories import ValueFactory
+from src.timestamps import parse_timestamp, parse_duration
+import pytest
+
+TEST_FILE = './tests/test_files/test-elements.xml'
+
+NAMESPACES = {
+    'v3': 'urn:hl7-org:v3',
+    'voc': 'urn:hl7-org:v3/voc',
+    'sdtc': 'urn:hl7-org:sdtc',
+    'xsi': 'http://www.w3.org/2001/XMLSchema-instance'
+}
+
+EASTERN = timezone(timedelta(hours=-4))
+
+
+@pytest.fixture
+def xml_file() -> bytes:
+    """
+    Loads the Bytes from the XML File.
+    :return: Bytes
+    """
+
+    with open(TEST_FILE, 'rb') as input_file:
+        return input_file.read()
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('2020', datetime(2020, 1, 1)),
+    ('202005', datetime(2020, 5, 1)),
+    ('20200513', datetime(2020, 5, 13)),
+    ('2020051308', datetime(2020, 5, 13, 8)),
+    ('202005130801', datetime(2020, 5, 13, 8, 1)),
+    ('20200513080137', datetime(2020, 5, 13, 8, 1, 37)),
+    ('20200513080137.25', datetime(2020, 5, 13, 8, 1, 37, 250000)),
+    ('20200513080137-0400', datetime(2020, 5, 13, 8, 1, 37, tzinfo=EASTERN)),
+    ('20200513080137.1234+0530', datetime(2020, 5, 13, 8, 1, 37, 123400,
+                                          tzinfo=timezone(timedelta(hours=5, minutes=30)))),
+    ('20200513-0400', datetime(2020, 5, 13, tzinfo=EASTERN)),
+    ('', None),
+    (None, None),
+    ('2020-05-13', None),
+    ('20201313', None),
+    ('20200101+9900', None)
+])
+def test_parse_timestamp(value, expected):
+    """
+    Tests parsing TS values of varying precision.
+    """
+
+    assert_that(parse_timestamp(value)).is_equal_to(expected)
+
+
+def test_parse_duration():
+    """
+    Tests parsing PQ time values.
+    """
+
+    assert_that(parse_duration('3', 'd')).is_equal_to(timedelta(days=3))
+    assert_that(parse_duration('1.5', 'h')).is_equal_to(timedelta(minutes=90))
+    assert_that(parse_duration('2', 'mo')).is_none()
+    assert_that(parse_duration(None, 'd')).is_none()
+
+
+def test_effective_time(xml_file):
+    """
+    Tests creating the Effective Time of an IVL_TS element.
+    """
+
+    elements_file: ElementBase = etree.fromstring(xml_file)
+    factory = ValueFactory(NAMESPACES)
+
+    result = factory.build_effective_time(
+        elements_file.find('./v3:effectiveTime', namespaces=NAMESPACES))
+
+    assert_that(result).is_not_none()
+    assert_that(result['low']).is_equal_to(datetime(2020, 5, 13, 8, 1, 37, tzinfo=EASTERN))
+    assert_that(result['high']).is_equal_to(datetime(2020, 5, 13, 9, 1, 37, tzinfo=EASTERN))
+    assert_that(result['value']).is_none()
+    assert_that(result['center']).is_none()
+    assert_that(result['width']).is_none()
+    assert_that(result['null_flavor']).is_none()
+
+
+def test_effective_time_null_flavor():
+    """
+    Tests Effective Times with a value, width and null flavors.
+    """
+
+    factory = ValueFactory(NAMESPACES)
+    element = etree.fromstring(
+        '<effectiveTime xmlns="urn:hl7-org:v3"><low value="20200513"/><high nullFlavor="UNK"/>'
+        '<width value="2" unit="wk"/></effectiveTime>')
+
+    result = factory.build_effective_time(element)
+
+    assert_that(result['low']).is_equal_to(datetime(2020, 5, 13))
+    assert_that(result['high']).is_none()
+    assert_that(result['width']).is_equal_to(timedelta(weeks=2))
+    assert_that(factory.build_effective_time(
+        etree.fromstring('<effectiveTime xmlns="urn:hl7-org:v3" nullFlavor="NI"/>'))) \
+        .contains_entry({'null_flavor': 'NI'})
+    assert_that(factory.build_effective_time(None)).is_none()